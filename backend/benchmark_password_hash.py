@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Optional
+from config.password_hash_config import PASSWORD_HASH_CONFIG
+from util.helper.string import HashWorkerPool, StringHashFactory
+
+async def hash_rate(pool: HashWorkerPool, hashes: int) -> float:
+    """Hash concurrently through the pool and return the hashes per second"""
+
+    salt = pool.create_salt()
+    start = time.perf_counter()
+    await asyncio.gather(*(pool.hash(string = "benchmark password", salt = salt) for _ in range(hashes)))
+    return hashes / (time.perf_counter() - start)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Report the hashes per second of the password hasher for a range of worker counts"""
+
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description = "Benchmark the password hasher.")
+    parser.add_argument("--algorithm", default = PASSWORD_HASH_CONFIG.algorithm)
+    parser.add_argument("--hashes", type = int, default = 100, help = "hashes per worker count")
+    parser.add_argument("--workers", type = int, nargs = "+", default = sorted({1, cpu_count, PASSWORD_HASH_CONFIG.workers}))
+    args = parser.parse_args(argv)
+
+    hasher = StringHashFactory().get_hasher(args.algorithm)
+    print(f"{args.algorithm} on {cpu_count} cores")
+    for workers in args.workers:
+        rate = asyncio.run(hash_rate(HashWorkerPool(hasher, workers), args.hashes))
+        print(f"{workers:>4} workers {rate:10.1f} hashes/s {rate / min(workers, cpu_count):10.1f} hashes/s per core")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -14,6 +14,8 @@ class __AuthTokensConfig:
         self.__refresh_token_expiry = int(os.getenv("REFRESH_TOKEN_EXPIRY", 60 * 60 * 24 * 15))
         self.__access_token_expiry = int(os.getenv("ACCESS_TOKEN_EXPIRY", 60 * 15))
         self.__algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+        self.__token_cache_size = int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+        self.__token_cache_ttl = float(os.getenv("TOKEN_CACHE_TTL", 60 * 5))
 
     @property
     def secret_key(self) -> str:
@@ -31,4 +33,12 @@ class __AuthTokensConfig:
     def algorithm(self) -> str:
         return self.__algorithm
 
+    @property
+    def token_cache_size(self) -> int:
+        return self.__token_cache_size
+
+    @property
+    def token_cache_ttl(self) -> float:
+        return self.__token_cache_ttl
+
 AUTH_TOKENS_CONFIG: Final = __AuthTokensConfig()
\ No newline at end of file
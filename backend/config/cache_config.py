@@ -0,0 +1,47 @@
+try:
+    from dotenv import load_dotenv
+
+    load_dotenv("../.env.dev")
+except ImportError:
+    pass
+
+import os
+from typing import Final, Literal, cast
+
+class __CacheConfig:
+    def __init__(self) -> None:
+        self.__membership_cache_backend = os.getenv("MEMBERSHIP_CACHE_BACKEND", "memory")
+        self.__membership_cache_size = int(os.getenv("MEMBERSHIP_CACHE_SIZE", 10000))
+        # a leave or invite only invalidates the memory cache of the process handling it,
+        # every other process keeps serving reads from its entry for up to the ttl
+        self.__membership_cache_ttl = float(os.getenv("MEMBERSHIP_CACHE_TTL", 5))
+        self.__redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        # bounds the memory of the response body cache of each process
+        self.__response_cache_max_bytes = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+        self.__response_cache_max_body_size = int(os.getenv("RESPONSE_CACHE_MAX_BODY_SIZE", 256 * 1024))
+
+    @property
+    def membership_cache_backend(self) -> Literal["memory", "redis"]:
+        return cast(Literal["memory", "redis"], self.__membership_cache_backend)
+
+    @property
+    def membership_cache_size(self) -> int:
+        return self.__membership_cache_size
+
+    @property
+    def membership_cache_ttl(self) -> float:
+        return self.__membership_cache_ttl
+
+    @property
+    def redis_url(self) -> str:
+        return self.__redis_url
+
+    @property
+    def response_cache_max_bytes(self) -> int:
+        return self.__response_cache_max_bytes
+
+    @property
+    def response_cache_max_body_size(self) -> int:
+        return self.__response_cache_max_body_size
+
+CACHE_CONFIG: Final = __CacheConfig()
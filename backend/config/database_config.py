@@ -16,6 +16,12 @@ class __DatabaseConfig:
         self.__user = os.getenv("DATABASE_USER", "postgres")
         self.__password = os.getenv("DATABASE_PASSWORD", "postgres")
         self.__database = os.getenv("DATABASE_NAME", "postgres")
+        self.__pool_size = int(os.getenv("DATABASE_POOL_SIZE", 5))
+        self.__max_overflow = int(os.getenv("DATABASE_MAX_OVERFLOW", 10))
+        self.__pool_timeout = float(os.getenv("DATABASE_POOL_TIMEOUT", 30))
+        self.__pool_pre_ping = os.getenv("DATABASE_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+        self.__pool_recycle = int(os.getenv("DATABASE_POOL_RECYCLE", -1))
+        self.__statement_timeout = int(os.getenv("DATABASE_STATEMENT_TIMEOUT", 0))
 
     @property
     def host(self) -> str:
@@ -37,5 +43,32 @@ class __DatabaseConfig:
     def database(self) -> str:
         return self.__database
 
+    @property
+    def pool_size(self) -> int:
+        return self.__pool_size
+
+    @property
+    def max_overflow(self) -> int:
+        return self.__max_overflow
+
+    @property
+    def pool_timeout(self) -> float:
+        """Seconds to wait for a pooled connection before giving up."""
+        return self.__pool_timeout
+
+    @property
+    def pool_pre_ping(self) -> bool:
+        return self.__pool_pre_ping
+
+    @property
+    def pool_recycle(self) -> int:
+        """Seconds after which a pooled connection is replaced, -1 to disable."""
+        return self.__pool_recycle
+
+    @property
+    def statement_timeout(self) -> int:
+        """Server side statement timeout in milliseconds, 0 to disable."""
+        return self.__statement_timeout
+
 
 DATABASE_CONFIG: Final = __DatabaseConfig()
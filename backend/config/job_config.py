@@ -0,0 +1,39 @@
+try:
+    from dotenv import load_dotenv
+
+    load_dotenv("../.env.dev")
+except ImportError:
+    pass
+
+import os
+from typing import Final
+
+class __JobConfig:
+    def __init__(self) -> None:
+        self.__worker_count = int(os.getenv("JOB_WORKER_COUNT", 2))
+        self.__poll_interval = float(os.getenv("JOB_POLL_INTERVAL", 1))
+        self.__max_attempts = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+        self.__retry_delay = float(os.getenv("JOB_RETRY_DELAY", 5))
+        self.__lease = float(os.getenv("JOB_LEASE", 60))
+
+    @property
+    def worker_count(self) -> int:
+        return self.__worker_count
+
+    @property
+    def poll_interval(self) -> float:
+        return self.__poll_interval
+
+    @property
+    def max_attempts(self) -> int:
+        return self.__max_attempts
+
+    @property
+    def retry_delay(self) -> float:
+        return self.__retry_delay
+
+    @property
+    def lease(self) -> float:
+        return self.__lease
+
+JOB_CONFIG: Final = __JobConfig()
\ No newline at end of file
@@ -0,0 +1,39 @@
+try:
+    from dotenv import load_dotenv
+
+    load_dotenv("../.env.dev")
+except ImportError:
+    pass
+
+import os
+from typing import Final
+
+class __PasswordHashConfig:
+    def __init__(self) -> None:
+        self.__algorithm = os.getenv("PASSWORD_HASH_ALGORITHM", "scrypt")
+        self.__scrypt_n = int(os.getenv("PASSWORD_HASH_SCRYPT_N", 2 ** 14))
+        self.__scrypt_r = int(os.getenv("PASSWORD_HASH_SCRYPT_R", 8))
+        self.__scrypt_p = int(os.getenv("PASSWORD_HASH_SCRYPT_P", 1))
+        self.__workers = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+
+    @property
+    def algorithm(self) -> str:
+        return self.__algorithm
+
+    @property
+    def scrypt_n(self) -> int:
+        return self.__scrypt_n
+
+    @property
+    def scrypt_r(self) -> int:
+        return self.__scrypt_r
+
+    @property
+    def scrypt_p(self) -> int:
+        return self.__scrypt_p
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+PASSWORD_HASH_CONFIG: Final = __PasswordHashConfig()
\ No newline at end of file
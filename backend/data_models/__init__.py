@@ -1,2 +1,2 @@
-from .connection import Base, Engine, DatabaseConnection
-from .models import WorkSpaceAccountLink, Account, Login, WorkSpace, TodoList, Todo
\ No newline at end of file
+from .connection import Base, Engine, AsyncEngine, DatabaseConnection, AsyncDatabaseConnection
+from .models import WorkSpaceAccountLink, Account, Login, WorkSpace, TodoList, Todo, TodoTombstone, Job
\ No newline at end of file
@@ -0,0 +1,130 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Tuple
+from sqlalchemy import DateTime, delete, insert, literal, select # type: ignore
+from sqlalchemy.engine import Row # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession # type: ignore
+from util.exceptions import InvalidCursorError
+from .keyset_pagination import KeysetPaginator
+from .models import Todo, TodoTombstone
+from .projections import TODO_COLUMNS
+
+async def delete_todos(session: AsyncSession, condition: Any) -> int:
+    """Delete the todos matching a condition and leave a tombstone for each of them in a single statement.
+
+    Every delete of todos has to go through here, the change feed only learns
+    about deleted todos from their tombstones. Returns the number of deleted todos.
+    """
+
+    deleted_todos = (
+        delete(Todo)
+            .where(condition)
+            .returning(Todo.todo_id, Todo.todolist_id, Todo.workspace_id)
+            .cte("deleted_todos")
+    )
+    result = await session.execute(
+        insert(TodoTombstone).from_select(
+            ["todo_id", "todolist_id", "workspace_id", "deleted_at"],
+            select(
+                deleted_todos.c.todo_id,
+                deleted_todos.c.todolist_id,
+                deleted_todos.c.workspace_id,
+                literal(datetime.now(), DateTime),
+            ),
+        )
+    )
+    return result.rowcount
+
+class TodoChanges(NamedTuple):
+    todos: List[Row]
+    deleted_todos: List[Row]
+    next_cursor: str
+    has_more: bool
+
+class TodoChangeFeed:
+    """Pages through the todos of a workspace modified and deleted after a cursor.
+
+    Modified todos are read by ``(last_modified, todo_id)`` and tombstones by
+    ``(deleted_at, todo_id)``, each from its own ``(workspace_id, ...)`` index.
+    The cursor holds the position in both, so a client keeps the returned
+    cursor even when nothing has changed and passes it to the next sync.
+    Without a cursor every todo is returned while the tombstones start at the
+    latest one, deletes before a first sync are of no interest to the client.
+    """
+
+    def __init__(self, workspace_id: int, limit: int) -> None:
+        self.__workspace_id = workspace_id
+        self.__todos = KeysetPaginator(Todo.todo_id, Todo.last_modified, "asc", limit)
+        self.__tombstones = KeysetPaginator(TodoTombstone.todo_id, TodoTombstone.deleted_at, "asc", limit)
+
+    @staticmethod
+    def __encode_cursor(todo_cursor: Optional[str], tombstone_cursor: Optional[str]) -> str:
+        payload = {"todos": todo_cursor, "deleted_todos": tombstone_cursor}
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+    @staticmethod
+    def __decode_cursor(cursor: str) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            todo_cursor, tombstone_cursor = payload["todos"], payload["deleted_todos"]
+        except (binascii.Error, json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError):
+            raise InvalidCursorError("Invalid cursor.")
+        if not all(part is None or isinstance(part, str) for part in (todo_cursor, tombstone_cursor)):
+            raise InvalidCursorError("Invalid cursor.")
+        return todo_cursor, tombstone_cursor
+
+    async def __latest_tombstone_cursor(self, session: AsyncSession) -> Optional[str]:
+        latest = (await session.execute(
+            select(TodoTombstone.todo_id, TodoTombstone.deleted_at)
+                .filter(TodoTombstone.workspace_id == self.__workspace_id)
+                .order_by(TodoTombstone.deleted_at.desc(), TodoTombstone.todo_id.desc())
+                .limit(1)
+        )).first()
+        return None if latest is None else self.__tombstones.encode_cursor(latest.deleted_at, latest.todo_id)
+
+    @staticmethod
+    async def __read_page(
+        session: AsyncSession,
+        paginator: KeysetPaginator,
+        query: Any,
+        cursor: Optional[str],
+        sort_key: str,
+    ) -> Tuple[List[Row], Optional[str], bool]:
+        page, next_cursor = paginator.split_page((await session.execute(paginator.paginate(query, cursor))).all())
+        if next_cursor is not None:
+            return page, next_cursor, True
+        if page:
+            return page, paginator.encode_cursor(getattr(page[-1], sort_key), page[-1].todo_id), False
+        return page, cursor, False
+
+    async def read(self, session: AsyncSession, since: Optional[str] = None) -> TodoChanges:
+        """Read the next page of changes after a cursor"""
+
+        if since is None:
+            todo_cursor, tombstone_cursor = None, await self.__latest_tombstone_cursor(session)
+        else:
+            todo_cursor, tombstone_cursor = self.__decode_cursor(since)
+
+        todos, todo_cursor, more_todos = await self.__read_page(
+            session,
+            self.__todos,
+            select(*TODO_COLUMNS).filter(Todo.workspace_id == self.__workspace_id),
+            todo_cursor,
+            "last_modified",
+        )
+        deleted_todos, tombstone_cursor, more_tombstones = await self.__read_page(
+            session,
+            self.__tombstones,
+            select(TodoTombstone.todo_id, TodoTombstone.todolist_id, TodoTombstone.deleted_at)
+                .filter(TodoTombstone.workspace_id == self.__workspace_id),
+            tombstone_cursor,
+            "deleted_at",
+        )
+        return TodoChanges(
+            todos,
+            deleted_todos,
+            self.__encode_cursor(todo_cursor, tombstone_cursor),
+            more_todos or more_tombstones,
+        )
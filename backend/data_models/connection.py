@@ -1,8 +1,11 @@
 from types import TracebackType
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from config.database_config import DATABASE_CONFIG
+from .pool import InstrumentedAsyncQueuePool
+from .statement_metrics import instrument_statements
 from typing import Final, Optional, Type, final
 
 DB_CONN_URL = "postgresql://{}:{}@{}:{}/{}".format(
@@ -13,10 +16,39 @@ DB_CONN_URL = "postgresql://{}:{}@{}:{}/{}".format(
     DATABASE_CONFIG.database
 )
 
+ASYNC_DB_CONN_URL = "postgresql+asyncpg://{}:{}@{}:{}/{}".format(
+    DATABASE_CONFIG.user,
+    DATABASE_CONFIG.password,
+    DATABASE_CONFIG.host,
+    DATABASE_CONFIG.port,
+    DATABASE_CONFIG.database
+)
+
+# The synchronous engine is kept for schema management and scripts,
+# request handlers go through the asyncio engine below.
 Engine = create_engine(DB_CONN_URL)
 
+AsyncEngine = create_async_engine(
+    ASYNC_DB_CONN_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=DATABASE_CONFIG.pool_size,
+    max_overflow=DATABASE_CONFIG.max_overflow,
+    pool_timeout=DATABASE_CONFIG.pool_timeout,
+    pool_pre_ping=DATABASE_CONFIG.pool_pre_ping,
+    pool_recycle=DATABASE_CONFIG.pool_recycle,
+    connect_args=(
+        {"server_settings": {"statement_timeout": str(DATABASE_CONFIG.statement_timeout)}}
+        if DATABASE_CONFIG.statement_timeout > 0 else {}
+    ),
+)
+
+instrument_statements(Engine)
+instrument_statements(AsyncEngine.sync_engine)
+
 SessionLocal: Final = sessionmaker(autocommit=False, autoflush=True, bind=Engine, expire_on_commit=False)
 
+AsyncSessionLocal: Final = sessionmaker(autocommit=False, autoflush=True, bind=AsyncEngine, class_=AsyncSession, expire_on_commit=False)
+
 Base: Final = declarative_base()
 
 @final
@@ -28,10 +60,27 @@ class DatabaseConnection:
         return self.__session
 
     def __exit__(
-        self, 
+        self,
         exc_type: Optional[Type[BaseException]],
-        exc_val: Optional[BaseException], 
+        exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType]
     ) -> bool:
         self.__session.close()
+        return exc_type is None
+
+@final
+class AsyncDatabaseConnection:
+    def __init__(self) -> None:
+        self.__session = AsyncSessionLocal()
+
+    async def __aenter__(self) -> AsyncSession:
+        return self.__session
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> bool:
+        await self.__session.close()
         return exc_type is None
\ No newline at end of file
@@ -1,2 +1,4 @@
 from .interface import FilterHandler
-from .factory import FilterHandlerFactory
\ No newline at end of file
+from .factory import FilterHandlerFactory
+from .filter_pattern_match import FILTER_SPEC_REGEX
+from .filter_group import parse_filter_group
\ No newline at end of file
@@ -0,0 +1,20 @@
+import json
+import re
+from typing import Dict, List
+from util.exceptions import InvalidFilterError
+from .filter_pattern_match import FILTER_SPEC_REGEX
+
+def parse_filter_group(string: str) -> Dict[str, List[str]]:
+    """Parse a group of filters given as a JSON object of fields and their filter specifications"""
+
+    try:
+        group = json.loads(string)
+    except json.JSONDecodeError:
+        raise InvalidFilterError(f'Invalid filter group "{string}".')
+
+    if not isinstance(group, dict) or not all(
+        isinstance(filter_strs, list) and all(isinstance(filter_str, str) and re.match(FILTER_SPEC_REGEX, filter_str) for filter_str in filter_strs)
+        for filter_strs in group.values()
+    ):
+        raise InvalidFilterError(f'Invalid filter group "{string}".')
+    return group
\ No newline at end of file
@@ -1,23 +1,30 @@
-import re 
-from typing import Optional
+import re
+from typing import Final, Pattern, Tuple
+
+COMPARISON_OPERATORS: Final = ("eq", "gt", "lt", "ge", "le", "ne")
+
+# substring and prefix matches on text fields, served by the trigram indexes
+MATCH_OPERATORS: Final = ("like", "ilike", "prefix")
+
+# membership in a comma separated list of values, a literal comma is escaped with a backslash
+SET_OPERATORS: Final = ("in", "nin")
+
+FILTER_OPERATORS: Final = COMPARISON_OPERATORS + MATCH_OPERATORS + SET_OPERATORS
+
+FILTER_SPEC_REGEX: Final = r"^\[({})\].*$".format("|".join(FILTER_OPERATORS))
 
 class FilterPatternMatch:
-    __PATTERN = r"^\[(eq|gt|lt|ge|le|ne)\](.*)$"
+    __PATTERN: Final[Pattern[str]] = re.compile(r"^\[({})\](.*)$".format("|".join(FILTER_OPERATORS)), re.DOTALL)
 
     def __init__(self, string: str) -> None:
         self.__string = string
     
-    def __call__(self) -> None:
-        match = re.search(self.__PATTERN, self.__string)
+    def __call__(self) -> Tuple[str, str]:
+        """Split the filter specification into its operator and value"""
+
+        match = self.__PATTERN.match(self.__string)
 
         if match is None:
             raise ValueError("Invalid filter pattern")
-        
-        self.__operator = match.group(1)
-        self.__value = match.group(2)
-    
-    def get_operator(self) -> Optional[str]:
-        return self.__operator
-    
-    def get_value(self) -> str:
-        return self.__value
\ No newline at end of file
+
+        return match.group(1), match.group(2)
\ No newline at end of file
@@ -1,15 +1,28 @@
-from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional
-from sqlalchemy.orm import Query # type: ignore
+from typing import Any, Mapping, Optional, Sequence
+from sqlalchemy.sql import Select # type: ignore
 
 class FilterHandler(ABC):
 
     @abstractmethod
-    def register_filter(self, query: Query, field: str, filter_str: Optional[str] = None) -> FilterHandler:
-        """Register filter to handler"""
+    def compile_filters(
+        self,
+        filters: Mapping[str, Optional[Sequence[str]]],
+        filter_groups: Sequence[Mapping[str, Sequence[str]]] = (),
+    ) -> Optional[Any]:
+        """Compile the filter specifications of each field into a single predicate.
 
+        The filters are combined with AND, the filters within each group with OR
+        before the groups are combined with AND as well.
+        """
 
-    @abstractmethod
-    def get_filter_query(self) -> Query:
-        """Get filtered query"""
\ No newline at end of file
+    def apply_filters(
+        self,
+        query: Select,
+        filters: Mapping[str, Optional[Sequence[str]]],
+        filter_groups: Sequence[Mapping[str, Sequence[str]]] = (),
+    ) -> Select:
+        """Get the query filtered by the compiled predicate"""
+
+        predicate = self.compile_filters(filters, filter_groups)
+        return query if predicate is None else query.filter(predicate)
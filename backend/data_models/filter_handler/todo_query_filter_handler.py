@@ -1,51 +1,190 @@
-from .interface import FilterHandler, Query
-from sqlalchemy.orm import Query # type: ignore
-from typing import Optional
-from .filter_pattern_match import FilterPatternMatch
+import re
+from .interface import FilterHandler
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from sqlalchemy import DateTime, String, all_, and_, any_, bindparam, or_ # type: ignore
+from sqlalchemy.dialects.postgresql import ARRAY # type: ignore
+from typing import Any, Final, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeAlias, Union
+from util.exceptions import InvalidFilterError
+from .filter_pattern_match import MATCH_OPERATORS, SET_OPERATORS, FilterPatternMatch
 from ..models import Todo
 
+FilterSet: TypeAlias = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+FilterPlanKey: TypeAlias = Tuple[FilterSet, Tuple[FilterSet, ...]]
+
+FilterValue: TypeAlias = Union[str, date, datetime]
+
+DEFAULT_PLAN_CACHE_SIZE: Final = 256
+
 class TodoQueryFilterHandler(FilterHandler):
-    def __init__(self) -> None:
-        self.__query: Optional[Query] = None
-        self.__field: Optional[str] = None
-        self.__filter_str: Optional[str] = None
-
-    def register_filter(self, query: Query, field: str, filter_str: Optional[str] = None) -> FilterHandler:
-        self.__query = query
-        self.__field = field
-        self.__filter_str = filter_str
-        return self
-    
-    def __parse_null(self, value: str) -> Optional[str]:
-        if value.lower() == "null":
-            return None
+    """Compile todo filters into one predicate, caching the compiled plans by the normalized filter set.
+
+    The handler keeps no per request state, so a single instance can be shared by concurrent requests.
+    """
+
+    __FIELDS: Final = frozenset({"name", "description", "due_date", "priority", "status"})
+
+    def __init__(self, plan_cache_size: int = DEFAULT_PLAN_CACHE_SIZE) -> None:
+        self.__compile_plan = lru_cache(maxsize=plan_cache_size)(self.__compile)
+
+    def __normalize(self, filters: Mapping[str, Optional[Sequence[str]]]) -> FilterSet:
+        # filters are combined with AND, so their order and repetitions do not change the plan
+        return tuple(
+            (field, tuple(sorted(set(filter_strs))))
+            for field, filter_strs in sorted(filters.items())
+            if filter_strs
+        )
+
+    def __parse_value(self, column: Any, value: str) -> FilterValue:
+        # values are bound with the column type, asyncpg does not cast text parameters implicitly
+        if isinstance(column.type, DateTime):
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                raise InvalidFilterError(f'Invalid datetime "{value}" for field "{column.key}".')
+            # the column stores naive datetimes
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            return parsed
+        length = column.type.length if isinstance(column.type, String) else None
+        if length is not None and len(value) > length:
+            raise InvalidFilterError(f'Value of field "{column.key}" is longer than {length} characters.')
         return value
 
-    def get_filter_query(self) -> Query:
-        if self.__query is None:
-            raise ValueError("Query is not registered")
-        if self.__field is None:
-            raise ValueError("Field is not registered")
-        if self.__filter_str is None:
-            raise ValueError("Filter is not registered")
+    def __day_predicate(self, column: Any, operator: str, day: date) -> Any:
+        # a date matches the whole day on a datetime column, kept as ranges so the index can be used
+        day_start = datetime.combine(day, time.min)
+        next_day_start = day_start + timedelta(days=1)
+        match operator:
+            case "eq":
+                return and_(column >= day_start, column < next_day_start)
+            case "gt":
+                return column >= next_day_start
+            case "lt":
+                return column < day_start
+            case "ge":
+                return column >= day_start
+            case "le":
+                return column < next_day_start
+            case "ne":
+                return or_(column < day_start, column >= next_day_start)
+            case _:
+                raise ValueError("Invalid operator")
+
+    def __match_predicate(self, column: Any, operator: str, value: str) -> Any:
+        # the whole pattern is bound as one parameter, so the trigram index can serve it
+        escaped = re.sub(r"([\\%_])", r"\\\1", value)
+        match operator:
+            case "like":
+                return column.like(f"%{escaped}%")
+            case "ilike":
+                return column.ilike(f"%{escaped}%")
+            case "prefix":
+                return column.like(f"{escaped}%")
+            case _:
+                raise ValueError("Invalid operator")
+
+    def __set_predicate(self, column: Any, operator: str, raw_value: str) -> Any:
+        # the values are bound as one array parameter, so the statement text and its cached plan
+        # do not depend on the number of values and the index is scanned once for all of them
+        raw_values = [value.replace("\\,", ",") for value in re.split(r"(?<!\\),", raw_value)]
+        values = [self.__parse_value(column, value) for value in raw_values if value.lower() != "null"]
+        days: List[date] = []
+        exact_values: List[FilterValue] = []
+        for value in values:
+            if isinstance(value, date) and not isinstance(value, datetime):
+                days.append(value)
+            else:
+                exact_values.append(value)
+        with_null = len(values) < len(raw_values)
+
+        if operator == "in":
+            predicates = [self.__day_predicate(column, "eq", day) for day in days]
+            if exact_values:
+                predicates.append(column == any_(bindparam(None, exact_values, type_=ARRAY(column.type))))
+            if with_null:
+                predicates.append(column.is_(None))
+            return or_(*predicates)
+
+        predicates = [self.__day_predicate(column, "ne", day) for day in days]
+        if exact_values:
+            predicates.append(column != all_(bindparam(None, exact_values, type_=ARRAY(column.type))))
+        if with_null or not predicates:
+            predicates.append(column.is_not(None))
+        return and_(*predicates)
+
+    def __predicate(self, field: str, filter_str: str) -> Any:
+        if field not in self.__FIELDS:
+            raise InvalidFilterError(f'Field "{field}" cannot be filtered.')
 
-        filter_pattern_match = FilterPatternMatch(self.__filter_str)
-        filter_pattern_match()
+        operator, raw_value = FilterPatternMatch(filter_str)()
+        column = getattr(Todo, field)
+        if operator in MATCH_OPERATORS:
+            if not isinstance(column.type, String):
+                raise InvalidFilterError(f'Operator "{operator}" cannot match field "{field}".')
+            return self.__match_predicate(column, operator, str(self.__parse_value(column, raw_value)))
+        if operator in SET_OPERATORS:
+            return self.__set_predicate(column, operator, raw_value)
+
+        if raw_value.lower() == "null":
+            match operator:
+                case "eq":
+                    return column.is_(None)
+                case "ne":
+                    return column.is_not(None)
+                case _:
+                    raise InvalidFilterError(f'Operator "{operator}" cannot compare field "{field}" with null.')
+
+        value = self.__parse_value(column, raw_value)
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return self.__day_predicate(column, operator, value)
 
-        operator = filter_pattern_match.get_operator()
-        value = self.__parse_null(filter_pattern_match.get_value())
         match operator:
             case "eq":
-                return self.__query.filter(getattr(Todo, self.__field) == value)
+                return column == value
             case "gt":
-                return self.__query.filter(getattr(Todo, self.__field) > value)
+                return column > value
             case "lt":
-                return self.__query.filter(getattr(Todo, self.__field) < value)
+                return column < value
             case "ge":
-                return self.__query.filter(getattr(Todo, self.__field) >= value)
+                return column >= value
             case "le":
-                return self.__query.filter(getattr(Todo, self.__field) <= value)
+                return column <= value
             case "ne":
-                return self.__query.filter(getattr(Todo, self.__field) != value)
+                return column != value
             case _:
-                raise ValueError("Invalid operator")
\ No newline at end of file
+                raise ValueError("Invalid operator")
+
+    def __predicates(self, filter_set: FilterSet) -> Iterator[Any]:
+        for field, filter_strs in filter_set:
+            for filter_str in filter_strs:
+                yield self.__predicate(field, filter_str)
+
+    def __compile(self, plan_key: FilterPlanKey) -> Any:
+        filter_set, group_sets = plan_key
+        return and_(
+            *self.__predicates(filter_set),
+            *(or_(*self.__predicates(group_set)) for group_set in group_sets),
+        )
+
+    def compile_filters(
+        self,
+        filters: Mapping[str, Optional[Sequence[str]]],
+        filter_groups: Sequence[Mapping[str, Sequence[str]]] = (),
+    ) -> Optional[Any]:
+        filter_set = self.__normalize(filters)
+        # groups are combined with AND as well, an empty group does not filter anything
+        group_sets = tuple(sorted({group_set for group_set in map(self.__normalize, filter_groups) if group_set}))
+        if not filter_set and not group_sets:
+            return None
+        return self.__compile_plan((filter_set, group_sets))
+
+    def plan_cache_info(self) -> Any:
+        """Get the hit and miss statistics of the plan cache"""
+
+        return self.__compile_plan.cache_info()
@@ -0,0 +1,11 @@
+from typing import Final
+from config.job_config import JOB_CONFIG
+from .runner import JobHandler, JobRunner, JobStatus
+
+job_runner: Final = JobRunner(
+    worker_count = JOB_CONFIG.worker_count,
+    poll_interval = JOB_CONFIG.poll_interval,
+    max_attempts = JOB_CONFIG.max_attempts,
+    retry_delay = JOB_CONFIG.retry_delay,
+    lease = JOB_CONFIG.lease,
+)
\ No newline at end of file
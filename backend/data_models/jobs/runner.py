@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, TypeAlias
+from sqlalchemy import and_, or_, select, update # type: ignore
+from sqlalchemy.engine import Row # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession # type: ignore
+from util.types import Serializable
+from ..connection import AsyncDatabaseConnection
+from ..models import Job
+
+logger = logging.getLogger(__name__)
+
+JobStatus: TypeAlias = Literal["pending", "running", "succeeded", "failed"]
+
+JobHandler: TypeAlias = Callable[[Dict[str, Any]], Awaitable[Serializable]]
+
+class JobRunner:
+    """Run the jobs persisted in the job table on worker tasks of the event loop.
+
+    Jobs are claimed with FOR UPDATE SKIP LOCKED, so the workers of several
+    processes can share the table without a broker. A claimed job holds a
+    lease which is renewed while it runs, a job whose process died is claimed
+    again once its lease expires. A job whose lease cannot be renewed is
+    cancelled, so it never runs on two runners at once. Failed jobs are retried with exponential
+    backoff until they run out of attempts, so handlers must be idempotent.
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        poll_interval: float,
+        max_attempts: int,
+        retry_delay: float,
+        lease: float,
+    ) -> None:
+        self.__worker_count = worker_count
+        self.__poll_interval = poll_interval
+        self.__max_attempts = max_attempts
+        self.__retry_delay = retry_delay
+        self.__lease = lease
+        self.__handlers: Dict[str, JobHandler] = {}
+        self.__workers: List[asyncio.Task] = []
+        self.__wakeup: Optional[asyncio.Event] = None
+
+    def register(self, kind: str) -> Callable[[JobHandler], JobHandler]:
+        """Register the handler of a kind of jobs, it gets the payload and returns the result"""
+
+        def decorator(handler: JobHandler) -> JobHandler:
+            self.__handlers[kind] = handler
+            return handler
+        return decorator
+
+    async def enqueue(self, session: AsyncSession, kind: str, payload: Dict[str, Any], username: str) -> int:
+        """Add a job in the transaction of the session and return its id, notify the runner after the commit"""
+
+        if kind not in self.__handlers:
+            raise ValueError(f"No handler registered for jobs of kind {kind}")
+
+        now = datetime.now()
+        job = Job(
+            kind = kind,
+            username = username,
+            payload = payload,
+            status = "pending",
+            attempts = 0,
+            run_after = now,
+            created_at = now,
+            updated_at = now,
+        )
+        session.add(job)
+        await session.flush()
+        return job.job_id
+
+    def notify(self) -> None:
+        """Wake the idle workers up to claim a newly committed job"""
+
+        if self.__wakeup is not None:
+            self.__wakeup.set()
+
+    async def start(self) -> None:
+        """Start the workers on the running event loop"""
+
+        self.__wakeup = asyncio.Event()
+        self.__workers = [asyncio.create_task(self.__work()) for _ in range(self.__worker_count)]
+
+    async def stop(self) -> None:
+        """Stop the workers, their running jobs are handed back to be claimed again"""
+
+        for worker in self.__workers:
+            worker.cancel()
+        await asyncio.gather(*self.__workers, return_exceptions = True)
+        self.__workers = []
+
+    async def __claim(self) -> Optional[Row]:
+        now = datetime.now()
+        due_job = (
+            select(Job.job_id)
+                .filter(or_(
+                    and_(Job.status == "pending", Job.run_after <= now),
+                    and_(Job.status == "running", Job.locked_until < now),
+                ))
+                .order_by(Job.job_id)
+                .limit(1)
+                .with_for_update(skip_locked = True)
+                .scalar_subquery()
+        )
+        async with AsyncDatabaseConnection() as session:
+            job = (await session.execute(
+                update(Job)
+                    .where(Job.job_id == due_job)
+                    .values(
+                        status = "running",
+                        attempts = Job.attempts + 1,
+                        locked_until = now + timedelta(seconds = self.__lease),
+                        updated_at = now,
+                    )
+                    .returning(Job.job_id, Job.kind, Job.payload, Job.attempts)
+                    .execution_options(synchronize_session = False)
+            )).first()
+            await session.commit()
+        return job
+
+    async def __update(self, job: Row, **values: Any) -> bool:
+        # the claim counts the attempt, a job claimed again by another runner no longer matches it
+        async with AsyncDatabaseConnection() as session:
+            result = await session.execute(
+                update(Job)
+                    .where(Job.job_id == job.job_id)
+                    .where(Job.status == "running")
+                    .where(Job.attempts == job.attempts)
+                    .values(updated_at = datetime.now(), **values)
+                    .execution_options(synchronize_session = False)
+            )
+            await session.commit()
+        return result.rowcount == 1
+
+    async def __renew_lease(self, job: Row) -> None:
+        # returns once the lease could not be renewed
+        while True:
+            await asyncio.sleep(self.__lease / 3)
+            try:
+                if not await self.__update(job, locked_until = datetime.now() + timedelta(seconds = self.__lease)):
+                    logger.error("Job %s was claimed by another runner, aborting it", job.job_id)
+                    return
+            except Exception:
+                logger.exception("Could not renew the lease of job %s, aborting it", job.job_id)
+                return
+
+    async def __handle(self, job: Row) -> Serializable:
+        handler = self.__handlers.get(job.kind)
+        if handler is None:
+            raise LookupError(f"No handler registered for jobs of kind {job.kind}")
+        return await handler(job.payload)
+
+    async def __run(self, job: Row) -> None:
+        handling = asyncio.create_task(self.__handle(job))
+        renewal = asyncio.create_task(self.__renew_lease(job))
+        try:
+            await asyncio.wait((handling, renewal), return_when = asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            handling.cancel()
+            renewal.cancel()
+            # the handler may still be in its teardown, the job is handed back only once it has stopped
+            await asyncio.gather(handling, renewal, return_exceptions = True)
+            await self.__update(job, status = "pending", attempts = Job.attempts - 1, locked_until = None)
+            raise
+        finally:
+            renewal.cancel()
+            await asyncio.gather(renewal, return_exceptions = True)
+
+        if not handling.done():
+            # once the lease lapses another runner may claim the job, it must not keep running here
+            handling.cancel()
+            await asyncio.gather(handling, return_exceptions = True)
+            return
+
+        try:
+            result = handling.result()
+        except Exception as e:
+            if job.attempts < self.__max_attempts:
+                retry_delay = self.__retry_delay * 2 ** (job.attempts - 1)
+                await self.__update(
+                    job,
+                    status = "pending",
+                    error = str(e),
+                    run_after = datetime.now() + timedelta(seconds = retry_delay),
+                    locked_until = None,
+                )
+            else:
+                await self.__update(job, status = "failed", error = str(e), locked_until = None)
+        else:
+            await self.__update(job, status = "succeeded", result = result, error = None, locked_until = None)
+
+    async def __wait(self) -> None:
+        assert self.__wakeup is not None
+        try:
+            await asyncio.wait_for(self.__wakeup.wait(), self.__poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self.__wakeup.clear()
+
+    async def __work(self) -> None:
+        while True:
+            try:
+                job = await self.__claim()
+            except Exception:
+                # the database is unavailable, try again on the next poll
+                job = None
+            if job is None:
+                await self.__wait()
+                continue
+            try:
+                await self.__run(job)
+            except Exception:
+                # the outcome could not be recorded, the job is claimed again when its lease expires
+                pass
\ No newline at end of file
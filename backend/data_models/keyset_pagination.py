@@ -0,0 +1,106 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Final, List, Literal, Optional, Sequence, Tuple, TypeAlias, Union
+from sqlalchemy import DateTime, and_, or_, tuple_ # type: ignore
+from sqlalchemy.sql import Select # type: ignore
+from util.exceptions import InvalidCursorError
+
+CursorValue: TypeAlias = Optional[Union[str, int, float, datetime]]
+
+DEFAULT_PAGE_SIZE: Final = 100
+
+class KeysetPaginator:
+    """Keyset (cursor) pagination over an optional sort column with the primary key as tie breaker.
+
+    Pages are ordered by ``(sort column, id)`` so that they map onto a
+    ``(..., sort column, id)`` btree index. Postgres sorts NULLs last in
+    ascending and first in descending order, which the page predicates follow.
+    """
+
+    def __init__(
+        self,
+        id_column: Any,
+        sort_column: Optional[Any],
+        order_by: Literal["asc", "desc"],
+        limit: int,
+    ) -> None:
+        self.__id_column = id_column
+        self.__sort_column = sort_column
+        self.__order_by = order_by
+        self.__limit = limit
+
+    @property
+    def __sort_key(self) -> Optional[str]:
+        return None if self.__sort_column is None else self.__sort_column.key
+
+    def encode_cursor(self, value: CursorValue, row_id: int) -> str:
+        """Encode the position after a row into an opaque cursor"""
+
+        payload = {
+            "sort_by": self.__sort_key,
+            "order_by": self.__order_by,
+            "value": value.isoformat() if isinstance(value, datetime) else value,
+            "id": row_id,
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> Tuple[CursorValue, int]:
+        """Decode a cursor into the sort value and id of the last row of the previous page"""
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            sort_by, order_by, value, row_id = payload["sort_by"], payload["order_by"], payload["value"], int(payload["id"])
+            if sort_by != self.__sort_key or order_by != self.__order_by:
+                raise InvalidCursorError("Cursor does not match the requested sorting.")
+            if value is not None and self.__sort_column is not None:
+                if isinstance(self.__sort_column.type, DateTime):
+                    value = datetime.fromisoformat(value)
+                elif type(value) is not self.__sort_column.type.python_type:
+                    # a value of another type would fail the row comparison in the database
+                    raise InvalidCursorError("Invalid cursor.")
+            return value, row_id
+        except (binascii.Error, json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError):
+            raise InvalidCursorError("Invalid cursor.")
+
+    def __after(self, value: CursorValue, row_id: int) -> Any:
+        id_column, sort_column = self.__id_column, self.__sort_column
+        if sort_column is None:
+            return id_column > row_id if self.__order_by == "asc" else id_column < row_id
+
+        if not getattr(sort_column, "nullable", True):
+            # without the NULL branches the row comparison stays an index condition
+            if self.__order_by == "asc":
+                return tuple_(sort_column, id_column) > tuple_(value, row_id)
+            return tuple_(sort_column, id_column) < tuple_(value, row_id)
+
+        if self.__order_by == "asc":
+            if value is None:
+                return and_(sort_column.is_(None), id_column > row_id)
+            return or_(tuple_(sort_column, id_column) > tuple_(value, row_id), sort_column.is_(None))
+
+        if value is None:
+            return or_(and_(sort_column.is_(None), id_column < row_id), sort_column.is_not(None))
+        return tuple_(sort_column, id_column) < tuple_(value, row_id)
+
+    def paginate(self, query: Select, cursor: Optional[str] = None) -> Select:
+        """Order the query by the keyset, skip to the cursor and fetch one row past the page"""
+
+        if cursor is not None:
+            query = query.filter(self.__after(*self.decode_cursor(cursor)))
+
+        columns = [self.__id_column] if self.__sort_column is None else [self.__sort_column, self.__id_column]
+        ordering = [column.asc() if self.__order_by == "asc" else column.desc() for column in columns]
+        return query.order_by(*ordering).limit(self.__limit + 1)
+
+    def split_page(self, rows: Sequence[Any]) -> Tuple[List[Any], Optional[str]]:
+        """Cut the extra row off a fetched page and build the cursor of the next page"""
+
+        page = list(rows[:self.__limit])
+        if len(rows) <= self.__limit:
+            return page, None
+
+        last_row = page[-1]
+        value = None if self.__sort_key is None else getattr(last_row, self.__sort_key)
+        return page, self.encode_cursor(value, getattr(last_row, self.__id_column.key))
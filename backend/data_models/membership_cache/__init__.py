@@ -0,0 +1,6 @@
+from typing import Final
+from config.cache_config import CACHE_CONFIG
+from .interface import Membership, MembershipCache
+from .factory import MembershipCacheFactory
+
+membership_cache: Final = MembershipCacheFactory().get_cache(CACHE_CONFIG.membership_cache_backend)
\ No newline at end of file
@@ -0,0 +1,18 @@
+from typing import Literal, TypeAlias
+from config.cache_config import CACHE_CONFIG
+from .interface import MembershipCache
+from .memory_cache import InMemoryMembershipCache
+from .redis_cache import RedisMembershipCache
+
+BackendType: TypeAlias = Literal["memory", "redis"]
+
+class MembershipCacheFactory:
+
+    def get_cache(self, backend_type: BackendType) -> MembershipCache:
+        match backend_type:
+            case "memory":
+                return InMemoryMembershipCache(CACHE_CONFIG.membership_cache_size, CACHE_CONFIG.membership_cache_ttl)
+            case "redis":
+                return RedisMembershipCache(CACHE_CONFIG.redis_url, CACHE_CONFIG.membership_cache_ttl)
+            case _:
+                raise NotImplementedError(f"Membership cache backend {backend_type} is not implemented")
@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Optional
+from util.metrics import Counter
+from util.types import Serializable
+
+@dataclass(frozen=True)
+class Membership:
+    """Ids of a user and a workspace the user has joined."""
+
+    user_id: int
+    workspace_id: int
+
+class MembershipCache(ABC):
+    """Cache of workspace memberships keyed by username and workspace default name.
+
+    Only confirmed memberships are cached. The workspace routes invalidate an
+    entry when the membership is removed, and every entry expires after its
+    ttl so that caches in other processes converge as well.
+    """
+
+    def __init__(self) -> None:
+        self.hits = Counter()
+        self.misses = Counter()
+
+    @abstractmethod
+    async def _get(self, username: str, workspace_default_name: str) -> Optional[Membership]:
+        """Get a cached membership"""
+
+    @abstractmethod
+    async def set(self, username: str, workspace_default_name: str, membership: Membership) -> None:
+        """Cache a membership"""
+
+    @abstractmethod
+    async def invalidate(self, username: str, workspace_default_name: str) -> None:
+        """Drop the membership of a user in a workspace"""
+
+    @abstractmethod
+    async def invalidate_workspace(self, workspace_default_name: str) -> None:
+        """Drop the memberships of every user in a workspace"""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every cached membership"""
+
+    @abstractmethod
+    def size(self) -> Optional[int]:
+        """Get the number of cached memberships, None when the backend cannot tell cheaply"""
+
+    async def get(self, username: str, workspace_default_name: str) -> Optional[Membership]:
+        """Get a cached membership and count the hit or miss"""
+
+        membership = await self._get(username, workspace_default_name)
+        if membership is None:
+            self.misses.inc()
+        else:
+            self.hits.inc()
+        return membership
+
+    def statistics(self) -> Dict[str, Serializable]:
+        """Get the size and the hit and miss counts of the cache"""
+
+        return {
+            "backend": type(self).__name__,
+            "size": self.size(),
+            "hits": self.hits.value,
+            "misses": self.misses.value,
+        }
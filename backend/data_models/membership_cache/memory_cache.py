@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+from .interface import Membership, MembershipCache
+
+class InMemoryMembershipCache(MembershipCache):
+    """A bounded LRU membership cache local to the process, accessed from the event loop only."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        super().__init__()
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__entries: OrderedDict[Tuple[str, str], Tuple[float, Membership]] = OrderedDict()
+
+    async def _get(self, username: str, workspace_default_name: str) -> Optional[Membership]:
+        key = (workspace_default_name, username)
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, username: str, workspace_default_name: str, membership: Membership) -> None:
+        if self.__max_size <= 0:
+            return
+
+        key = (workspace_default_name, username)
+        self.__entries[key] = (time.monotonic() + self.__ttl, membership)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last = False)
+
+    async def invalidate(self, username: str, workspace_default_name: str) -> None:
+        self.__entries.pop((workspace_default_name, username), None)
+
+    async def invalidate_workspace(self, workspace_default_name: str) -> None:
+        for key in [key for key in self.__entries if key[0] == workspace_default_name]:
+            del self.__entries[key]
+
+    async def clear(self) -> None:
+        self.__entries.clear()
+
+    def size(self) -> Optional[int]:
+        return len(self.__entries)
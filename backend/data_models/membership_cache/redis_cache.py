@@ -0,0 +1,52 @@
+from typing import Any, Optional
+from .interface import Membership, MembershipCache
+
+try:
+    from redis import asyncio as redis_asyncio # type: ignore
+except ImportError:
+    redis_asyncio = None
+
+class RedisMembershipCache(MembershipCache):
+    """A membership cache shared by every process through redis.
+
+    The memberships of a workspace live in one hash, so that removing a
+    workspace drops all of them with a single delete.
+    """
+
+    def __init__(self, url: str, ttl: float) -> None:
+        if redis_asyncio is None:
+            raise ImportError("The redis package is required by the redis membership cache.")
+        super().__init__()
+        self.__client: Any = redis_asyncio.from_url(url)
+        self.__ttl = max(int(ttl), 1)
+
+    def __key(self, workspace_default_name: str) -> str:
+        return f"membership:{workspace_default_name}"
+
+    async def _get(self, username: str, workspace_default_name: str) -> Optional[Membership]:
+        value = await self.__client.hget(self.__key(workspace_default_name), username)
+        if value is None:
+            return None
+        user_id, workspace_id = value.decode().split(":")
+        return Membership(int(user_id), int(workspace_id))
+
+    async def set(self, username: str, workspace_default_name: str, membership: Membership) -> None:
+        key = self.__key(workspace_default_name)
+        async with self.__client.pipeline(transaction = True) as pipeline:
+            pipeline.hset(key, username, f"{membership.user_id}:{membership.workspace_id}")
+            pipeline.expire(key, self.__ttl)
+            await pipeline.execute()
+
+    async def invalidate(self, username: str, workspace_default_name: str) -> None:
+        await self.__client.hdel(self.__key(workspace_default_name), username)
+
+    async def invalidate_workspace(self, workspace_default_name: str) -> None:
+        await self.__client.delete(self.__key(workspace_default_name))
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.__client.scan_iter(match = self.__key("*"))]
+        if keys:
+            await self.__client.delete(*keys)
+
+    def size(self) -> Optional[int]:
+        return None
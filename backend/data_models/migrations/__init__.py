@@ -0,0 +1,3 @@
+from .context import MigrationContext
+from .revision import Revision, load_revisions
+from .migrator import Migrator
@@ -0,0 +1,121 @@
+from typing import Any, Final, Optional, Sequence
+from sqlalchemy import text # type: ignore
+from sqlalchemy.engine import Connection # type: ignore
+
+DEFAULT_BACKFILL_BATCH_SIZE: Final = 1000
+
+class MigrationContext:
+    """Operations available to a revision.
+
+    Offline the whole revision runs in a single transaction. Online every
+    statement commits on its own, so that indexes are built concurrently and
+    backfills commit per batch without holding locks on the whole table.
+    """
+
+    def __init__(self, connection: Connection, online: bool = False) -> None:
+        self.__connection = connection
+        self.__online = online
+
+    @property
+    def online(self) -> bool:
+        return self.__online
+
+    def execute(self, statement: str, **params: Any) -> Any:
+        """Execute a SQL statement with bound parameters"""
+
+        return self.__connection.execute(text(statement), params)
+
+    def __drop_invalid_index(self, name: str) -> None:
+        # a failed concurrent build leaves an invalid index behind which IF NOT EXISTS would keep
+        invalid = self.execute(
+            "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+            "WHERE pg_class.relname = :name AND NOT pg_index.indisvalid",
+            name = name,
+        ).first()
+        if invalid is not None:
+            self.drop_index(name)
+
+    def create_index(
+        self,
+        name: str,
+        table: str,
+        columns: Sequence[str],
+        unique: bool = False,
+        using: Optional[str] = None,
+    ) -> None:
+        """Create an index, concurrently when online"""
+
+        if self.__online:
+            self.__drop_invalid_index(name)
+        self.execute(
+            "CREATE {}INDEX {}IF NOT EXISTS {} ON {}{} ({})".format(
+                "UNIQUE " if unique else "",
+                "CONCURRENTLY " if self.__online else "",
+                name,
+                table,
+                f" USING {using}" if using is not None else "",
+                ", ".join(columns),
+            )
+        )
+
+    def drop_index(self, name: str) -> None:
+        """Drop an index, concurrently when online"""
+
+        self.execute("DROP INDEX {}IF EXISTS {}".format("CONCURRENTLY " if self.__online else "", name))
+
+    def replace_foreign_key(
+        self,
+        name: str,
+        table: str,
+        columns: Sequence[str],
+        referred_table: str,
+        referred_columns: Sequence[str],
+        ondelete: Optional[str] = None,
+    ) -> None:
+        """Replace a foreign key in one statement, validating the existing rows separately when online"""
+
+        self.execute(
+            "ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}, "
+            "ADD CONSTRAINT {name} FOREIGN KEY ({columns}) REFERENCES {referred_table} ({referred_columns}){ondelete}{not_valid}".format(
+                table = table,
+                name = name,
+                columns = ", ".join(columns),
+                referred_table = referred_table,
+                referred_columns = ", ".join(referred_columns),
+                ondelete = f" ON DELETE {ondelete}" if ondelete is not None else "",
+                not_valid = " NOT VALID" if self.__online else "",
+            )
+        )
+        if self.__online:
+            # validating only takes a share update exclusive lock, so writes carry on meanwhile
+            self.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+    def backfill(
+        self,
+        table: str,
+        key_column: str,
+        assignments: str,
+        condition: str = "TRUE",
+        batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE,
+        **params: Any,
+    ) -> int:
+        """Update the rows matching the condition in batches of keys and return the number of updated rows"""
+
+        updated = 0
+        last_key: Optional[Any] = None
+        while True:
+            after_last_key = "" if last_key is None else f"AND {key_column} > :last_key"
+            keys = self.execute(
+                f"WITH batch AS ("
+                f"SELECT {key_column} FROM {table} WHERE ({condition}) {after_last_key} "
+                f"ORDER BY {key_column} LIMIT :batch_size"
+                f") UPDATE {table} SET {assignments} FROM batch "
+                f"WHERE {table}.{key_column} = batch.{key_column} RETURNING {table}.{key_column}",
+                last_key = last_key,
+                batch_size = batch_size,
+                **params,
+            ).scalars().all()
+            if not keys:
+                return updated
+            updated += len(keys)
+            last_key = max(keys)
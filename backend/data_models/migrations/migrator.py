@@ -0,0 +1,109 @@
+from contextlib import contextmanager
+from typing import Final, Generator, List, Optional
+from sqlalchemy import text # type: ignore
+from sqlalchemy.engine import Connection, Engine as SQLAlchemyEngine # type: ignore
+from util.exceptions import MigrationError
+from ..connection import Engine
+from .context import MigrationContext
+from .revision import Revision, load_revisions
+
+VERSION_TABLE: Final = "schema_migrations"
+
+# key of the advisory lock which keeps two deployments from migrating at once
+MIGRATION_LOCK_KEY: Final = 0x5EEF10
+
+class Migrator:
+    """Apply revisions to the database and track the applied revision in a version table."""
+
+    def __init__(self, engine: SQLAlchemyEngine = Engine, revisions: Optional[List[Revision]] = None) -> None:
+        self.__engine = engine
+        self.__revisions = load_revisions() if revisions is None else revisions
+
+    @property
+    def revisions(self) -> List[Revision]:
+        return list(self.__revisions)
+
+    @property
+    def head(self) -> Optional[str]:
+        return self.__revisions[-1].revision if self.__revisions else None
+
+    def __position(self, revision: Optional[str]) -> int:
+        """Get the number of revisions applied up to and including a revision"""
+
+        if revision in (None, "base"):
+            return 0
+        if revision == "head":
+            return len(self.__revisions)
+        for position, known_revision in enumerate(self.__revisions, start = 1):
+            if known_revision.revision == revision:
+                return position
+        raise MigrationError(f'Revision "{revision}" not found.')
+
+    @contextmanager
+    def __locked(self) -> Generator[Connection, None, None]:
+        with self.__engine.connect() as connection:
+            connection = connection.execution_options(isolation_level = "AUTOCOMMIT")
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            try:
+                connection.execute(text(f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (version_num VARCHAR(32) PRIMARY KEY)"))
+                yield connection
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+    def __read_version(self, connection: Connection) -> Optional[str]:
+        return connection.execute(text(f"SELECT version_num FROM {VERSION_TABLE}")).scalar()
+
+    def __write_version(self, connection: Connection, revision: Optional[str]) -> None:
+        connection.execute(text(f"DELETE FROM {VERSION_TABLE}"))
+        if revision is not None:
+            connection.execute(text(f"INSERT INTO {VERSION_TABLE} (version_num) VALUES (:revision)"), {"revision": revision})
+
+    def __apply(self, connection: Connection, revision: Revision, upgrade: bool, online: bool) -> None:
+        step = revision.upgrade if upgrade else revision.downgrade
+        version = revision.revision if upgrade else revision.down_revision
+        if online:
+            step(MigrationContext(connection, online = True))
+            self.__write_version(connection, version)
+            return
+
+        with self.__engine.connect() as transaction_connection:
+            with transaction_connection.begin():
+                step(MigrationContext(transaction_connection))
+                self.__write_version(transaction_connection, version)
+
+    def current(self) -> Optional[str]:
+        """Get the revision the database is at"""
+
+        with self.__locked() as connection:
+            return self.__read_version(connection)
+
+    def upgrade(self, target: str = "head", online: bool = False) -> List[str]:
+        """Apply the revisions after the current one up to the target and return them"""
+
+        with self.__locked() as connection:
+            start, end = self.__position(self.__read_version(connection)), self.__position(target)
+            if end < start:
+                raise MigrationError(f'Revision "{target}" is behind the current revision, downgrade instead.')
+            applied = self.__revisions[start:end]
+            for revision in applied:
+                self.__apply(connection, revision, upgrade = True, online = online)
+            return [revision.revision for revision in applied]
+
+    def downgrade(self, target: str = "base", online: bool = False) -> List[str]:
+        """Revert the revisions after the target down from the current one and return them"""
+
+        with self.__locked() as connection:
+            start, end = self.__position(self.__read_version(connection)), self.__position(target)
+            if end > start:
+                raise MigrationError(f'Revision "{target}" is ahead of the current revision, upgrade instead.')
+            reverted = self.__revisions[end:start][::-1]
+            for revision in reverted:
+                self.__apply(connection, revision, upgrade = False, online = online)
+            return [revision.revision for revision in reverted]
+
+    def stamp(self, target: str = "head") -> None:
+        """Record a revision as applied without running it, for databases created before migrations"""
+
+        with self.__locked() as connection:
+            position = self.__position(target)
+            self.__write_version(connection, self.__revisions[position - 1].revision if position else None)
@@ -0,0 +1,59 @@
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+from util.exceptions import MigrationError
+from .context import MigrationContext
+
+VERSIONS_PACKAGE = "data_models.migrations.versions"
+
+@dataclass(frozen=True)
+class Revision:
+    """A schema revision and the revision it is applied on top of."""
+
+    revision: str
+    down_revision: Optional[str]
+    description: str
+    upgrade: Callable[[MigrationContext], None]
+    downgrade: Callable[[MigrationContext], None]
+
+    @classmethod
+    def from_module(cls, module: ModuleType) -> "Revision":
+        try:
+            return cls(
+                revision = module.revision,
+                down_revision = module.down_revision,
+                description = (module.__doc__ or "").strip(),
+                upgrade = module.upgrade,
+                downgrade = module.downgrade,
+            )
+        except AttributeError as e:
+            raise MigrationError(f"Revision module {module.__name__} is incomplete: {e}")
+
+def load_revisions(package: str = VERSIONS_PACKAGE) -> List[Revision]:
+    """Load the revisions of a package ordered from the first to the head revision"""
+
+    versions = importlib.import_module(package)
+    revisions: Dict[Optional[str], Revision] = {}
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        revision = Revision.from_module(importlib.import_module(f"{package}.{module_info.name}"))
+        if revision.down_revision in revisions:
+            raise MigrationError(
+                f'Revisions "{revisions[revision.down_revision].revision}" and "{revision.revision}" '
+                f'both follow "{revision.down_revision}".'
+            )
+        revisions[revision.down_revision] = revision
+
+    ordered: List[Revision] = []
+    down_revision: Optional[str] = None
+    while down_revision in revisions:
+        ordered.append(revisions.pop(down_revision))
+        down_revision = ordered[-1].revision
+    if revisions:
+        raise MigrationError(
+            "Revisions not reachable from the first revision: {}".format(
+                ", ".join(sorted(revision.revision for revision in revisions.values()))
+            )
+        )
+    return ordered
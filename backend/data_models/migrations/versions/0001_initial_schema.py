@@ -0,0 +1,85 @@
+"""Initial schema, as created by metadata.create_all before migrations existed."""
+from ..context import MigrationContext
+
+revision = "0001"
+down_revision = None
+
+def upgrade(context: MigrationContext) -> None:
+    context.execute("""
+        CREATE TABLE account (
+            user_id BIGSERIAL NOT NULL,
+            username VARCHAR(255) NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            password_salt VARCHAR(255) NOT NULL,
+            PRIMARY KEY (user_id)
+        )
+    """)
+    context.execute("CREATE UNIQUE INDEX ix_account_email ON account (email)")
+    context.execute("CREATE UNIQUE INDEX ix_account_username ON account (username)")
+
+    context.execute("""
+        CREATE TABLE login (
+            user_id BIGINT NOT NULL,
+            refresh_token_hash VARCHAR(255) NOT NULL,
+            refresh_token_salt VARCHAR(255) NOT NULL,
+            expiry_date TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (user_id),
+            FOREIGN KEY (user_id) REFERENCES account (user_id) ON DELETE CASCADE
+        )
+    """)
+
+    context.execute("""
+        CREATE TABLE workspace (
+            workspace_id BIGSERIAL NOT NULL,
+            workspace_default_name VARCHAR(255) NOT NULL,
+            workspace_owner_id BIGINT,
+            PRIMARY KEY (workspace_id),
+            FOREIGN KEY (workspace_owner_id) REFERENCES account (user_id)
+        )
+    """)
+    context.execute("CREATE UNIQUE INDEX ix_workspace_workspace_default_name ON workspace (workspace_default_name)")
+
+    context.execute("""
+        CREATE TABLE todo_list (
+            todolist_id BIGSERIAL NOT NULL,
+            todolist_name VARCHAR(255) NOT NULL,
+            workspace_id BIGINT,
+            PRIMARY KEY (todolist_id),
+            FOREIGN KEY (workspace_id) REFERENCES workspace (workspace_id) ON DELETE CASCADE
+        )
+    """)
+
+    context.execute("""
+        CREATE TABLE workspace_account_link (
+            user_id BIGINT NOT NULL,
+            workspace_id BIGINT NOT NULL,
+            locale_alias VARCHAR(255),
+            PRIMARY KEY (user_id, workspace_id),
+            FOREIGN KEY (user_id) REFERENCES account (user_id),
+            FOREIGN KEY (workspace_id) REFERENCES workspace (workspace_id)
+        )
+    """)
+
+    context.execute("""
+        CREATE TABLE todo (
+            todo_id BIGSERIAL NOT NULL,
+            todolist_id BIGINT,
+            workspace_id BIGINT,
+            name VARCHAR(255) NOT NULL,
+            description VARCHAR(1000),
+            due_date TIMESTAMP WITHOUT TIME ZONE,
+            status VARCHAR(255),
+            priority VARCHAR(255),
+            last_modified TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (todo_id),
+            FOREIGN KEY (todolist_id) REFERENCES todo_list (todolist_id) ON DELETE CASCADE,
+            FOREIGN KEY (workspace_id) REFERENCES workspace (workspace_id) ON DELETE CASCADE
+        )
+    """)
+    for column in ("description", "due_date", "name", "priority", "status"):
+        context.execute(f"CREATE INDEX ix_todo_{column} ON todo ({column})")
+
+def downgrade(context: MigrationContext) -> None:
+    for table in ("todo", "workspace_account_link", "todo_list", "workspace", "login", "account"):
+        context.execute(f"DROP TABLE {table}")
@@ -0,0 +1,30 @@
+"""Index todos by (todolist_id, sort column, todo_id) and the workspace_id of bulk deletes instead of single columns."""
+from ..context import MigrationContext
+
+revision = "0002"
+down_revision = "0001"
+
+ACCESS_PATH_INDEXES = (
+    ("ix_todo_todolist_id_todo_id", "todo", ("todolist_id", "todo_id")),
+    ("ix_todo_todolist_id_name_todo_id", "todo", ("todolist_id", "name", "todo_id")),
+    ("ix_todo_todolist_id_due_date_todo_id", "todo", ("todolist_id", "due_date", "todo_id")),
+    ("ix_todo_todolist_id_status_todo_id", "todo", ("todolist_id", "status", "todo_id")),
+    ("ix_todo_todolist_id_priority_todo_id", "todo", ("todolist_id", "priority", "todo_id")),
+    ("ix_todo_workspace_id", "todo", ("workspace_id",)),
+    ("ix_todo_list_workspace_id", "todo_list", ("workspace_id",)),
+    ("ix_workspace_account_link_workspace_id", "workspace_account_link", ("workspace_id",)),
+)
+
+SINGLE_COLUMN_INDEXED = ("description", "due_date", "name", "priority", "status")
+
+def upgrade(context: MigrationContext) -> None:
+    for name, table, columns in ACCESS_PATH_INDEXES:
+        context.create_index(name, table, columns)
+    for column in SINGLE_COLUMN_INDEXED:
+        context.drop_index(f"ix_todo_{column}")
+
+def downgrade(context: MigrationContext) -> None:
+    for column in SINGLE_COLUMN_INDEXED:
+        context.create_index(f"ix_todo_{column}", "todo", (column,))
+    for name, _, _ in ACCESS_PATH_INDEXES:
+        context.drop_index(name)
@@ -0,0 +1,24 @@
+"""Cascade deletes of a workspace to its memberships so that deleting a workspace is a single statement."""
+from ..context import MigrationContext
+
+revision = "0003"
+down_revision = "0002"
+
+def upgrade(context: MigrationContext) -> None:
+    context.replace_foreign_key(
+        "workspace_account_link_workspace_id_fkey",
+        "workspace_account_link",
+        ("workspace_id",),
+        "workspace",
+        ("workspace_id",),
+        ondelete = "CASCADE",
+    )
+
+def downgrade(context: MigrationContext) -> None:
+    context.replace_foreign_key(
+        "workspace_account_link_workspace_id_fkey",
+        "workspace_account_link",
+        ("workspace_id",),
+        "workspace",
+        ("workspace_id",),
+    )
@@ -0,0 +1,28 @@
+"""Persist the jobs run in the background by the job runner."""
+from ..context import MigrationContext
+
+revision = "0004"
+down_revision = "0003"
+
+def upgrade(context: MigrationContext) -> None:
+    context.execute("""
+        CREATE TABLE IF NOT EXISTS job (
+            job_id BIGSERIAL NOT NULL,
+            kind VARCHAR(255) NOT NULL,
+            username VARCHAR(255) NOT NULL,
+            payload JSONB NOT NULL,
+            status VARCHAR(32) NOT NULL,
+            attempts INTEGER NOT NULL,
+            result JSONB,
+            error TEXT,
+            run_after TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            locked_until TIMESTAMP WITHOUT TIME ZONE,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (job_id)
+        )
+    """)
+    context.create_index("ix_job_status_run_after", "job", ("status", "run_after"))
+
+def downgrade(context: MigrationContext) -> None:
+    context.execute("DROP TABLE IF EXISTS job")
@@ -0,0 +1,14 @@
+"""Version workspaces and todo lists so that unchanged listings can be answered from their ETag."""
+from ..context import MigrationContext
+
+revision = "0005"
+down_revision = "0004"
+
+def upgrade(context: MigrationContext) -> None:
+    # a constant default does not rewrite the table
+    for table in ("workspace", "todo_list"):
+        context.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 0")
+
+def downgrade(context: MigrationContext) -> None:
+    for table in ("workspace", "todo_list"):
+        context.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS version")
@@ -0,0 +1,26 @@
+"""Remember deleted todos and index todos by modification time for the workspace change feed."""
+from ..context import MigrationContext
+
+revision = "0006"
+down_revision = "0005"
+
+def upgrade(context: MigrationContext) -> None:
+    context.execute("""
+        CREATE TABLE IF NOT EXISTS todo_tombstone (
+            todo_id BIGINT NOT NULL,
+            todolist_id BIGINT NOT NULL,
+            workspace_id BIGINT NOT NULL,
+            deleted_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (todo_id),
+            FOREIGN KEY(workspace_id) REFERENCES workspace (workspace_id) ON DELETE CASCADE
+        )
+    """)
+    context.create_index("ix_todo_tombstone_workspace_id_deleted_at_todo_id", "todo_tombstone", ("workspace_id", "deleted_at", "todo_id"))
+    # the workspace_id prefix of the new index serves the lookups of the old one
+    context.create_index("ix_todo_workspace_id_last_modified_todo_id", "todo", ("workspace_id", "last_modified", "todo_id"))
+    context.drop_index("ix_todo_workspace_id")
+
+def downgrade(context: MigrationContext) -> None:
+    context.create_index("ix_todo_workspace_id", "todo", ("workspace_id",))
+    context.drop_index("ix_todo_workspace_id_last_modified_todo_id")
+    context.execute("DROP TABLE IF EXISTS todo_tombstone")
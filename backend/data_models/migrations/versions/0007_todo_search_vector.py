@@ -0,0 +1,37 @@
+"""Add the trigger maintained full text search vector of todos and its GIN index."""
+from ..context import MigrationContext
+
+revision = "0007"
+down_revision = "0006"
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+def upgrade(context: MigrationContext) -> None:
+    # a nullable column without a default only changes the catalog, where a stored generated
+    # column would rewrite the whole table under an exclusive lock
+    context.execute("ALTER TABLE todo ADD COLUMN IF NOT EXISTS search_vector TSVECTOR")
+    context.execute(f"""
+        CREATE OR REPLACE FUNCTION todo_search_vector_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := (SELECT {SEARCH_VECTOR} FROM (SELECT NEW.name AS name, NEW.description AS description) AS todo);
+            RETURN NEW;
+        END
+        $$
+    """)
+    context.execute("DROP TRIGGER IF EXISTS todo_search_vector_update ON todo")
+    context.execute(
+        "CREATE TRIGGER todo_search_vector_update BEFORE INSERT OR UPDATE OF name, description ON todo "
+        "FOR EACH ROW EXECUTE FUNCTION todo_search_vector_update()"
+    )
+    # the trigger covers the todos written from here on, the existing ones are filled in batches
+    context.backfill("todo", "todo_id", f"search_vector = {SEARCH_VECTOR}", condition = "search_vector IS NULL")
+    context.create_index("ix_todo_search_vector", "todo", ("search_vector",), using = "gin")
+
+def downgrade(context: MigrationContext) -> None:
+    context.drop_index("ix_todo_search_vector")
+    context.execute("DROP TRIGGER IF EXISTS todo_search_vector_update ON todo")
+    context.execute("DROP FUNCTION IF EXISTS todo_search_vector_update()")
+    context.execute("ALTER TABLE todo DROP COLUMN IF EXISTS search_vector")
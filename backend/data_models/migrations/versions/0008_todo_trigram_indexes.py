@@ -0,0 +1,30 @@
+"""Index the names and descriptions of todos by trigrams for the like, ilike and prefix filters."""
+from util.exceptions import MigrationError
+from ..context import MigrationContext
+
+revision = "0008"
+down_revision = "0007"
+
+TRIGRAM_INDEXES = (
+    ("ix_todo_name_trgm", "name"),
+    ("ix_todo_description_trgm", "description"),
+)
+
+def pg_trgm_available(context: MigrationContext) -> bool:
+    return context.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'").first() is not None
+
+def upgrade(context: MigrationContext) -> None:
+    # failing leaves the database at the previous revision, so that the upgrade can be run again once the
+    # extension is installed instead of the revision being recorded without its indexes
+    if not pg_trgm_available(context):
+        raise MigrationError(
+            f'Revision "{revision}" needs the pg_trgm extension, install the contrib modules of Postgres on the database server.'
+        )
+    context.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES:
+        context.create_index(name, "todo", (f"{column} gin_trgm_ops",), using = "gin")
+
+def downgrade(context: MigrationContext) -> None:
+    # the extension is left installed, other database objects may depend on it
+    for name, _ in TRIGRAM_INDEXES:
+        context.drop_index(name)
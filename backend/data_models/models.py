@@ -1,11 +1,18 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, ForeignKey, ForeignKeyConstraint, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, DDL, Integer, String, Text, DateTime, ForeignKey, ForeignKeyConstraint, Index, Table, event, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import deferred, relationship
+from typing import Any, Final
 from .connection import Base
 
 class WorkSpaceAccountLink(Base):
     __tablename__ = "workspace_account_link"
+    __table_args__ = (
+        Index("ix_workspace_account_link_workspace_id", "workspace_id"),
+    )
+
     user_id = Column(BigInteger, ForeignKey("account.user_id"), primary_key=True)
-    workspace_id = Column(BigInteger, ForeignKey("workspace.workspace_id"), primary_key = True)
+    workspace_id = Column(BigInteger, ForeignKey("workspace.workspace_id", ondelete = "CASCADE"), primary_key = True)
     
     locale_alias = Column(String(255), nullable=True)
 
@@ -21,7 +28,7 @@ class Account(Base):
     password_hash = Column(String(255), nullable=False)
     password_salt = Column(String(255), nullable=False)
 
-    refresh_token = relationship("Login", back_populates="user")
+    refresh_token = relationship("Login", back_populates="user", passive_deletes = True)
     workspaces = relationship("WorkSpaceAccountLink", back_populates = "member")
 
 class Login(Base):
@@ -40,36 +47,137 @@ class WorkSpace(Base):
     workspace_id = Column(BigInteger, primary_key = True)
     workspace_default_name = Column(String(255), nullable=False, unique=True, index = True)
     workspace_owner_id = Column(BigInteger, ForeignKey("account.user_id"))
+    # bumped by every write to the todo lists and todos of the workspace, see versioning
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
 
-    members = relationship("WorkSpaceAccountLink", back_populates = "workspace")
-    todolists = relationship("TodoList", back_populates = "workspace")
-    todos = relationship("Todo", back_populates = "workspace")
+    # the database cascades deletes from a workspace, the children are never loaded to be deleted
+    members = relationship("WorkSpaceAccountLink", back_populates = "workspace", cascade = "all, delete-orphan", passive_deletes = True)
+    todolists = relationship("TodoList", back_populates = "workspace", cascade = "all, delete-orphan", passive_deletes = True)
+    todos = relationship("Todo", back_populates = "workspace", cascade = "all, delete-orphan", passive_deletes = True)
 class TodoList(Base):
     __tablename__ = "todo_list"
+    __table_args__ = (
+        Index("ix_todo_list_workspace_id", "workspace_id"),
+    )
 
     todolist_id = Column(BigInteger, primary_key = True)
     todolist_name = Column(String(255), nullable=False)
     workspace_id = Column(BigInteger, ForeignKey("workspace.workspace_id", ondelete = "CASCADE"))
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
     
     workspace = relationship("WorkSpace", back_populates="todolists")
-    todos = relationship("Todo", back_populates = "todolist")
+    todos = relationship("Todo", back_populates = "todolist", cascade = "all, delete-orphan", passive_deletes = True)
+
+TODO_SEARCH_CONFIG: Final = "english"
+
+TODO_SEARCH_VECTOR: Final = (
+    f"setweight(to_tsvector('{TODO_SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{TODO_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
 
 class Todo(Base):
 
     __tablename__ = "todo"
+    # Todos are listed within a todolist, ordered by one sortable column with todo_id as the
+    # keyset tie breaker. description is left out, its 1000 characters may not fit a btree entry.
+    __table_args__ = (
+        Index("ix_todo_todolist_id_todo_id", "todolist_id", "todo_id"),
+        Index("ix_todo_todolist_id_name_todo_id", "todolist_id", "name", "todo_id"),
+        Index("ix_todo_todolist_id_due_date_todo_id", "todolist_id", "due_date", "todo_id"),
+        Index("ix_todo_todolist_id_status_todo_id", "todolist_id", "status", "todo_id"),
+        Index("ix_todo_todolist_id_priority_todo_id", "todolist_id", "priority", "todo_id"),
+        # the workspace change feed pages through the todos of a workspace by modification time
+        Index("ix_todo_workspace_id_last_modified_todo_id", "workspace_id", "last_modified", "todo_id"),
+        Index("ix_todo_search_vector", "search_vector", postgresql_using = "gin"),
+    )
 
     todo_id = Column(BigInteger, primary_key = True)
     todolist_id = Column(BigInteger, ForeignKey("todo_list.todolist_id", ondelete = "CASCADE"))
     workspace_id = Column(BigInteger, ForeignKey("workspace.workspace_id", ondelete = "CASCADE"))
-    name = Column(String(255), nullable=False, index = True)
-    description = Column(String(1000), nullable=True, index = True)
-    due_date = Column(DateTime, nullable=True, index = True)
-    status = Column(String(255), nullable=True, index = True)
-    priority = Column(String(255), nullable=True, index = True)
+    name = Column(String(255), nullable=False)
+    description = Column(String(1000), nullable=True)
+    due_date = Column(DateTime, nullable=True)
+    status = Column(String(255), nullable=True)
+    priority = Column(String(255), nullable=True)
     last_modified = Column(DateTime, nullable=False)
+    # maintained by a trigger of the database for the todo search, name matches weigh more than description
+    # matches, deferred so that loading a todo does not load its vector
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
 
     todolist = relationship("TodoList", back_populates="todos")
     workspace = relationship("WorkSpace", back_populates="todos")
 
+# a trigger rather than a stored generated column, which could only be added by rewriting the whole table
+event.listen(
+    Todo.__table__,
+    "after_create",
+    DDL(f"""
+        CREATE OR REPLACE FUNCTION todo_search_vector_update() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := (SELECT {TODO_SEARCH_VECTOR} FROM (SELECT NEW.name AS name, NEW.description AS description) AS todo);
+            RETURN NEW;
+        END
+        $$
+    """),
+)
+event.listen(
+    Todo.__table__,
+    "after_create",
+    DDL(
+        "CREATE TRIGGER todo_search_vector_update BEFORE INSERT OR UPDATE OF name, description ON todo "
+        "FOR EACH ROW EXECUTE FUNCTION todo_search_vector_update()"
+    ),
+)
+event.listen(Todo.__table__, "after_drop", DDL("DROP FUNCTION IF EXISTS todo_search_vector_update()"))
+
+# pg_trgm ships with the contrib modules of Postgres, where they are not installed the
+# match filters work without their indexes
+TODO_TRIGRAM_INDEXES: Final = (
+    ("ix_todo_name_trgm", "name"),
+    ("ix_todo_description_trgm", "description"),
+)
+
+def pg_trgm_available(ddl: DDL, target: Any, bind: Connection, **kw: Any) -> bool:
+    """Check whether the pg_trgm extension can be created in the database"""
+
+    return bind.execute(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")).first() is not None
+
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(callable_ = pg_trgm_available))
+for index_name, column_name in TODO_TRIGRAM_INDEXES:
+    event.listen(
+        Todo.__table__,
+        "after_create",
+        DDL(f"CREATE INDEX {index_name} ON todo USING gin ({column_name} gin_trgm_ops)").execute_if(callable_ = pg_trgm_available),
+    )
+
+class TodoTombstone(Base):
+    __tablename__ = "todo_tombstone"
+    # Deleted todos are remembered for the change feed, which pages through them like the todos.
+    __table_args__ = (
+        Index("ix_todo_tombstone_workspace_id_deleted_at_todo_id", "workspace_id", "deleted_at", "todo_id"),
+    )
 
-
+    todo_id = Column(BigInteger, primary_key = True)
+    todolist_id = Column(BigInteger, nullable=False)
+    workspace_id = Column(BigInteger, ForeignKey("workspace.workspace_id", ondelete = "CASCADE"), nullable=False)
+    deleted_at = Column(DateTime, nullable=False)
+
+class Job(Base):
+    __tablename__ = "job"
+    # Workers claim the oldest due job of a status, pending ones by run_after and running ones by an expired lease.
+    __table_args__ = (
+        Index("ix_job_status_run_after", "status", "run_after"),
+    )
+
+    job_id = Column(BigInteger, primary_key = True)
+    kind = Column(String(255), nullable=False)
+    username = Column(String(255), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    status = Column(String(32), nullable=False)
+    attempts = Column(Integer, nullable=False)
+    result = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+    run_after = Column(DateTime, nullable=False)
+    locked_until = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
@@ -0,0 +1,47 @@
+import time
+from typing import Any, Dict, Final
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError # type: ignore
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool # type: ignore
+from util.metrics import Counter, Histogram, metrics_registry
+from util.types import Serializable
+
+POOL_CHECKOUT_WAIT_BUCKETS: Final = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+pool_checkout_wait_seconds: Final = Histogram(POOL_CHECKOUT_WAIT_BUCKETS)
+pool_checkout_timeouts: Final = Counter()
+
+metrics_registry.register(
+    "db_pool_checkout_wait_seconds",
+    "Time waited to check a connection out of the pool.",
+    pool_checkout_wait_seconds,
+)
+metrics_registry.register(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that timed out waiting for a connection.",
+    pool_checkout_timeouts,
+)
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waits for a connection."""
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_checkout_timeouts.inc()
+            raise
+        finally:
+            pool_checkout_wait_seconds.observe(time.perf_counter() - start)
+
+def get_pool_statistics(pool: Pool) -> Dict[str, Serializable]:
+    """Get a snapshot of the live state and checkout waits of a queue pool."""
+
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "checkout_timeouts": pool_checkout_timeouts.value,
+        "checkout_wait_seconds": pool_checkout_wait_seconds.snapshot(),
+    }
@@ -0,0 +1,27 @@
+from typing import Any, Dict, Final
+from .models import Todo
+
+# columns read by the todo listing endpoints, selected as rows instead of hydrated Todo entities
+TODO_COLUMNS: Final = (
+    Todo.todo_id,
+    Todo.todolist_id,
+    Todo.name,
+    Todo.description,
+    Todo.due_date,
+    Todo.priority,
+    Todo.status,
+    Todo.last_modified,
+)
+
+def todo_content(row: Any) -> Dict[str, Any]:
+    """Get the response content of a todo row selected with the todo columns"""
+
+    return {
+        "todo_id": row.todo_id,
+        "todo_name": row.name,
+        "todo_description": row.description,
+        "todo_due_date": row.due_date,
+        "todo_priority": row.priority,
+        "todo_status": row.status,
+        "todo_last_modified": row.last_modified,
+    }
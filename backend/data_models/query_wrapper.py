@@ -1,72 +1,239 @@
+from dataclasses import dataclass
+from typing import Optional
+from sqlalchemy import and_, literal, select # type: ignore
 from sqlalchemy.exc import NoResultFound # type: ignore
-from sqlalchemy.orm import Session # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession # type: ignore
 from util.exceptions import NotFoundError
+from .membership_cache import Membership, MembershipCache, membership_cache as default_membership_cache
 from .models import Account, Login, Todo, TodoList, WorkSpace, WorkSpaceAccountLink
 
+class ResolvedTodoAccess:
+    """Accessors for the todo list and todo an access check was asked to resolve."""
+
+    todolist: Optional[TodoList]
+    todo: Optional[Todo]
+
+    def get_todolist(self) -> TodoList:
+        """Get the resolved todo list, only for a check given a todo list id"""
+
+        if self.todolist is None:
+            raise ValueError("No todo list was resolved by the access check")
+        return self.todolist
+
+    def get_todo(self) -> Todo:
+        """Get the resolved todo, only for a check given a todo id"""
+
+        if self.todo is None:
+            raise ValueError("No todo was resolved by the access check")
+        return self.todo
+
+@dataclass(frozen=True)
+class WorkspaceAccess(ResolvedTodoAccess):
+    """Entities resolved for a user acting inside a workspace."""
+
+    user: Account
+    workspace: WorkSpace
+    membership: WorkSpaceAccountLink
+    todolist: Optional[TodoList] = None
+    todo: Optional[Todo] = None
+
+@dataclass(frozen=True)
+class MemberAccess(ResolvedTodoAccess):
+    """Membership of a user in a workspace with the todo list and todo resolved inside it."""
+
+    membership: Membership
+    todolist: Optional[TodoList] = None
+    todo: Optional[Todo] = None
+
 class QueryWrapper:
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: AsyncSession, membership_cache: MembershipCache = default_membership_cache) -> None:
         self.session = session
+        self.membership_cache = membership_cache
 
-    def check_user_exists_and_get(self, username: str) -> Account:
+    async def check_user_exists_and_get(self, username: str) -> Account:
         """Check if a user exists."""
         try:
-            
-            user: Account = self.session.query(Account).filter(Account.username == username).one()
+            user: Account = (await self.session.execute(select(Account).filter(Account.username == username))).scalar_one()
             return user
         except NoResultFound:
             raise NotFoundError(f'User "{username}" not found.')
 
-    def check_workspace_exists_and_get(self, workspace_default_name: str) -> WorkSpace:
+    async def check_workspace_exists_and_get(self, workspace_default_name: str) -> WorkSpace:
         """Check if a user exists."""
         try:
-            workspace: WorkSpace = self.session.query(WorkSpace).filter(WorkSpace.workspace_default_name == workspace_default_name).one()
+            workspace: WorkSpace = (await self.session.execute(select(WorkSpace).filter(WorkSpace.workspace_default_name == workspace_default_name))).scalar_one()
             return workspace
         except NoResultFound:
             raise NotFoundError(f'Workspace "{workspace_default_name}" not found.')
 
-    def check_todolist_exists_and_get(self, todolist_id: int) -> TodoList:
+    async def check_todolist_exists_and_get(self, todolist_id: int) -> TodoList:
         """Check if a user exists."""
         try:
-            todolist: TodoList = self.session.query(TodoList).filter(TodoList.todolist_id == todolist_id).one()
+            todolist: TodoList = (await self.session.execute(select(TodoList).filter(TodoList.todolist_id == todolist_id))).scalar_one()
             return todolist
         except NoResultFound:
             raise NotFoundError(f'Todo list of id "{todolist_id}" not found.')
 
-    def check_todo_exists_and_get(self, todo_id: int) -> Todo:
+    async def check_todo_exists_and_get(self, todo_id: int) -> Todo:
         """Check if a user exists."""
         try:
-            todo: Todo = self.session.query(Todo).filter(Todo.todo_id == todo_id).one()
+            todo: Todo = (await self.session.execute(select(Todo).filter(Todo.todo_id == todo_id))).scalar_one()
             return todo
         except NoResultFound:
             raise NotFoundError(f'Todo of id "{todo_id}" not found.')
 
-    def check_user_in_workspace_and_get(self, username: str, workspace_default_name: str) -> WorkSpaceAccountLink:
+    async def check_user_in_workspace_and_get(self, username: str, workspace_default_name: str) -> WorkSpaceAccountLink:
         """Check if a user exists."""
         try:
             user: Account = (
-                self.session
-                    .query(WorkSpaceAccountLink)
-                    .join(Account, WorkSpaceAccountLink.user_id == Account.user_id)
-                    .join(WorkSpace, WorkSpaceAccountLink.workspace_id == WorkSpace.workspace_id)
-                    .filter(Account.username == username)
-                    .filter(WorkSpace.workspace_default_name == workspace_default_name)
-                    .one()
-            )
+                await self.session.execute(
+                    select(WorkSpaceAccountLink)
+                        .join(Account, WorkSpaceAccountLink.user_id == Account.user_id)
+                        .join(WorkSpace, WorkSpaceAccountLink.workspace_id == WorkSpace.workspace_id)
+                        .filter(Account.username == username)
+                        .filter(WorkSpace.workspace_default_name == workspace_default_name)
+                )
+            ).scalar_one()
             return user
         except NoResultFound:
             raise NotFoundError(f'User "{username}" has not joined workspace "{workspace_default_name}".')
 
-    def check_user_logined_and_get(self,username: str) -> Login:
+    async def check_user_logined_and_get(self,username: str) -> Login:
         """Check if a user exists."""
         try:
             user: Account = (
-                self.session
-                    .query(Account)
-                    .join(Login, Login.user_id == Account.user_id)
-                    .filter(Account.username == username)
-                    .one()
-            )
+                await self.session.execute(
+                    select(Account)
+                        .join(Login, Login.user_id == Account.user_id)
+                        .filter(Account.username == username)
+                )
+            ).scalar_one()
             return user
         except NoResultFound:
-            raise NotFoundError(f'User "{username}" is not logined.')
\ No newline at end of file
+            raise NotFoundError(f'User "{username}" is not logined.')
+
+    async def check_workspace_access_and_get(
+        self,
+        username: str,
+        workspace_default_name: str,
+        todolist_id: Optional[int] = None,
+        todo_id: Optional[int] = None,
+    ) -> WorkspaceAccess:
+        """Resolve the user, workspace, membership, todo list and todo in one query.
+
+        Every entity is outer joined onto a single-row anchor so that a missing
+        entity comes back as None instead of removing the row, which keeps the
+        not found errors identical to the individual checks above. The todo list
+        is scoped to the workspace and the todo to the todo list.
+        """
+
+        if todo_id is not None and todolist_id is None:
+            raise ValueError("A todo can only be resolved within a todo list")
+
+        anchor = select(literal(1).label("anchor")).subquery()
+        query = (
+            select(Account, WorkSpace, WorkSpaceAccountLink)
+                .select_from(anchor)
+                .outerjoin(Account, Account.username == username)
+                .outerjoin(WorkSpace, WorkSpace.workspace_default_name == workspace_default_name)
+                .outerjoin(
+                    WorkSpaceAccountLink,
+                    and_(
+                        WorkSpaceAccountLink.user_id == Account.user_id,
+                        WorkSpaceAccountLink.workspace_id == WorkSpace.workspace_id,
+                    )
+                )
+        )
+        if todolist_id is not None:
+            query = query.add_columns(TodoList).outerjoin(
+                TodoList,
+                and_(
+                    TodoList.todolist_id == todolist_id,
+                    TodoList.workspace_id == WorkSpace.workspace_id,
+                )
+            )
+        if todo_id is not None:
+            query = query.add_columns(Todo).outerjoin(
+                Todo,
+                and_(
+                    Todo.todo_id == todo_id,
+                    Todo.todolist_id == TodoList.todolist_id,
+                )
+            )
+
+        user, workspace, membership, *rest = (await self.session.execute(query)).one()
+        todolist: Optional[TodoList] = rest[0] if todolist_id is not None else None
+        todo: Optional[Todo] = rest[1] if todo_id is not None else None
+
+        if user is None:
+            raise NotFoundError(f'User "{username}" not found.')
+        if workspace is None:
+            raise NotFoundError(f'Workspace "{workspace_default_name}" not found.')
+        if membership is None:
+            raise NotFoundError(f'User "{username}" has not joined workspace "{workspace_default_name}".')
+        if todolist_id is not None and todolist is None:
+            raise NotFoundError(f'Todo list of id "{todolist_id}" not found.')
+        if todo_id is not None and todo is None:
+            raise NotFoundError(f'Todo of id "{todo_id}" not found.')
+
+        return WorkspaceAccess(user, workspace, membership, todolist, todo)
+
+
+    async def check_member_access_and_get(
+        self,
+        username: str,
+        workspace_default_name: str,
+        todolist_id: Optional[int] = None,
+        todo_id: Optional[int] = None,
+        fresh: bool = False,
+    ) -> MemberAccess:
+        """Resolve the membership through the membership cache, and the todo list and todo within the workspace.
+
+        A cached membership leaves only the primary key lookups of the todo list
+        and todo, otherwise the full access check runs and its membership is cached.
+        The memory cache is only invalidated in the process handling a leave, so
+        a cached membership may be stale for up to the cache ttl. Routes that
+        write pass ``fresh`` to check the membership against the database.
+        """
+
+        membership = None if fresh else await self.membership_cache.get(username, workspace_default_name)
+        if membership is None:
+            try:
+                access = await self.check_workspace_access_and_get(username, workspace_default_name, todolist_id, todo_id)
+            except NotFoundError:
+                if fresh:
+                    await self.membership_cache.invalidate(username, workspace_default_name)
+                raise
+            membership = Membership(access.user.user_id, access.workspace.workspace_id)
+            await self.membership_cache.set(username, workspace_default_name, membership)
+            return MemberAccess(membership, access.todolist, access.todo)
+
+        if todo_id is not None and todolist_id is None:
+            raise ValueError("A todo can only be resolved within a todo list")
+        if todolist_id is None:
+            return MemberAccess(membership)
+
+        query = (
+            select(TodoList)
+                .filter(TodoList.todolist_id == todolist_id)
+                .filter(TodoList.workspace_id == membership.workspace_id)
+        )
+        if todo_id is not None:
+            query = query.add_columns(Todo).outerjoin(
+                Todo,
+                and_(
+                    Todo.todo_id == todo_id,
+                    Todo.todolist_id == TodoList.todolist_id,
+                )
+            )
+
+        row = (await self.session.execute(query)).first()
+        if row is None:
+            raise NotFoundError(f'Todo list of id "{todolist_id}" not found.')
+        todolist, *rest = row
+        todo: Optional[Todo] = rest[0] if todo_id is not None else None
+        if todo_id is not None and todo is None:
+            raise NotFoundError(f'Todo of id "{todo_id}" not found.')
+
+        return MemberAccess(membership, todolist, todo)
\ No newline at end of file
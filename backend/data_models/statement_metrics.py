@@ -0,0 +1,31 @@
+import time
+from typing import Any, Final
+from sqlalchemy import event # type: ignore
+from sqlalchemy.engine import Engine # type: ignore
+from util.metrics import HistogramFamily, current_route, metrics_registry
+
+STATEMENT_DURATION_BUCKETS: Final = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+statement_duration_seconds: Final = HistogramFamily(("route",), STATEMENT_DURATION_BUCKETS)
+
+metrics_registry.register(
+    "db_statement_duration_seconds",
+    "Execution time of the SQL statements by the route template of the request issuing them.",
+    statement_duration_seconds,
+)
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    context._statement_start = time.perf_counter()
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    statement_duration_seconds.labels(current_route()).observe(time.perf_counter() - context._statement_start)
+
+def instrument_statements(engine: Engine) -> None:
+    """Record the execution time of every statement the engine runs, by the route issuing it.
+
+    The start time is kept on the execution context of the statement, a
+    statement that fails is not recorded and leaves nothing behind.
+    """
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
\ No newline at end of file
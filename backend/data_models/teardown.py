@@ -0,0 +1,58 @@
+from typing import Any, Dict, Final
+from sqlalchemy import delete, select # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession # type: ignore
+from util.types import Serializable
+from .connection import AsyncDatabaseConnection
+from .jobs import job_runner
+from .models import Todo, WorkSpace
+
+DEFAULT_DELETE_CHUNK_SIZE: Final = 5000
+
+async def has_more_todos_than(session: AsyncSession, workspace_id: int, todo_count: int) -> bool:
+    """Check whether a workspace has more todos than the given count without counting all of them"""
+
+    return (await session.execute(
+        select(Todo.todo_id)
+            .filter(Todo.workspace_id == workspace_id)
+            .offset(todo_count)
+            .limit(1)
+    )).first() is not None
+
+async def delete_workspace_in_chunks(workspace_id: int, chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE) -> int:
+    """Delete the todos of a workspace a chunk per transaction and then the workspace itself.
+
+    Every transaction only locks one chunk of todos, so other workspaces are
+    not held up by the teardown of a huge one. The database cascades the
+    final delete to the remaining todo lists and memberships. Returns the
+    number of deleted todos.
+    """
+
+    deleted = 0
+    while True:
+        async with AsyncDatabaseConnection() as session:
+            chunk = (
+                select(Todo.todo_id)
+                    .filter(Todo.workspace_id == workspace_id)
+                    .limit(chunk_size)
+                    .scalar_subquery()
+            )
+            result = await session.execute(
+                delete(Todo)
+                    .where(Todo.todo_id.in_(chunk))
+                    .execution_options(synchronize_session = False)
+            )
+            await session.commit()
+        deleted += result.rowcount
+        if result.rowcount < chunk_size:
+            break
+
+    async with AsyncDatabaseConnection() as session:
+        await session.execute(delete(WorkSpace).filter(WorkSpace.workspace_id == workspace_id))
+        await session.commit()
+    return deleted
+
+@job_runner.register("delete_workspace")
+async def delete_workspace_job(payload: Dict[str, Any]) -> Serializable:
+    """Job deleting a workspace in chunks, retrying it resumes where the previous attempt stopped"""
+
+    return {"deleted_todos": await delete_workspace_in_chunks(payload["workspace_id"], payload["chunk_size"])}
\ No newline at end of file
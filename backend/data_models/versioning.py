@@ -0,0 +1,27 @@
+from typing import Iterable, Optional
+from sqlalchemy import update # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession # type: ignore
+from .models import TodoList, WorkSpace
+
+async def bump_versions(session: AsyncSession, workspace_id: int, todolist_ids: Optional[Iterable[int]] = None) -> None:
+    """Bump the version of a workspace and of the given todo lists in the transaction of the session.
+
+    Every write to todo lists or todos has to bump the versions of what it
+    changed, the listing endpoints derive their ETags and cached bodies from
+    them. The workspace listing holds the todo list names as well as the todos.
+    """
+
+    await session.execute(
+        update(WorkSpace)
+            .where(WorkSpace.workspace_id == workspace_id)
+            .values(version = WorkSpace.version + 1)
+            .execution_options(synchronize_session = False)
+    )
+    todolist_ids = list(todolist_ids or [])
+    if todolist_ids:
+        await session.execute(
+            update(TodoList)
+                .where(TodoList.todolist_id.in_(todolist_ids))
+                .values(version = TodoList.version + 1)
+                .execution_options(synchronize_session = False)
+        )
\ No newline at end of file
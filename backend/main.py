@@ -4,12 +4,17 @@ from config.project_config import BACKEND_CONFIG
 from config.version_config import __version__
 from fastapi import FastAPI, status, Request
 from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from util.exceptions import InvalidTokenError, TokenExpiredError, UnauthorizedError, NotFoundError, InternalServerError, InvalidCredentialsError
+from util.exceptions import InvalidTokenError, TokenExpiredError, UnauthorizedError
+from util.middleware import ErrorEnvelopeMiddleware, RequestMetricsMiddleware
 from routes import router
+from routes.metrics import router as metrics_router
+from data_models import AsyncEngine
+from data_models.jobs import job_runner
 
-app = FastAPI(title="SleekFlow TODOs API Coding Test", version=__version__)
+app = FastAPI(title="SleekFlow TODOs API Coding Test", version=__version__, default_response_class=ORJSONResponse)
 
 #TODO: Change the origins to the frontend URL which is specified in config file
 app.add_middleware(
@@ -21,63 +26,57 @@ app.add_middleware(
 )
 
 app.include_router(router, prefix = "/api")
+# served outside of /api where scrapers look for it by default
+app.include_router(metrics_router, tags=["metrics"])
+
+@app.on_event("startup")
+async def start_job_runner() -> None:
+    # The first connection initializes the dialect behind a thread lock in SQLAlchemy 1.4,
+    # coroutines opening their first connections concurrently would deadlock the event loop on it.
+    async with AsyncEngine.connect():
+        pass
+    await job_runner.start()
+
+@app.on_event("shutdown")
+async def dispose_database_engine() -> None:
+    await job_runner.stop()
+    await AsyncEngine.dispose()
 
 @app.exception_handler(RequestValidationError)
 async def handle_validation_error(request: Request, exc: RequestValidationError) -> JSONResponse:
-    return JSONResponse(
+    return EnvelopeResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "ValidationError",
-            "error_msg": str(exc),
-            "data": None,
-            "msg": None,
-        },
+        error="ValidationError",
+        error_msg=str(exc),
+    )
+
+@app.exception_handler(UnauthorizedError)
+async def handle_unauthorized_error(request: Request, exc: UnauthorizedError) -> JSONResponse:
+    return EnvelopeResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        error=UnauthorizedError.__name__,
+        error_msg="Unauthorized action.",
+    )
+
+@app.exception_handler(TokenExpiredError)
+async def handle_token_expired_error(request: Request, exc: TokenExpiredError) -> JSONResponse:
+    return EnvelopeResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        error=TokenExpiredError.__name__,
+        error_msg="Token has expired.",
+    )
+
+@app.exception_handler(InvalidTokenError)
+async def handle_invalid_token_error(request: Request, exc: InvalidTokenError) -> JSONResponse:
+    return EnvelopeResponse(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        error=InvalidTokenError.__name__,
+        error_msg="Invalid token.",
     )
 
-@app.middleware("http")
-async def error_handler(request: Request, call_next) -> JSONResponse:
-    try:
-        return await call_next(request)
-    except UnauthorizedError as e:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={
-                "error": UnauthorizedError.__name__,
-                "error_msg": "Unauthorized action.",
-                "data": None,
-                "msg": None,
-            },
-        )
-    except TokenExpiredError as e:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={
-                "error": TokenExpiredError.__name__,
-                "error_msg": "Token has expired.",
-                "data": None,
-                "msg": None,
-            },
-        )
-    except InvalidTokenError as e:
-        return JSONResponse(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            content={
-                "error": InvalidTokenError.__name__,
-                "error_msg": "Invalid token.",
-                "data": None,
-                "msg": None,
-            },
-        )
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": InternalServerError.__name__,
-                "error_msg": str(e),
-                "data": None,
-                "msg": None,
-            },
-        )
+# Plain ASGI middlewares, the last one added runs first: the metrics see the status of the error envelopes.
+app.add_middleware(ErrorEnvelopeMiddleware)
+app.add_middleware(RequestMetricsMiddleware, routes=app.routes)
 
 if __name__ == "__main__":
     uvloop.install()
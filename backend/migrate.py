@@ -0,0 +1,44 @@
+import argparse
+from typing import List, Optional
+from data_models.migrations import Migrator
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Manage the database schema through the migration revisions"""
+
+    parser = argparse.ArgumentParser(description = "Manage the database schema.")
+    subparsers = parser.add_subparsers(dest = "command", required = True)
+
+    upgrade_parser = subparsers.add_parser("upgrade", help = "apply the revisions up to the target")
+    upgrade_parser.add_argument("target", nargs = "?", default = "head")
+    upgrade_parser.add_argument("--online", action = "store_true", help = "build indexes concurrently and commit each statement")
+
+    downgrade_parser = subparsers.add_parser("downgrade", help = "revert the revisions down to the target")
+    downgrade_parser.add_argument("target")
+    downgrade_parser.add_argument("--online", action = "store_true", help = "drop indexes concurrently and commit each statement")
+
+    stamp_parser = subparsers.add_parser("stamp", help = "record the target as applied without running it")
+    stamp_parser.add_argument("target", nargs = "?", default = "head")
+
+    subparsers.add_parser("current", help = "show the revision of the database")
+    subparsers.add_parser("history", help = "list the revisions")
+
+    args = parser.parse_args(argv)
+    migrator = Migrator()
+    match args.command:
+        case "upgrade":
+            for revision in migrator.upgrade(args.target, online = args.online):
+                print(f"Upgraded to {revision}")
+        case "downgrade":
+            for revision in migrator.downgrade(args.target, online = args.online):
+                print(f"Reverted {revision}")
+        case "stamp":
+            migrator.stamp(args.target)
+            print(f"Stamped {args.target}")
+        case "current":
+            print(migrator.current() or "base")
+        case "history":
+            for entry in migrator.revisions:
+                print(f"{entry.down_revision or 'base'} -> {entry.revision}: {entry.description}")
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from .workspace import router as workspace_router
 from .todolist import router as todolist_router
 from .todo import router as todo_router
 from .refresh import router as refresh_router
+from .jobs import router as jobs_router
 
 router = APIRouter()
 router.include_router(healthcheck_router, prefix="/healthcheck", tags=["healthcheck"])
@@ -16,4 +17,4 @@ router.include_router(refresh_router, prefix="/refresh", tags=["refresh"])
 router.include_router(workspace_router, prefix="/workspace", tags=["workspace"])
 router.include_router(todolist_router, prefix="/workspace/todolist", tags=["todolist"])
 router.include_router(todo_router, prefix="/workspace/todolist/todo", tags=["todo"])
-
+router.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
@@ -1,17 +1,78 @@
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse, response_body_cache
+from data_models import AsyncEngine
+from data_models.pool import get_pool_statistics
+from data_models.membership_cache import membership_cache
+from util.helper.auth import token_cache
+from util.middleware import request_duration_seconds, requests_total
 router = APIRouter()
 
 @router.get("/")
 async def healthcheck() -> JSONResponse:
     """Healthcheck endpoint."""
     
-    return JSONResponse(
-        content = {
-            "msg": "OK",
-            "data": None,
-            "error": None,
-            "error_msg": None,
-        },
-        status_code=status.HTTP_200_OK
+    return EnvelopeResponse(
+        status_code=status.HTTP_200_OK,
+        msg="OK",
+    )
+
+@router.get("/pool/")
+async def pool_statistics() -> JSONResponse:
+    """Live statistics of the database connection pool."""
+
+    return EnvelopeResponse(
+        status_code=status.HTTP_200_OK,
+        data=get_pool_statistics(AsyncEngine.sync_engine.pool),
+        msg="OK",
+    )
+
+@router.get("/token-cache/")
+async def token_cache_statistics() -> JSONResponse:
+    """Size and hit rate of the verified access token cache."""
+
+    return EnvelopeResponse(
+        status_code=status.HTTP_200_OK,
+        data=token_cache.statistics(),
+        msg="OK",
+    )
+
+@router.get("/membership-cache/")
+async def membership_cache_statistics() -> JSONResponse:
+    """Size and hit rate of the workspace membership cache."""
+
+    return EnvelopeResponse(
+        status_code=status.HTTP_200_OK,
+        data=membership_cache.statistics(),
+        msg="OK",
+    )
+
+@router.get("/response-cache/")
+async def response_cache_statistics() -> JSONResponse:
+    """Size and hit rate of the rendered listing body cache."""
+
+    return EnvelopeResponse(
+        status_code=status.HTTP_200_OK,
+        data=response_body_cache.statistics(),
+        msg="OK",
+    )
+
+@router.get("/requests/")
+async def request_statistics() -> JSONResponse:
+    """Count and latency of the requests by method, route template and status."""
+
+    counts = dict(requests_total.collect())
+    return EnvelopeResponse(
+        status_code=status.HTTP_200_OK,
+        data=[
+            {
+                "method": method,
+                "route": route,
+                "status": int(status_code),
+                "count": counts[(method, route, status_code)].value,
+                "duration_seconds": histogram.snapshot(),
+            }
+            for (method, route, status_code), histogram in request_duration_seconds.collect()
+        ],
+        msg="OK",
     )
\ No newline at end of file
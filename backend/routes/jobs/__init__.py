@@ -0,0 +1 @@
+from .jobs import router
\ No newline at end of file
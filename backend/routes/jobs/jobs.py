@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse
+from sqlalchemy import select # type: ignore
+
+from data_models import AsyncDatabaseConnection
+from data_models.models import Job
+from util.helper.auth import auth_check
+from util.exceptions import NotFoundError
+
+router = APIRouter()
+
+@router.get("/{job_id}/")
+async def get_job(request: Request, job_id: int, username: str) -> JSONResponse:
+    """Get the status of a job enqueued by the user."""
+
+    try:
+        auth_check(request.headers.get("Authorization"), "username", username)
+
+        async with AsyncDatabaseConnection() as session:
+            job = (await session.execute(
+                select(
+                    Job.job_id,
+                    Job.kind,
+                    Job.status,
+                    Job.attempts,
+                    Job.result,
+                    Job.error,
+                    Job.created_at,
+                    Job.updated_at,
+                )
+                    .filter(Job.job_id == job_id)
+                    .filter(Job.username == username)
+            )).first()
+            if job is None:
+                raise NotFoundError(f"Job of id {job_id} not found.")
+
+        return EnvelopeResponse(
+            status_code=status.HTTP_200_OK,
+            data=dict(job._mapping),
+            msg=f'Get job of id "{job_id}" successfully.',
+        )
+    except NotFoundError as e:
+        return EnvelopeResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error=NotFoundError.__name__,
+            error_msg=f'Job of id "{job_id}" not found.',
+        )
\ No newline at end of file
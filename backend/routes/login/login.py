@@ -1,9 +1,11 @@
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse
 from .schema import LoginModel
-from util.helper.string import StringHashFactory, is_email_format
+from util.helper.string import StringHashFactory, is_email_format, password_hasher
+from sqlalchemy import select # type: ignore
 from sqlalchemy.exc import NoResultFound # type: ignore
-from data_models import DatabaseConnection
+from data_models import AsyncDatabaseConnection
 from data_models.models import Account, Login
 from util.exceptions import InvalidCredentialsError
 from util.helper.auth import JWTHandler, RefreshTokenHandler
@@ -16,33 +18,41 @@ refresh_token_handler = RefreshTokenHandler()
 hasher = StringHashFactory().get_hasher("blake2b")
 
 @router.post("/")
-def validate_user_login(user_login: LoginModel) -> JSONResponse:
+async def validate_user_login(user_login: LoginModel) -> JSONResponse:
     """Validate a user login."""
     
     try:
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             
             user: Account
             if is_email_format(user_login.input_field):
                 user = (
-                    session
-                        .query(Account)
-                        .filter_by(
-                            email=user_login.input_field
-                        ).one()
-                )
+                    await session.execute(
+                        select(Account)
+                            .filter_by(
+                                email=user_login.input_field
+                            )
+                    )
+                ).scalar_one()
             else:
                 user = (
-                    session
-                        .query(Account)
-                        .filter_by(
-                            username=user_login.input_field
-                        ).one()
-                )
+                    await session.execute(
+                        select(Account)
+                            .filter_by(
+                                username=user_login.input_field
+                            )
+                    )
+                ).scalar_one()
             
-            if not hasher.verify(string=user_login.password, salt=user.password_salt, hash=user.password_hash):
+            # give the connection back to the pool while the password is hashed
+            await session.commit()
+            if not await password_hasher.verify(string=user_login.password, salt=user.password_salt, hash=user.password_hash):
                 raise InvalidCredentialsError("Invalid credentials.")
 
+            if password_hasher.needs_rehash(user.password_hash):
+                user.password_salt = password_hasher.create_salt()
+                user.password_hash = await password_hasher.hash(string=user_login.password, salt=user.password_salt)
+
             access_token = jwt_handler.create_token(username = user.username)
             refresh_token = refresh_token_handler.create_token()
             refresh_token_salt = refresh_token_handler.create_salt()
@@ -50,7 +60,7 @@ def validate_user_login(user_login: LoginModel) -> JSONResponse:
             refresh_token_expiry = refresh_token_handler.get_expiry_time()
 
             user_login_info: Login
-            user_login_info = session.query(Login).filter_by(user_id=user.user_id).one_or_none()
+            user_login_info = (await session.execute(select(Login).filter_by(user_id=user.user_id))).scalar_one_or_none()
             if user_login_info is None:
                 user_login_info = Login(user_id=user.user_id, refresh_token_hash=refresh_token_hash, refresh_token_salt = refresh_token_salt, expiry_date=refresh_token_expiry)
                 session.add(user_login_info)
@@ -58,30 +68,22 @@ def validate_user_login(user_login: LoginModel) -> JSONResponse:
                 user_login_info.refresh_token_hash = refresh_token_hash
                 user_login_info.refresh_token_salt = refresh_token_salt
                 user_login_info.expiry_date = refresh_token_expiry
-            session.commit()
+            await session.commit()
 
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_201_CREATED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": {
-                    "access_token": access_token,
-                    "refresh_token": refresh_token,
-                    "type": "Bearer",
-                    "expires_in": jwt_handler.get_expiry_timestamp(access_token),
-                },
-                "msg": 'Login successful.',
-            }
+            data={
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "type": "Bearer",
+                "expires_in": jwt_handler.get_expiry_timestamp(access_token),
+            },
+            msg='Login successful.',
         )
 
     except (NoResultFound, InvalidCredentialsError) as e:
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": InvalidCredentialsError.__name__,
-                "error_msg": "Invalid credentials.",
-                "data": None,
-                "msg": None,
-            }
+            error=InvalidCredentialsError.__name__,
+            error_msg="Invalid credentials.",
         )
\ No newline at end of file
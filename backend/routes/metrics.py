@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from util.metrics import EXPOSITION_CONTENT_TYPE, metrics_registry
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Every metric of the service in the Prometheus text exposition format."""
+
+    return PlainTextResponse(metrics_registry.render(), media_type=EXPOSITION_CONTENT_TYPE)
\ No newline at end of file
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse
 from datetime import datetime
 
 from .schema import RefreshModel
 from util.helper.string import StringHashFactory
+from sqlalchemy import select # type: ignore
 from sqlalchemy.exc import NoResultFound # type: ignore
-from data_models import DatabaseConnection
+from data_models import AsyncDatabaseConnection
 from data_models.models import Account, Login
 from util.exceptions import NotFoundError, UnauthorizedError, TokenExpiredError, InvalidTokenError
 from util.helper.string import StringHashFactory
@@ -19,17 +21,17 @@ jwt_handler = JWTHandler()
 refresh_token_handler = RefreshTokenHandler()
 
 @router.post("/")
-def refresh_refresh_access_tokens(refresh_model: RefreshModel) -> JSONResponse:
+async def refresh_refresh_access_tokens(refresh_model: RefreshModel) -> JSONResponse:
     """Refresh the refresh and access tokens"""
     try:
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             try:
-                user: Account = session.query(Account).filter(Account.username == refresh_model.username).one()
+                user: Account = (await session.execute(select(Account).filter(Account.username == refresh_model.username))).scalar_one()
             except NoResultFound:
                 raise NotFoundError(f'User "{refresh_model.username}" not found.')
             
             try:
-                user_login_info: Login = session.query(Login).filter(Login.user_id == user.user_id).one()
+                user_login_info: Login = (await session.execute(select(Login).filter(Login.user_id == user.user_id))).scalar_one()
             except NoResultFound:
                 raise UnauthorizedError("Unauthorized action.")
             
@@ -49,30 +51,22 @@ def refresh_refresh_access_tokens(refresh_model: RefreshModel) -> JSONResponse:
             user_login_info.refresh_token_salt = refresh_token_salt
             user_login_info.expiry_date = refresh_token_expiry
 
-            session.commit()
+            await session.commit()
             
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_201_CREATED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": {
-                    "access_token": access_token,
-                    "refresh_token": refresh_token,
-                    "type": "Bearer",
-                    "expires_in": jwt_handler.get_expiry_timestamp(access_token),
-                },
-                "msg": "Refreshed access and refresh tokens.",
-            }
+            data={
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "type": "Bearer",
+                "expires_in": jwt_handler.get_expiry_timestamp(access_token),
+            },
+            msg="Refreshed access and refresh tokens.",
         )
     except NotFoundError as e:
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_404_NOT_FOUND,
-            content={
-                "error": NotFoundError.__name__,
-                "error_msg": f'User "{refresh_model.username}" not found.',
-                "data": None,
-                "msg": None,
-            }
+            error=NotFoundError.__name__,
+            error_msg=f'User "{refresh_model.username}" not found.',
         )
     
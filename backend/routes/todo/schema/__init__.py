@@ -1,3 +1,7 @@
 from .create_todo_model import CreateTodoModel
 from .change_todo_model import ChangeTodoModel
-from .delete_todo_model import DeleteTodoModel
\ No newline at end of file
+from .delete_todo_model import DeleteTodoModel
+from .bulk_create_todo_model import BulkCreateTodoModel, BulkCreateTodoItemModel, BULK_CREATE_TODO_LIMIT
+from .bulk_select_todo_model import BulkSelectTodoModel, BULK_TODO_IDS_LIMIT
+from .bulk_delete_todo_model import BulkDeleteTodoModel
+from .bulk_change_todo_model import BulkChangeTodoModel
\ No newline at end of file
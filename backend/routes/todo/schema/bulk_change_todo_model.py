@@ -0,0 +1,23 @@
+from .bulk_select_todo_model import BulkSelectTodoModel
+from pydantic import root_validator
+from datetime import datetime, date
+from typing import Any, Dict, Optional, Union
+
+class BulkChangeTodoModel(BulkSelectTodoModel):
+    """Change the same fields of every selected todo"""
+
+    todo_name: Optional[str] = None
+    todo_description: Optional[str] = None
+    todo_due_date: Optional[Union[datetime, date]] = None
+    todo_status: Optional[str] = None
+    todo_priority: Optional[str] = None
+
+    @root_validator(skip_on_failure = True)
+    def fields_must_be_changed(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate that at least one field is changed"""
+        if not any(values.get(field) for field in ("todo_name", "todo_description", "todo_due_date", "todo_status", "todo_priority")):
+            raise ValueError("At least one field of the todos must be changed!")
+        return values
+    
+    def get_last_modified(self) -> datetime:
+        return datetime.now()
\ No newline at end of file
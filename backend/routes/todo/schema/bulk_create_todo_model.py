@@ -0,0 +1,32 @@
+from ...base_schema import AuthModel
+from pydantic import BaseModel, conlist
+from datetime import datetime, date
+from typing import Final, Optional, Union
+
+BULK_CREATE_TODO_LIMIT: Final = 1000
+
+class BulkCreateTodoItemModel(BaseModel):
+    """A todo to be created by a bulk request"""
+
+    todolist_id: int
+    todo_name: str
+    todo_description: Optional[str] = None
+    todo_due_date: Optional[Union[datetime, date]] = None
+    todo_status: Optional[str] = None
+    todo_priority: Optional[str] = None
+
+class BulkCreateTodoModel(AuthModel):
+    """Create up to BULK_CREATE_TODO_LIMIT todos of a workspace at once"""
+
+    username: str 
+    workspace_default_name: str
+    todos: conlist(BulkCreateTodoItemModel, min_items = 1, max_items = BULK_CREATE_TODO_LIMIT) # type: ignore
+    
+    def get_auth_user(self) -> str:
+        return self.username
+    
+    def get_last_modified(self) -> datetime:
+        return datetime.now()
+    
+    class Config:
+        orm_mode = True
\ No newline at end of file
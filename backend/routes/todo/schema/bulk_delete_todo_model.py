@@ -0,0 +1,4 @@
+from .bulk_select_todo_model import BulkSelectTodoModel
+
+class BulkDeleteTodoModel(BulkSelectTodoModel):
+    """Delete every selected todo"""
\ No newline at end of file
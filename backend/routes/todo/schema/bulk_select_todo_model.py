@@ -0,0 +1,33 @@
+from ...base_schema import AuthModel
+from pydantic import conlist, constr, root_validator
+from typing import Any, Dict, Final, List, Literal, Optional
+from data_models.filter_handler import FILTER_SPEC_REGEX
+
+BULK_TODO_IDS_LIMIT: Final = 1000
+
+TodoFilterField = Literal["name", "description", "due_date", "priority", "status"]
+
+class BulkSelectTodoModel(AuthModel):
+    """Select the todos of a todo list by ids, by filters or both.
+
+    An empty filter mapping selects every todo of the todo list.
+    """
+
+    username: str 
+    workspace_default_name: str
+    todolist_id: int
+    todo_ids: Optional[conlist(int, max_items = BULK_TODO_IDS_LIMIT)] = None # type: ignore
+    filters: Optional[Dict[TodoFilterField, List[constr(regex = FILTER_SPEC_REGEX)]]] = None # type: ignore
+
+    @root_validator(skip_on_failure = True)
+    def todos_must_be_selected(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate that the todos are selected by ids or filters"""
+        if values.get("todo_ids") is None and values.get("filters") is None:
+            raise ValueError("Todo ids or filters must be given!")
+        return values
+    
+    def get_auth_user(self) -> str:
+        return self.username
+    
+    class Config:
+        orm_mode = True
\ No newline at end of file
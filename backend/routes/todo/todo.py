@@ -1,36 +1,47 @@
 from fastapi import APIRouter, Request, status
 from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse
 
-from util.exceptions import NotFoundError
-from data_models import DatabaseConnection
-from data_models.models import Todo
-from .schema import CreateTodoModel, ChangeTodoModel
+from sqlalchemy import and_, func, insert, select, update # type: ignore
+from util.exceptions import InvalidFilterError, NotFoundError
+from data_models import AsyncDatabaseConnection
+from data_models.models import Todo, TodoList
+from data_models.filter_handler import FilterHandlerFactory
+from data_models.versioning import bump_versions
+from data_models.change_feed import delete_todos
+from .schema import CreateTodoModel, ChangeTodoModel, BulkCreateTodoModel, BulkCreateTodoItemModel, BulkChangeTodoModel, BulkDeleteTodoModel, BulkSelectTodoModel
 from util.helper.string import StringHashFactory
 from util.helper.auth import auth_check
-from typing import Final
+from util.types import Serializable
+from typing import Any, Dict, Final, List, Mapping, Optional, Sequence, Set, Union, cast
 from data_models.query_wrapper import QueryWrapper
 
 router = APIRouter()
 hasher: Final = StringHashFactory().get_hasher("blake2b")
 
+todo_filter_handler: Final = FilterHandlerFactory().get_handler("Todo")
+
 @router.post("/")
-def create_todo(request: Request, create_model: CreateTodoModel) -> JSONResponse:
+async def create_todo(request: Request, create_model: CreateTodoModel) -> JSONResponse:
     """Create a todo."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", create_model.get_auth_user())
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
 
             query_wrapper = QueryWrapper(session)
-            query_wrapper.check_user_exists_and_get(create_model.username)
-            workspace = query_wrapper.check_workspace_exists_and_get(create_model.workspace_default_name)
-            query_wrapper.check_user_in_workspace_and_get(create_model.username, create_model.workspace_default_name)
-            todolist = query_wrapper.check_todolist_exists_and_get(create_model.todolist_id)
+            access = await query_wrapper.check_member_access_and_get(
+                create_model.username,
+                create_model.workspace_default_name,
+                todolist_id = create_model.todolist_id,
+                fresh = True,
+            )
+            todolist = access.get_todolist()
 
             new_todo = Todo(
                 todolist_id = todolist.todolist_id,
-                workspace_id = workspace.workspace_id,
+                workspace_id = todolist.workspace_id,
                 name = create_model.todo_name,
                 description = create_model.todo_description,
                 due_date = create_model.todo_due_date,
@@ -39,74 +50,177 @@ def create_todo(request: Request, create_model: CreateTodoModel) -> JSONResponse
                 last_modified = create_model.get_last_modified()
             )
             session.add(new_todo)
-            session.commit()
-        return JSONResponse(
+            await bump_versions(session, todolist.workspace_id, [todolist.todolist_id])
+            await session.commit()
+        return EnvelopeResponse(
             status_code=status.HTTP_201_CREATED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": new_todo.todo_id,
-                "msg":  f'Todo "{create_model.todo_name}" in todo list "{todolist.todolist_name}" in workspace "{workspace.workspace_default_name}" created successfully.',
-            },
+            data=new_todo.todo_id,
+            msg=f'Todo "{create_model.todo_name}" in todo list "{todolist.todolist_name}" in workspace "{create_model.workspace_default_name}" created successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{create_model.workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{create_model.workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{create_model.username}" has not joined workspace "{create_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{create_model.username}" has not joined workspace "{create_model.workspace_default_name}".',
             )
         elif "User" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{create_model.username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{create_model.username}" not found.',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo list of id "{create_model.todolist_id}" is not found in workspace "{create_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{create_model.todolist_id}" is not found in workspace "{create_model.workspace_default_name}".',
+            )
+
+def todo_length_error(model: Union[BulkCreateTodoItemModel, BulkChangeTodoModel]) -> Optional[str]:
+    """Check the text fields of a todo against the column lengths"""
+
+    for field, column in (
+        ("todo_name", Todo.name),
+        ("todo_description", Todo.description),
+        ("todo_status", Todo.status),
+        ("todo_priority", Todo.priority),
+    ):
+        value = getattr(model, field)
+        if value is not None and len(value) > column.type.length:
+            return f'Field "{field}" is longer than {column.type.length} characters.'
+    return None
+
+def bulk_item_error(item: BulkCreateTodoItemModel, todolist_ids: Set[int], workspace_default_name: str) -> Optional[str]:
+    """Check an item of a bulk request against the todo lists of the workspace and the column lengths"""
+
+    if item.todolist_id not in todolist_ids:
+        return f'Todo list of id "{item.todolist_id}" is not found in workspace "{workspace_default_name}".'
+    return todo_length_error(item)
+
+def selected_todos(bulk_model: BulkSelectTodoModel, todolist_id: int) -> Any:
+    """Get the predicate of the todos selected by a bulk request within a todo list"""
+
+    predicates = [Todo.todolist_id == todolist_id]
+    if bulk_model.todo_ids is not None:
+        predicates.append(Todo.todo_id.in_(bulk_model.todo_ids))
+    # the field names are a Literal subset of str, which the invariant Mapping keys do not accept
+    filter_predicate = todo_filter_handler.compile_filters(cast(Mapping[str, Sequence[str]], bulk_model.filters or {}))
+    if filter_predicate is not None:
+        predicates.append(filter_predicate)
+    return and_(*predicates)
+
+@router.post("/bulk/")
+async def bulk_create_todos(request: Request, bulk_model: BulkCreateTodoModel) -> JSONResponse:
+    """Create many todos of a workspace with a single insert.
+
+    Invalid items are reported in place and do not prevent the others from being created.
+    """
+    
+    try:
+        auth_check(request.headers.get("Authorization"), "username", bulk_model.get_auth_user())
+
+        async with AsyncDatabaseConnection() as session:
+
+            query_wrapper = QueryWrapper(session)
+            membership = (await query_wrapper.check_member_access_and_get(
+                bulk_model.username,
+                bulk_model.workspace_default_name,
+                fresh = True,
+            )).membership
+
+            requested_todolist_ids = {item.todolist_id for item in bulk_model.todos}
+            todolist_ids = set((await session.execute(
+                select(TodoList.todolist_id)
+                    .filter(TodoList.workspace_id == membership.workspace_id)
+                    .filter(TodoList.todolist_id.in_(requested_todolist_ids))
+            )).scalars().all())
+
+            results: List[Dict[str, Serializable]] = []
+            rows = []
+            last_modified = bulk_model.get_last_modified()
+            for index, item in enumerate(bulk_model.todos):
+                error_msg = bulk_item_error(item, todolist_ids, bulk_model.workspace_default_name)
+                results.append({"index": index, "todo_id": None, "error_msg": error_msg})
+                if error_msg is None:
+                    rows.append({
+                        "todolist_id": item.todolist_id,
+                        "workspace_id": membership.workspace_id,
+                        "name": item.todo_name,
+                        "description": item.todo_description,
+                        "due_date": item.todo_due_date,
+                        "status": item.todo_status,
+                        "priority": item.todo_priority,
+                        "last_modified": last_modified,
+                    })
+
+            if rows:
+                # Postgres does not promise to draw the ids of a multi-row insert in row order,
+                # so they are drawn up front and inserted with the rows they belong to.
+                todo_ids = (await session.execute(
+                    select(func.nextval(func.pg_get_serial_sequence(Todo.__tablename__, Todo.todo_id.key)))
+                        .select_from(func.generate_series(1, len(rows)))
+                )).scalars().all()
+                for row, todo_id in zip(rows, todo_ids):
+                    row["todo_id"] = todo_id
+                await session.execute(insert(Todo).values(rows))
+                await bump_versions(session, membership.workspace_id, {row["todolist_id"] for row in rows})
+                await session.commit()
+
+                created = iter(todo_ids)
+                for result in results:
+                    if result["error_msg"] is None:
+                        result["todo_id"] = next(created)
+
+        return EnvelopeResponse(
+            status_code=status.HTTP_201_CREATED,
+            data=results,
+            msg=f'{len(rows)} of {len(results)} todos created in workspace "{bulk_model.workspace_default_name}".',
+        )
+    except NotFoundError as e:
+        if "Workspace" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{bulk_model.workspace_default_name}" not found.',
+            )
+        elif "User" in str(e) and "has not joined" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{bulk_model.username}" has not joined workspace "{bulk_model.workspace_default_name}".',
+            )
+        else:
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{bulk_model.username}" not found.',
             )
 
 @router.put("/")
-def change_todo(request: Request, change_model: ChangeTodoModel) -> JSONResponse:
+async def change_todo(request: Request, change_model: ChangeTodoModel) -> JSONResponse:
     """Change a todo."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", change_model.get_auth_user())
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
 
             query_wrapper = QueryWrapper(session)
-
-            query_wrapper.check_user_exists_and_get(change_model.username)
-            query_wrapper.check_workspace_exists_and_get(change_model.workspace_default_name)
-            query_wrapper.check_user_in_workspace_and_get(change_model.username, change_model.workspace_default_name)
-            todolist = query_wrapper.check_todolist_exists_and_get(change_model.todolist_id)
-            todo = query_wrapper.check_todo_exists_and_get(change_model.todo_id)
+            access = await query_wrapper.check_member_access_and_get(
+                change_model.username,
+                change_model.workspace_default_name,
+                todolist_id = change_model.todolist_id,
+                todo_id = change_model.todo_id,
+                fresh = True,
+            )
+            todolist, todo = access.get_todolist(), access.get_todo()
             
             todo_orig_name = todo.name
 
@@ -128,148 +242,242 @@ def change_todo(request: Request, change_model: ChangeTodoModel) -> JSONResponse
                 todo.status = change_model.todo_status
             if changed:
                 todo.last_modified = change_model.get_last_modified()
+                await bump_versions(session, todolist.workspace_id, [todolist.todolist_id])
   
-            session.commit()
-        return JSONResponse(
+            await session.commit()
+        return EnvelopeResponse(
             status_code=status.HTTP_202_ACCEPTED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg":  f'Content of todo "{todo_orig_name}" has been modified in todo list "{todolist.todolist_name}" in workspace "{change_model.workspace_default_name}" successfully.'
-            },
+            msg=f'Content of todo "{todo_orig_name}" has been modified in todo list "{todolist.todolist_name}" in workspace "{change_model.workspace_default_name}" successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{change_model.workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{change_model.workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{change_model.username}" has not joined workspace "{change_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{change_model.username}" has not joined workspace "{change_model.workspace_default_name}".',
             )
         elif "User" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{change_model.username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{change_model.username}" not found.',
             )
         elif "Todo list" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{change_model.todolist_id}" is not found in workspace "{change_model.workspace_default_name}".',
+            )
+        else:
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Todo of id "{change_model.todo_id}" is not found in todo list of id "{change_model.todolist_id}" in workspace "{change_model.workspace_default_name}".',
+            )
+
+@router.put("/bulk/")
+async def bulk_change_todos(request: Request, bulk_model: BulkChangeTodoModel) -> JSONResponse:
+    """Change the selected todos of a todo list with a single update."""
+    
+    try:
+        auth_check(request.headers.get("Authorization"), "username", bulk_model.get_auth_user())
+
+        length_error = todo_length_error(bulk_model)
+        if length_error is not None:
+            return EnvelopeResponse(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                error="ValidationError",
+                error_msg=length_error,
+            )
+
+        async with AsyncDatabaseConnection() as session:
+
+            query_wrapper = QueryWrapper(session)
+            todolist = (await query_wrapper.check_member_access_and_get(
+                bulk_model.username,
+                bulk_model.workspace_default_name,
+                todolist_id = bulk_model.todolist_id,
+                fresh = True,
+            )).get_todolist()
+
+            changes: Dict[str, Any] = {"last_modified": bulk_model.get_last_modified()}
+            for field, column in (
+                ("todo_name", Todo.name),
+                ("todo_description", Todo.description),
+                ("todo_due_date", Todo.due_date),
+                ("todo_status", Todo.status),
+                ("todo_priority", Todo.priority),
+            ):
+                if getattr(bulk_model, field):
+                    changes[column.key] = getattr(bulk_model, field)
+
+            result = await session.execute(
+                update(Todo)
+                    .where(selected_todos(bulk_model, todolist.todolist_id))
+                    .values(**changes)
+                    .execution_options(synchronize_session = False)
+            )
+            if result.rowcount:
+                await bump_versions(session, todolist.workspace_id, [todolist.todolist_id])
+            await session.commit()
+        return EnvelopeResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            data=result.rowcount,
+            msg=f'{result.rowcount} todos have been modified in todo list "{todolist.todolist_name}" in workspace "{bulk_model.workspace_default_name}" successfully.',
+        )
+    except InvalidFilterError as e:
+        return EnvelopeResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error=InvalidFilterError.__name__,
+            error_msg=str(e),
+        )
+    except NotFoundError as e:
+        if "Workspace" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{bulk_model.workspace_default_name}" not found.',
+            )
+        elif "User" in str(e) and "has not joined" in str(e):
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo list of id "{change_model.todolist_id}" is not found in workspace "{change_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{bulk_model.username}" has not joined workspace "{bulk_model.workspace_default_name}".',
+            )
+        elif "User" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{bulk_model.username}" not found.',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo of id "{change_model.todo_id}" is not found in todo list of id "{change_model.todolist_id}" in workspace "{change_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{bulk_model.todolist_id}" is not found in workspace "{bulk_model.workspace_default_name}".',
+            )
+
+@router.delete("/bulk/")
+async def bulk_delete_todos(request: Request, bulk_model: BulkDeleteTodoModel) -> JSONResponse:
+    """Delete the selected todos of a todo list with a single delete."""
+    
+    try:
+        auth_check(request.headers.get("Authorization"), "username", bulk_model.get_auth_user())
+
+        async with AsyncDatabaseConnection() as session:
+
+            query_wrapper = QueryWrapper(session)
+            todolist = (await query_wrapper.check_member_access_and_get(
+                bulk_model.username,
+                bulk_model.workspace_default_name,
+                todolist_id = bulk_model.todolist_id,
+                fresh = True,
+            )).get_todolist()
+
+            deleted = await delete_todos(session, selected_todos(bulk_model, todolist.todolist_id))
+            if deleted:
+                await bump_versions(session, todolist.workspace_id, [todolist.todolist_id])
+            await session.commit()
+        return EnvelopeResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            data=deleted,
+            msg=f'{deleted} todos have been deleted in todo list "{todolist.todolist_name}" in workspace "{bulk_model.workspace_default_name}" successfully.',
+        )
+    except InvalidFilterError as e:
+        return EnvelopeResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error=InvalidFilterError.__name__,
+            error_msg=str(e),
+        )
+    except NotFoundError as e:
+        if "Workspace" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{bulk_model.workspace_default_name}" not found.',
+            )
+        elif "User" in str(e) and "has not joined" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{bulk_model.username}" has not joined workspace "{bulk_model.workspace_default_name}".',
+            )
+        elif "User" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{bulk_model.username}" not found.',
+            )
+        else:
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{bulk_model.todolist_id}" is not found in workspace "{bulk_model.workspace_default_name}".',
             )
 
 @router.delete("/")
-def delete_todo(request: Request, username: str, workspace_default_name: str, todolist_id: int, todo_id: int) -> JSONResponse:
+async def delete_todo(request: Request, username: str, workspace_default_name: str, todolist_id: int, todo_id: int) -> JSONResponse:
     """Delete a todo."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", username)
 
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-
-            query_wrapper.check_user_exists_and_get(username)
-            query_wrapper.check_workspace_exists_and_get(workspace_default_name)
-            query_wrapper.check_user_in_workspace_and_get(username, workspace_default_name)
-            todolist = query_wrapper.check_todolist_exists_and_get(todolist_id)
-            todo = query_wrapper.check_todo_exists_and_get(todo_id)
+            access = await query_wrapper.check_member_access_and_get(
+                username,
+                workspace_default_name,
+                todolist_id = todolist_id,
+                todo_id = todo_id,
+                fresh = True,
+            )
+            todolist, todo = access.get_todolist(), access.get_todo()
             
             todo_orig_name = todo.name
 
-            session.delete(todo)
+            await delete_todos(session, Todo.todo_id == todo.todo_id)
+            await bump_versions(session, todolist.workspace_id, [todolist.todolist_id])
             
-            session.commit()
-        return JSONResponse(
+            await session.commit()
+        return EnvelopeResponse(
             status_code=status.HTTP_202_ACCEPTED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg":  f'Todo "{todo_orig_name}" has been deleted in todo list "{todolist.todolist_name}" in workspace "{workspace_default_name}" successfully.'
-            },
+            msg=f'Todo "{todo_orig_name}" has been deleted in todo list "{todolist.todolist_name}" in workspace "{workspace_default_name}" successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" has not joined workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
             )
         elif "User" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
             )
         elif "Todo list" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo list of id "{todolist_id}" is not found in workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{todolist_id}" is not found in workspace "{workspace_default_name}".',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo of id "{todo_id}" is not found in todo list of id "{todolist_id}" in workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Todo of id "{todo_id}" is not found in todo list of id "{todolist_id}" in workspace "{workspace_default_name}".',
             )
\ No newline at end of file
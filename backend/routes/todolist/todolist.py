@@ -1,17 +1,23 @@
-from fastapi import APIRouter, Request, Query as FastAPIQuery, status as FastAPIHTTPStatus
+from fastapi import APIRouter, Request, Response, Query as FastAPIQuery, status as FastAPIHTTPStatus
 from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse, cacheable, etag_matches, not_modified, response_body_cache, version_etag
 
-from data_models import DatabaseConnection
+from data_models import AsyncDatabaseConnection
 from data_models.models import Account, TodoList, WorkSpace, WorkSpaceAccountLink, Todo
-from data_models.filter_handler import FilterHandlerFactory
+from data_models.filter_handler import FILTER_SPEC_REGEX, FilterHandlerFactory, parse_filter_group
+from data_models.keyset_pagination import DEFAULT_PAGE_SIZE, KeysetPaginator
+from data_models.projections import TODO_COLUMNS, todo_content
+from data_models.versioning import bump_versions
+from data_models.change_feed import delete_todos
 from .schema import CreateTodoListModel, ChangeTodoListNameModel
 from util.helper.string import StringHashFactory
 from util.helper.auth import auth_check
-from util.exceptions import NotFoundError
+from util.exceptions import InvalidCursorError, InvalidFilterError, NotFoundError
 from typing import Final, List, Literal, Optional
 from data_models.query_wrapper import QueryWrapper
-from sqlalchemy.orm import Query # type: ignore
-from sqlalchemy import asc, desc # type: ignore
+from sqlalchemy.engine import Row # type: ignore
+from sqlalchemy.sql import Select # type: ignore
+from sqlalchemy import asc, desc, select # type: ignore
 
 router = APIRouter()
 
@@ -20,341 +26,302 @@ hasher: Final = StringHashFactory().get_hasher("blake2b")
 todo_filter_handler: Final = FilterHandlerFactory().get_handler("Todo")
 
 @router.get("/todos/")
-def get_todos(
+async def get_todos(
     request: Request, 
     username: str,
     workspace_default_name: str,
     todolist_id: int,
-    name: Optional[List[str]] = FastAPIQuery(default=[], regex=r"^\[(eq|gt|lt|ge|le|ne)\].*$"),
-    description: Optional[List[str]] = FastAPIQuery(default=[], regex=r"^\[(eq|gt|lt|ge|le|ne)\].*$"),
-    due_date: Optional[List[str]] = FastAPIQuery(default=[], regex=r"^\[(eq|gt|lt|ge|le|ne)\].*$"),
-    priority: Optional[List[str]] = FastAPIQuery(default=[], regex=r"^\[(eq|gt|lt|ge|le|ne)\].*$"),
-    status: Optional[List[str]] = FastAPIQuery(default=[], regex=r"^\[(eq|gt|lt|ge|le|ne)\].*$"),
+    name: Optional[List[str]] = FastAPIQuery(default=[], regex=FILTER_SPEC_REGEX),
+    description: Optional[List[str]] = FastAPIQuery(default=[], regex=FILTER_SPEC_REGEX),
+    due_date: Optional[List[str]] = FastAPIQuery(default=[], regex=FILTER_SPEC_REGEX),
+    priority: Optional[List[str]] = FastAPIQuery(default=[], regex=FILTER_SPEC_REGEX),
+    status: Optional[List[str]] = FastAPIQuery(default=[], regex=FILTER_SPEC_REGEX),
+    any_of: Optional[List[str]] = FastAPIQuery(default=[]),
     sort_by: Optional[Literal["name", "description", "due_date", "status", "priority"]] = None,
-    order_by: Optional[Literal["asc", "desc"]] = "asc"
-) -> JSONResponse:
-    """Get all todos and filter or sort the data on request"""
+    order_by: Optional[Literal["asc", "desc"]] = "asc",
+    limit: Optional[int] = FastAPIQuery(default=None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+) -> Response:
+    """Get all todos and filter or sort the data on request, a page at a time when a limit or cursor is given.
+
+    Each any_of is a JSON object of fields and filters, a todo has to match one of its filters.
+
+    The ETag is the version of the todo list, an unchanged todo list is answered with 304 or with a cached body.
+    """
 
     try:
         auth_check(request.headers.get("Authorization"), "username", username)
         
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            user = query_wrapper.check_user_exists_and_get(username)
-            query_wrapper.check_workspace_exists_and_get(workspace_default_name)
-            todolist = query_wrapper.check_todolist_exists_and_get(todolist_id)
-            query_wrapper.check_user_in_workspace_and_get(username, workspace_default_name)
-            
-            todo_query: Query = (
-                session
-                    .query(Todo)
-                    .join(TodoList, TodoList.todolist_id == Todo.todolist_id)
-                    .join(WorkSpace, WorkSpace.workspace_id == TodoList.workspace_id)
-                    .join(WorkSpaceAccountLink, WorkSpaceAccountLink.workspace_id == WorkSpace.workspace_id)
-                    .join(Account, WorkSpaceAccountLink.user_id == user.user_id)
-                    .filter(WorkSpace.workspace_default_name == workspace_default_name)
-                    .filter(Account.username == username)
-                    .filter(TodoList.todolist_id == todolist_id)
+            access = await query_wrapper.check_member_access_and_get(
+                username,
+                workspace_default_name,
+                todolist_id = todolist_id,
             )
+            todolist = access.get_todolist()
 
-            if name is not None:
-                for name_filter_specification in name:
-                    todo_query = todo_filter_handler.register_filter(todo_query, "name", name_filter_specification).get_filter_query()
+            etag = version_etag("todolist", todolist.todolist_id, todolist.version)
+            if etag_matches(request.headers.get("If-None-Match"), etag):
+                return not_modified(etag)
 
-            if description is not None:
-                for description_filter_specification in description:
-                    todo_query = todo_filter_handler.register_filter(todo_query, "description", description_filter_specification).get_filter_query()
-            
-            if due_date is not None:
-                for due_date_filter_specification in due_date:
-                    todo_query = todo_filter_handler.register_filter(todo_query, "due_date", due_date_filter_specification).get_filter_query()
-            
-            if priority is not None:
-                for priority_filter_specification in priority:
-                    todo_query = todo_filter_handler.register_filter(todo_query, "priority", priority_filter_specification).get_filter_query()
-            
-            if status is not None:
-                for status_filter_specification in status:
-                    todo_query = todo_filter_handler.register_filter(todo_query, "status", status_filter_specification).get_filter_query()
-            
-            if sort_by is not None:
-                if order_by == "asc":
-                    todo_query = todo_query.order_by(
-                        asc(getattr(Todo, sort_by))
-                    )
-                else:
-                    todo_query = todo_query.order_by(
-                        desc(getattr(Todo, sort_by))
-                    )
+            body_key = (
+                etag,
+                workspace_default_name,
+                tuple(name or ()),
+                tuple(description or ()),
+                tuple(due_date or ()),
+                tuple(priority or ()),
+                tuple(status or ()),
+                tuple(any_of or ()),
+                sort_by,
+                order_by,
+                limit,
+                cursor,
+            )
+            body = response_body_cache.get(body_key)
+            if body is not None:
+                return cacheable(Response(content=body, media_type="application/json"), etag)
 
-            
-            query_result: List[Todo] = todo_query.all()
-            todos: List[dict] = [
+            todo_query: Select = (
+                select(*TODO_COLUMNS)
+                    .filter(Todo.todolist_id == todolist.todolist_id)
+            )
+
+            todo_query = todo_filter_handler.apply_filters(
+                todo_query,
                 {
-                    "todo_id": todo.todo_id,
-                    "todo_name": todo.name,
-                    "todo_description": todo.description,
-                    "todo_due_date": str(todo.due_date),
-                    "todo_priority": todo.priority,
-                    "todo_status": todo.status,
-                    "todo_last_modified": str(todo.last_modified)
-                } for todo in query_result
-            ]
+                    "name": name,
+                    "description": description,
+                    "due_date": due_date,
+                    "priority": priority,
+                    "status": status,
+                },
+                [parse_filter_group(filter_group) for filter_group in any_of or ()],
+            )
+
+            next_cursor: Optional[str] = None
+            query_result: List[Row]
+            if limit is not None or cursor is not None:
+                paginator = KeysetPaginator(
+                    Todo.todo_id,
+                    None if sort_by is None else getattr(Todo, sort_by),
+                    order_by or "asc",
+                    DEFAULT_PAGE_SIZE if limit is None else limit,
+                )
+                todo_query = paginator.paginate(todo_query, cursor)
+                query_result, next_cursor = paginator.split_page((await session.execute(todo_query)).all())
+            else:
+                if sort_by is not None:
+                    if order_by == "asc":
+                        todo_query = todo_query.order_by(
+                            asc(getattr(Todo, sort_by))
+                        )
+                    else:
+                        todo_query = todo_query.order_by(
+                            desc(getattr(Todo, sort_by))
+                        )
+
+                query_result = (await session.execute(todo_query)).all()
+            todos: List[dict] = [todo_content(todo_row) for todo_row in query_result]
 
-        return JSONResponse(
+        response = EnvelopeResponse(
             status_code=FastAPIHTTPStatus.HTTP_200_OK,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": todos,
-                "msg": f'Get all todos in todolist "{todolist.todolist_name}" in workspace "{workspace_default_name}" successfully.',
-            }
+            data=todos,
+            msg=f'Get all todos in todolist "{todolist.todolist_name}" in workspace "{workspace_default_name}" successfully.',
+            next_cursor=next_cursor,
+        )
+        response_body_cache.put(body_key, response.body)
+        return cacheable(response, etag)
+    except InvalidCursorError as e:
+        return EnvelopeResponse(
+            status_code=FastAPIHTTPStatus.HTTP_400_BAD_REQUEST,
+            error=InvalidCursorError.__name__,
+            error_msg=str(e),
+        )
+    except InvalidFilterError as e:
+        return EnvelopeResponse(
+            status_code=FastAPIHTTPStatus.HTTP_422_UNPROCESSABLE_ENTITY,
+            error=InvalidFilterError.__name__,
+            error_msg=str(e),
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" has not joined workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
             )
         elif "User" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo list of id "{todolist_id}" is not found in workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{todolist_id}" is not found in workspace "{workspace_default_name}".',
             )
 
 @router.post("/")
-def create_todo_list(request: Request, create_model: CreateTodoListModel) -> JSONResponse:
+async def create_todo_list(request: Request, create_model: CreateTodoListModel) -> JSONResponse:
     """Create a todo list."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", create_model.get_auth_user())
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            query_wrapper.check_user_exists_and_get(create_model.username)
-            workspace = query_wrapper.check_workspace_exists_and_get(create_model.workspace_default_name)
-            query_wrapper.check_user_in_workspace_and_get(create_model.username, create_model.workspace_default_name)
+            membership = (await query_wrapper.check_member_access_and_get(
+                create_model.username,
+                create_model.workspace_default_name,
+                fresh = True,
+            )).membership
             
             new_todo_list = TodoList(
-                workspace_id=workspace.workspace_id,
+                workspace_id=membership.workspace_id,
                 todolist_name=create_model.todolist_name,
             )
             session.add(new_todo_list)
-            session.commit()
-        return JSONResponse(
+            await bump_versions(session, membership.workspace_id)
+            await session.commit()
+        return EnvelopeResponse(
             status_code=FastAPIHTTPStatus.HTTP_201_CREATED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": new_todo_list.todolist_id,
-                "msg": f'Todo list "{create_model.todolist_name}" in workspace "{create_model.workspace_default_name}" created successfully.',
-            },
+            data=new_todo_list.todolist_id,
+            msg=f'Todo list "{create_model.todolist_name}" in workspace "{create_model.workspace_default_name}" created successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{create_model.workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{create_model.workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{create_model.username}" has not joined workspace "{create_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{create_model.username}" has not joined workspace "{create_model.workspace_default_name}".',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{create_model.username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{create_model.username}" not found.',
             )
 
 @router.put("/")
-def change_todo_list_name(request: Request, change_name_model: ChangeTodoListNameModel) -> JSONResponse:
+async def change_todo_list_name(request: Request, change_name_model: ChangeTodoListNameModel) -> JSONResponse:
     """Change the name of a todo list."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", change_name_model.get_auth_user())
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
 
             query_wrapper = QueryWrapper(session)
-            query_wrapper.check_user_exists_and_get(change_name_model.username)
-            query_wrapper.check_workspace_exists_and_get(change_name_model.workspace_default_name)
-            query_wrapper.check_user_in_workspace_and_get(change_name_model.username, change_name_model.workspace_default_name)
-            todo_list = query_wrapper.check_todolist_exists_and_get(change_name_model.todolist_id)
+            todo_list = (await query_wrapper.check_member_access_and_get(
+                change_name_model.username,
+                change_name_model.workspace_default_name,
+                todolist_id = change_name_model.todolist_id,
+                fresh = True,
+            )).get_todolist()
             
             todo_list_orig_name = todo_list.todolist_name
             todo_list.todolist_name = change_name_model.new_todolist_name
-            session.commit()
-        return JSONResponse(
+            await bump_versions(session, todo_list.workspace_id, [todo_list.todolist_id])
+            await session.commit()
+        return EnvelopeResponse(
             status_code=FastAPIHTTPStatus.HTTP_202_ACCEPTED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": f'User "{change_name_model.username}" has changed the name of todolist from "{todo_list_orig_name}" to "{change_name_model.new_todolist_name}" in workspace "{change_name_model.workspace_default_name}" successfully.'
-            },
+            msg=f'User "{change_name_model.username}" has changed the name of todolist from "{todo_list_orig_name}" to "{change_name_model.new_todolist_name}" in workspace "{change_name_model.workspace_default_name}" successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{change_name_model.workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{change_name_model.workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{change_name_model.username}" has not joined workspace "{change_name_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'User "{change_name_model.username}" has not joined workspace "{change_name_model.workspace_default_name}".',
             )
         elif "Todo list" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo list of id "{change_name_model.todolist_id}" not found in workspace "{change_name_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{change_name_model.todolist_id}" not found in workspace "{change_name_model.workspace_default_name}".',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{change_name_model.username}" not found.',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'User "{change_name_model.username}" not found.',
             )
 
 @router.delete("/")
-def delete_todo_list(request: Request, username: str, workspace_default_name: str, todolist_id: int) -> JSONResponse:
+async def delete_todo_list(request: Request, username: str, workspace_default_name: str, todolist_id: int) -> JSONResponse:
     """Delete a todo list."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", username)
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            query_wrapper.check_user_exists_and_get(username)
-            query_wrapper.check_workspace_exists_and_get(workspace_default_name)
-            query_wrapper.check_user_in_workspace_and_get(username, workspace_default_name)
-            todo_list = query_wrapper.check_todolist_exists_and_get(todolist_id)
-            session.query(Todo).filter(Todo.todolist_id == todo_list.todolist_id).delete()
-            session.delete(todo_list)
-            session.commit()
-        return JSONResponse(
+            todo_list = (await query_wrapper.check_member_access_and_get(
+                username,
+                workspace_default_name,
+                todolist_id = todolist_id,
+                fresh = True,
+            )).get_todolist()
+            # the todos are deleted first to leave their tombstones, the database would cascade them silently
+            await delete_todos(session, Todo.todolist_id == todo_list.todolist_id)
+            await session.delete(todo_list)
+            await bump_versions(session, todo_list.workspace_id)
+            await session.commit()
+        return EnvelopeResponse(
             status_code=FastAPIHTTPStatus.HTTP_202_ACCEPTED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": f'User "{username}" has deleted todolist "{todo_list.todolist_name}" in workspace "{workspace_default_name}" successfully.',
-            },
+            msg=f'User "{username}" has deleted todolist "{todo_list.todolist_name}" in workspace "{workspace_default_name}" successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" has not joined workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
             )
         elif "User" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" not found.',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
             )
         elif "Todo list" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Todo list of id "{todolist_id}" not found.',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'Todo list of id "{todolist_id}" not found.',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=FastAPIHTTPStatus.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" not found.',
-                    "data": None,
-                    "msg": None,
-                }
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
             )
\ No newline at end of file
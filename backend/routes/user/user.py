@@ -1,31 +1,31 @@
 from fastapi import APIRouter, status, Request
 from fastapi.responses import JSONResponse
+from util.helper.response import EnvelopeResponse
 
 from .schema import UpdatePasswordModel, CreateUserModel
-from data_models import DatabaseConnection
+from data_models import AsyncDatabaseConnection
 from data_models.models import Account
 from sqlalchemy.exc import IntegrityError # type: ignore
-from util.helper.string import StringHashFactory
+from util.helper.string import password_hasher
 from util.exceptions import DuplicateError,InvalidCredentialsError, NotFoundError
-from sqlalchemy.orm import Query # type: ignore
+from sqlalchemy import select # type: ignore
+from sqlalchemy.sql import Select # type: ignore
 from util.helper.auth import auth_check
 from data_models.models import Account, WorkSpace, WorkSpaceAccountLink
-from typing import Final, List, Optional, Tuple
+from typing import List, Optional, Tuple
 from data_models.query_wrapper import QueryWrapper
 
 router = APIRouter()
 
-hasher: Final = StringHashFactory().get_hasher("blake2b")
-
 @router.post("/")
-def create_user(create_model: CreateUserModel) -> JSONResponse:
+async def create_user(create_model: CreateUserModel) -> JSONResponse:
     """Create a user."""
 
-    salt = hasher.create_salt()
-    password_hash = hasher.hash(string=create_model.password, salt=salt)
+    salt = password_hasher.create_salt()
+    password_hash = await password_hasher.hash(string=create_model.password, salt=salt)
     
     try:
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             new_user = Account(
                 username=create_model.username,
                 email=create_model.email,
@@ -33,131 +33,96 @@ def create_user(create_model: CreateUserModel) -> JSONResponse:
                 password_salt=salt,
             )
             session.add(new_user)
-            session.commit()
-        return JSONResponse(
+            await session.commit()
+        return EnvelopeResponse(
             status_code=status.HTTP_201_CREATED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": f'User "{create_model.username}" created successfully.',
-            },
+            msg=f'User "{create_model.username}" created successfully.',
         )
     except IntegrityError as e:
         if 'Key (username)' in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_409_CONFLICT,
-                content={
-                    "error": DuplicateError.__name__,
-                    "error_msg": f'Username "{create_model.username}" already exists.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=DuplicateError.__name__,
+                error_msg=f'Username "{create_model.username}" already exists.',
             )
         elif 'Key (email)' in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_409_CONFLICT,
-                content={
-                    "error": DuplicateError.__name__,
-                    "error_msg": f'Email "{create_model.email}" already exists.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=DuplicateError.__name__,
+                error_msg=f'Email "{create_model.email}" already exists.',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "InternalError",
-                    "error_msg": str(e),
-                    "data": None,
-                    "msg": None,
-                },
+                error="InternalError",
+                error_msg=str(e),
             )
 
 @router.put("/password/")
-def update_user_password(update_model: UpdatePasswordModel) -> JSONResponse:
+async def update_user_password(update_model: UpdatePasswordModel) -> JSONResponse:
     """User update their password"""
     
     try:
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            user = query_wrapper.check_user_exists_and_get(username=update_model.username)
+            user = await query_wrapper.check_user_exists_and_get(username=update_model.username)
+            # give the connection back to the pool while the passwords are hashed
+            await session.commit()
             
             old_password_salt = user.password_salt
-            if not hasher.verify(string = update_model.old_password,salt = old_password_salt, hash = user.password_hash):
+            if not await password_hasher.verify(string = update_model.old_password,salt = old_password_salt, hash = user.password_hash):
                 raise InvalidCredentialsError("Invalid credentials.")
             
-            new_password_salt = hasher.create_salt()
-            new_password_hash = hasher.hash(string=update_model.new_password, salt=new_password_salt)
+            new_password_salt = password_hasher.create_salt()
+            new_password_hash = await password_hasher.hash(string=update_model.new_password, salt=new_password_salt)
             user.password_hash = new_password_hash
             user.password_salt = new_password_salt
-            session.commit()
+            await session.commit()
 
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_200_OK,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": "Password updated successfully.",
-            },
+            msg="Password updated successfully.",
         )
     except (NotFoundError, InvalidCredentialsError) as e:
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
-            content={
-                "error": InvalidCredentialsError.__name__,
-                "error_msg": 'Invalid credentials.',
-                "data": None,
-                "msg": None,
-            },
+            error=InvalidCredentialsError.__name__,
+            error_msg='Invalid credentials.',
         )
 
 @router.get("/workspace/")
-def get_all_workspaces(request: Request, username: str) -> JSONResponse:
+async def get_all_workspaces(request: Request, username: str) -> JSONResponse:
     """For the user with username, get all workspaces he or she has."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", username)
 
-        with DatabaseConnection() as session:   
+        async with AsyncDatabaseConnection() as session:   
             query_wrapper = QueryWrapper(session)
-            user = query_wrapper.check_user_exists_and_get(username=username)
+            user = await query_wrapper.check_user_exists_and_get(username=username)
           
-            query: Query = (
-                session
-                    .query(WorkSpace)
+            query: Select = (
+                select(WorkSpace.workspace_default_name, WorkSpaceAccountLink.locale_alias)
                     .join(WorkSpaceAccountLink, WorkSpaceAccountLink.workspace_id == WorkSpace.workspace_id)
-                    .join(Account, WorkSpaceAccountLink.user_id == user.user_id)
-                    .filter(Account.username == username)
-                    .add_columns(WorkSpaceAccountLink.locale_alias)
+                    .filter(WorkSpaceAccountLink.user_id == user.user_id)
             )
-            query_result: List[Tuple[WorkSpace, Optional[str]]] = query.all()
+            query_result: List[Tuple[str, Optional[str]]] = (await session.execute(query)).all()
             workspaces_details = [
                 {
-                    "workspace_default_name": workspace.workspace_default_name,
+                    "workspace_default_name": workspace_default_name,
                     "workspace_alias": workspace_alias,
                 }
-                for workspace, workspace_alias in query_result
+                for workspace_default_name, workspace_alias in query_result
             ]
-            session.commit()
-        return JSONResponse(
+            await session.commit()
+        return EnvelopeResponse(
             status_code=status.HTTP_200_OK,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": workspaces_details,
-                "msg": f'Get all workspaces joined by "{username}" successfully.',
-            },
+            data=workspaces_details,
+            msg=f'Get all workspaces joined by "{username}" successfully.',
         )
     except NotFoundError:
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_404_NOT_FOUND,
-            content={
-                "error": NotFoundError.__name__,
-                "error_msg": f'User "{username}" not found.',
-                "data": None,
-                "msg": None,
-            },
+            error=NotFoundError.__name__,
+            error_msg=f'User "{username}" not found.',
         )
\ No newline at end of file
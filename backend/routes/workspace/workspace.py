@@ -1,72 +1,142 @@
-from fastapi import APIRouter, status, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Query as FastAPIQuery, status, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from util.helper.response import EnvelopeResponse, cacheable, dumps, etag_matches, not_modified, response_body_cache, version_etag
 
 from .schema import CreateWorkspaceModel, InviteWorkspaceModel, ChangeWorkspaceAliasModel
-from data_models import DatabaseConnection
-from data_models.models import Account, Todo, TodoList, WorkSpace, WorkSpaceAccountLink
+from data_models import AsyncDatabaseConnection
+from data_models.keyset_pagination import DEFAULT_PAGE_SIZE, KeysetPaginator
+from data_models.change_feed import TodoChangeFeed
+from data_models.projections import TODO_COLUMNS, todo_content
+from data_models.models import TODO_SEARCH_CONFIG, Todo, TodoList, WorkSpace, WorkSpaceAccountLink
+from data_models.jobs import job_runner
+from data_models.teardown import DEFAULT_DELETE_CHUNK_SIZE, has_more_todos_than
 from sqlalchemy.exc import IntegrityError # type: ignore
 from util.helper.string import StringHashFactory
 from util.helper.auth import auth_check
-from util.exceptions import (DuplicateError, NotFoundError, UnauthorizedError)
-from typing import Dict, Final, List, Tuple
-from sqlalchemy.orm import Query # type: ignore
+from util.exceptions import (DuplicateError, InvalidCursorError, NotFoundError, UnauthorizedError)
+from typing import AsyncIterator, Dict, Final, List, Optional
+from sqlalchemy import Float, delete, func, literal_column, select # type: ignore
+from sqlalchemy.engine import Row # type: ignore
+from sqlalchemy.sql import Select # type: ignore
 from data_models.query_wrapper import QueryWrapper
 
 router = APIRouter()
 
 hasher: Final = StringHashFactory().get_hasher("blake2b")
 
+STREAM_BATCH_SIZE: Final = 500
+
+WORKSPACE_DELETE_CHUNK_SIZE: Final = DEFAULT_DELETE_CHUNK_SIZE
+
+def todolists_todos_query(workspace_id: int, todo_limit: Optional[int] = None, todolist_ids: Optional[List[int]] = None) -> Select:
+    """Select the todo columns of the todolists in a workspace, keeping at most todo_limit todos per todolist"""
+
+    todo_query: Select = (
+        select(*TODO_COLUMNS)
+            .join(TodoList, TodoList.todolist_id == Todo.todolist_id)
+            .filter(TodoList.workspace_id == workspace_id)
+    )
+    if todolist_ids is not None:
+        todo_query = todo_query.filter(Todo.todolist_id.in_(todolist_ids))
+
+    if todo_limit is None:
+        return todo_query.order_by(Todo.todolist_id, Todo.todo_id)
+
+    ranked_todos = (
+        todo_query
+            .add_columns(func.row_number().over(partition_by=Todo.todolist_id, order_by=Todo.todo_id).label("todo_rank"))
+            .subquery()
+    )
+    return (
+        select(*(ranked_todos.c[column.key] for column in TODO_COLUMNS))
+            .filter(ranked_todos.c.todo_rank <= todo_limit)
+            .order_by(ranked_todos.c.todolist_id, ranked_todos.c.todo_id)
+    )
+
+async def stream_todolists_todos(workspace_id: int, todo_limit: Optional[int]) -> AsyncIterator[bytes]:
+    """Yield each todolist of a workspace with its todos as a line of JSON, reading the rows through a server side cursor"""
+
+    todo_query = todolists_todos_query(workspace_id, todo_limit).order_by(None).subquery()
+    query: Select = (
+        select(TodoList.todolist_id, TodoList.todolist_name, *(column for column in todo_query.c if column.key != "todolist_id"))
+            .outerjoin(todo_query, todo_query.c.todolist_id == TodoList.todolist_id)
+            .filter(TodoList.workspace_id == workspace_id)
+            .order_by(TodoList.todolist_id, todo_query.c.todo_id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+
+    async with AsyncDatabaseConnection() as session:
+        todolist: Optional[Dict] = None
+        result = await session.stream(query)
+        async for partition in result.partitions():
+            for row in partition:
+                if todolist is None or todolist["todolist_id"] != row.todolist_id:
+                    if todolist is not None:
+                        yield dumps(todolist) + b"\n"
+                    todolist = {"todolist_id": row.todolist_id, "todolist_name": row.todolist_name, "todos": []}
+                if row.todo_id is not None:
+                    todolist["todos"].append(todo_content(row))
+        if todolist is not None:
+            yield dumps(todolist) + b"\n"
+
 @router.get("/todolists/todos/")
-def get_all_todolists_todos(request: Request, username: str, workspace_default_name: str) -> JSONResponse:
-    """Get a list of all workspaces"""
+async def get_all_todolists_todos(
+    request: Request,
+    username: str,
+    workspace_default_name: str,
+    limit: Optional[int] = FastAPIQuery(default=None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    todo_limit: Optional[int] = FastAPIQuery(default=None, ge=1),
+) -> Response:
+    """Get a list of all todolists and their todos in a workspace.
+
+    The ETag is the version of the workspace, an unchanged workspace is answered with 304 or with a cached body.
+    """
     
     try:
         auth_check(request.headers.get("Authorization"), "username", username)
         
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            user = query_wrapper.check_user_exists_and_get(username)
-            query_wrapper.check_workspace_exists_and_get(workspace_default_name)
-            query_wrapper.check_user_in_workspace_and_get(username, workspace_default_name)
-          
-            todo_query: Query = (
-                session
-                    .query(Todo)
-                    .join(TodoList, TodoList.todolist_id == Todo.todolist_id)
-                    .join(WorkSpace, WorkSpace.workspace_id == TodoList.workspace_id)
-                    .join(WorkSpaceAccountLink, WorkSpaceAccountLink.workspace_id == WorkSpace.workspace_id)
-                    .join(Account, WorkSpaceAccountLink.user_id == user.user_id)
-                    .filter(WorkSpace.workspace_default_name == workspace_default_name)
-                    .filter(Account.username == username)
-                    .add_columns(TodoList.todolist_id)
-            )
+            membership = (await query_wrapper.check_member_access_and_get(username, workspace_default_name)).membership
 
-            todolist_query: Query = (
-                session
-                    .query(TodoList)
-                    .join(WorkSpace, WorkSpace.workspace_id == TodoList.workspace_id)
-                    .join(WorkSpaceAccountLink, WorkSpaceAccountLink.workspace_id == WorkSpace.workspace_id)
-                    .join(Account, WorkSpaceAccountLink.user_id == user.user_id)
-                    .filter(WorkSpace.workspace_default_name == workspace_default_name)
-                    .filter(Account.username == username)
+            version = (await session.execute(
+                select(WorkSpace.version).filter(WorkSpace.workspace_id == membership.workspace_id)
+            )).scalar_one()
+            etag = version_etag("workspace", membership.workspace_id, version)
+            if etag_matches(request.headers.get("If-None-Match"), etag):
+                return not_modified(etag)
+
+            body_key = (etag, workspace_default_name, limit, cursor, todo_limit)
+            body = response_body_cache.get(body_key)
+            if body is not None:
+                return cacheable(Response(content=body, media_type="application/json"), etag)
+
+            todolist_query: Select = (
+                select(TodoList.todolist_id, TodoList.todolist_name)
+                    .filter(TodoList.workspace_id == membership.workspace_id)
             )
 
-            todolist_query_result: List[TodoList] = todolist_query.all()
-            todo_query_result: List[Tuple[Todo, str]] = todo_query.all()
-
-            todo_query_result_map: Dict[str, List[Dict]] = {}
-            for todo, todolist_id in todo_query_result:
-                if todolist_id not in todo_query_result_map:
-                    todo_query_result_map[todolist_id] = []
-                todo_query_result_map[todolist_id].append({
-                    "todo_id": todo.todo_id,
-                    "todo_name": todo.name,
-                    "todo_description": todo.description,
-                    "todo_due_date": str(todo.due_date),
-                    "todo_priority": todo.priority,
-                    "todo_status": todo.status,
-                    "todo_last_modified": str(todo.last_modified),
-                })
+            todolist_query_result: List[Row]
+            next_cursor: Optional[str] = None
+            if limit is not None or cursor is not None:
+                paginator = KeysetPaginator(TodoList.todolist_id, None, "asc", limit or DEFAULT_PAGE_SIZE)
+                todolist_rows = (await session.execute(paginator.paginate(todolist_query, cursor))).all()
+                todolist_query_result, next_cursor = paginator.split_page(todolist_rows)
+                todo_query = todolists_todos_query(
+                    membership.workspace_id,
+                    todo_limit,
+                    [todolist.todolist_id for todolist in todolist_query_result],
+                )
+            else:
+                todolist_query_result = (await session.execute(todolist_query)).all()
+                todo_query = todolists_todos_query(membership.workspace_id, todo_limit)
+
+            todo_query_result: List[Row] = (await session.execute(todo_query)).all()
+
+            todo_query_result_map: Dict[int, List[Dict]] = {}
+            for todo_row in todo_query_result:
+                todo_query_result_map.setdefault(todo_row.todolist_id, []).append(todo_content(todo_row))
 
             query_result = [
                 {
@@ -77,59 +147,225 @@ def get_all_todolists_todos(request: Request, username: str, workspace_default_n
                 for todolist in todolist_query_result
             ]
 
-            session.commit()
-        return JSONResponse(
+            await session.commit()
+        response = EnvelopeResponse(
             status_code=status.HTTP_200_OK,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": query_result,
-                "msg": f'Get all todolists and corresponding todos in workspace "{workspace_default_name}" successfully.',
+            data=query_result,
+            msg=f'Get all todolists and corresponding todos in workspace "{workspace_default_name}" successfully.',
+            next_cursor=next_cursor,
+        )
+        response_body_cache.put(body_key, response.body)
+        return cacheable(response, etag)
+    except InvalidCursorError as e:
+        return EnvelopeResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error=InvalidCursorError.__name__,
+            error_msg=str(e),
+        )
+    except NotFoundError as e:
+        if "Workspace" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
+            )
+        elif "User" in str(e) and "has not joined" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
+            )
+        else:
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
+            )
+
+@router.get("/todolists/todos/stream/")
+async def stream_all_todolists_todos(
+    request: Request,
+    username: str,
+    workspace_default_name: str,
+    todo_limit: Optional[int] = FastAPIQuery(default=None, ge=1),
+) -> Response:
+    """Stream all todolists and their todos in a workspace as newline delimited JSON"""
+
+    try:
+        auth_check(request.headers.get("Authorization"), "username", username)
+
+        async with AsyncDatabaseConnection() as session:
+            query_wrapper = QueryWrapper(session)
+            membership = (await query_wrapper.check_member_access_and_get(username, workspace_default_name)).membership
+
+        return StreamingResponse(
+            stream_todolists_todos(membership.workspace_id, todo_limit),
+            status_code=status.HTTP_200_OK,
+            media_type="application/x-ndjson",
+        )
+    except NotFoundError as e:
+        if "Workspace" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
+            )
+        elif "User" in str(e) and "has not joined" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
+            )
+        else:
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
+            )
+
+@router.get("/todolists/todos/changes/")
+async def get_todolists_todos_changes(
+    request: Request,
+    username: str,
+    workspace_default_name: str,
+    since: Optional[str] = None,
+    limit: int = FastAPIQuery(default=DEFAULT_PAGE_SIZE, ge=1, le=1000),
+) -> JSONResponse:
+    """Get the todos of a workspace modified and deleted since a cursor.
+
+    Without a cursor all todos are returned. The returned next_cursor is passed as since of the next sync,
+    has_more tells whether to fetch again right away. Clients apply the todos before the deleted todos.
+    """
+
+    try:
+        auth_check(request.headers.get("Authorization"), "username", username)
+
+        async with AsyncDatabaseConnection() as session:
+            query_wrapper = QueryWrapper(session)
+            membership = (await query_wrapper.check_member_access_and_get(username, workspace_default_name)).membership
+
+            changes = await TodoChangeFeed(membership.workspace_id, limit).read(session, since)
+
+            await session.commit()
+        return EnvelopeResponse(
+            status_code=status.HTTP_200_OK,
+            data={
+                "todos": [todo_content(todo) for todo in changes.todos],
+                "deleted_todos": [
+                    {
+                        "todo_id": tombstone.todo_id,
+                        "todolist_id": tombstone.todolist_id,
+                        "todo_deleted_at": tombstone.deleted_at,
+                    }
+                    for tombstone in changes.deleted_todos
+                ],
             },
+            msg=f'Get the changed todos in workspace "{workspace_default_name}" successfully.',
+            next_cursor=changes.next_cursor,
+            has_more=changes.has_more,
+        )
+    except InvalidCursorError as e:
+        return EnvelopeResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error=InvalidCursorError.__name__,
+            error_msg=str(e),
+        )
+    except NotFoundError as e:
+        if "Workspace" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
+            )
+        elif "User" in str(e) and "has not joined" in str(e):
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
+            )
+        else:
+            return EnvelopeResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
+            )
+
+@router.get("/todos/search/")
+async def search_todos(
+    request: Request,
+    username: str,
+    workspace_default_name: str,
+    query: str = FastAPIQuery(min_length=1, max_length=255),
+    limit: int = FastAPIQuery(default=DEFAULT_PAGE_SIZE, ge=1, le=1000),
+    cursor: Optional[str] = None,
+) -> JSONResponse:
+    """Search the names and descriptions of the todos in all todolists of a workspace.
+
+    The query takes the web search syntax of Postgres, quoted phrases, or and -excluded words.
+    Todos are ranked by relevance, matches in names weighing more than matches in descriptions.
+    """
+
+    try:
+        auth_check(request.headers.get("Authorization"), "username", username)
+
+        async with AsyncDatabaseConnection() as session:
+            query_wrapper = QueryWrapper(session)
+            membership = (await query_wrapper.check_member_access_and_get(username, workspace_default_name)).membership
+
+            ts_query = func.websearch_to_tsquery(literal_column(f"'{TODO_SEARCH_CONFIG}'::regconfig"), query)
+            rank = func.ts_rank(Todo.search_vector, ts_query, type_ = Float).label("rank")
+            search_query: Select = (
+                select(*TODO_COLUMNS, rank)
+                    .filter(Todo.workspace_id == membership.workspace_id)
+                    .filter(Todo.search_vector.op("@@")(ts_query))
+            )
+            paginator = KeysetPaginator(Todo.todo_id, rank, "desc", limit)
+            todos, next_cursor = paginator.split_page((await session.execute(paginator.paginate(search_query, cursor))).all())
+
+            await session.commit()
+        return EnvelopeResponse(
+            status_code=status.HTTP_200_OK,
+            data=[{"todolist_id": todo.todolist_id, **todo_content(todo)} for todo in todos],
+            msg=f'Search todos in workspace "{workspace_default_name}" successfully.',
+            next_cursor=next_cursor,
+        )
+    except InvalidCursorError as e:
+        return EnvelopeResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error=InvalidCursorError.__name__,
+            error_msg=str(e),
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" has not joined workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
             )
 
 @router.post("/")
-def create_workspace(request: Request, create_model: CreateWorkspaceModel) -> JSONResponse:
+async def create_workspace(request: Request, create_model: CreateWorkspaceModel) -> JSONResponse:
     """Create a workspace."""
     
     try:
         auth_check(request.headers.get("Authorization"), "username", create_model.get_auth_user())
 
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            user = query_wrapper.check_user_exists_and_get(create_model.get_auth_user())
+            user = await query_wrapper.check_user_exists_and_get(create_model.get_auth_user())
 
             new_workspace: WorkSpace = WorkSpace(
                 workspace_owner_id = user.user_id,
@@ -141,48 +377,35 @@ def create_workspace(request: Request, create_model: CreateWorkspaceModel) -> JS
             )
             new_workspace.members.append(workspace_account_record)
             session.add(new_workspace)
-            session.commit()
-        return JSONResponse(
+            await session.commit()
+        return EnvelopeResponse(
             status_code=status.HTTP_201_CREATED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": f'Workspace "{new_workspace.workspace_default_name}" created successfully.',
-            },
+            msg=f'Workspace "{new_workspace.workspace_default_name}" created successfully.',
         )
     except NotFoundError as e:
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_404_NOT_FOUND,
-            content={
-                "error": NotFoundError.__name__,
-                "error_msg": f'User "{create_model.username}" not found.',
-                "data": None,
-                "msg": None,
-            },
+            error=NotFoundError.__name__,
+            error_msg=f'User "{create_model.username}" not found.',
         )
     except IntegrityError as e:
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_409_CONFLICT,
-            content={
-                "error": DuplicateError.__name__,
-                "error_msg": f'Workspace "{new_workspace.workspace_default_name}" already exists.',
-                "data": None,
-                "msg": None,
-            },
+            error=DuplicateError.__name__,
+            error_msg=f'Workspace "{new_workspace.workspace_default_name}" already exists.',
         )
 
 @router.put("/invite/")
-def invite_user_to_workspace(request: Request, invite_model: InviteWorkspaceModel) -> JSONResponse:
+async def invite_user_to_workspace(request: Request, invite_model: InviteWorkspaceModel) -> JSONResponse:
     """Invite user to a workspace"""
     try:
         auth_check(request.headers.get("Authorization"), "username", invite_model.get_auth_user())
     
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            owner = query_wrapper.check_user_exists_and_get(invite_model.owner_username)
-            workspace = query_wrapper.check_workspace_exists_and_get(invite_model.workspace_default_name)
-            invitee = query_wrapper.check_user_exists_and_get(invite_model.invitee_username)
+            owner = await query_wrapper.check_user_exists_and_get(invite_model.owner_username)
+            workspace = await query_wrapper.check_workspace_exists_and_get(invite_model.workspace_default_name)
+            invitee = await query_wrapper.check_user_exists_and_get(invite_model.invitee_username)
 
             if workspace.workspace_owner_id != owner.user_id:
                 raise UnauthorizedError("Unauthorized action.")
@@ -193,166 +416,133 @@ def invite_user_to_workspace(request: Request, invite_model: InviteWorkspaceMode
             )
 
             session.add(workspace_account_record)
-            session.commit()
+            await session.commit()
+            await query_wrapper.membership_cache.invalidate(invite_model.invitee_username, invite_model.workspace_default_name)
 
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_202_ACCEPTED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": f'Invited user "{invite_model.invitee_username}" to workspace "{invite_model.workspace_default_name}" successfully.',
-            },
+            msg=f'Invited user "{invite_model.invitee_username}" to workspace "{invite_model.workspace_default_name}" successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{invite_model.workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{invite_model.workspace_default_name}" not found.',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{invite_model.invitee_username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{invite_model.invitee_username}" not found.',
             )
     except IntegrityError as e:
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_409_CONFLICT,
-            content={
-                "error": DuplicateError.__name__,
-                "error_msg": f'User "{invite_model.invitee_username}" has already joined workspace "{invite_model.workspace_default_name}".',
-                "data": None,
-                "msg": None,
-            },
+            error=DuplicateError.__name__,
+            error_msg=f'User "{invite_model.invitee_username}" has already joined workspace "{invite_model.workspace_default_name}".',
         )
 
 @router.delete("/")
-def leave_workspace(request: Request, username: str, workspace_default_name: str) -> JSONResponse:
-    """When a user wants to leave the workspace"""
+async def leave_workspace(request: Request, username: str, workspace_default_name: str) -> JSONResponse:
+    """When a user wants to leave the workspace, the workspace is deleted when its owner leaves"""
 
     try:
         auth_check(request.headers.get("Authorization"), "username", username)
 
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             
             query_wrapper = QueryWrapper(session)
-            user = query_wrapper.check_user_exists_and_get(username)
-            workspace = query_wrapper.check_workspace_exists_and_get(workspace_default_name)
-            workspace_account_record = query_wrapper.check_user_in_workspace_and_get(username, workspace_default_name)
+            access = await query_wrapper.check_workspace_access_and_get(username, workspace_default_name)
+            user, workspace, workspace_account_record = access.user, access.workspace, access.membership
+            deletion_job_id: Optional[int] = None
 
             if workspace.workspace_owner_id == user.user_id:
-                session.query(Todo).filter(Todo.workspace_id == workspace.workspace_id).delete()
-                session.query(TodoList).filter(TodoList.workspace_id == workspace.workspace_id).delete()
-                session.query(WorkSpaceAccountLink).filter(WorkSpaceAccountLink.workspace_id == workspace.workspace_id).delete()
-                session.delete(workspace)
+                if await has_more_todos_than(session, workspace.workspace_id, WORKSPACE_DELETE_CHUNK_SIZE):
+                    # the members lose access at once, the todos are deleted in chunks by a job committed alongside
+                    await session.execute(delete(WorkSpaceAccountLink).filter(WorkSpaceAccountLink.workspace_id == workspace.workspace_id))
+                    deletion_job_id = await job_runner.enqueue(
+                        session,
+                        "delete_workspace",
+                        {"workspace_id": workspace.workspace_id, "chunk_size": WORKSPACE_DELETE_CHUNK_SIZE},
+                        username,
+                    )
+                else:
+                    await session.delete(workspace)
             else:
-                session.delete(workspace_account_record)
+                await session.delete(workspace_account_record)
+
+            await session.commit()
 
-            session.commit()
+            if deletion_job_id is not None:
+                job_runner.notify()
 
-        return JSONResponse(
+            if workspace.workspace_owner_id == user.user_id:
+                await query_wrapper.membership_cache.invalidate_workspace(workspace_default_name)
+            else:
+                await query_wrapper.membership_cache.invalidate(username, workspace_default_name)
+
+        return EnvelopeResponse(
             status_code=status.HTTP_202_ACCEPTED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": f'User "{username}" has left workspace "{workspace_default_name}" successfully.',
-            },
+            data=deletion_job_id,
+            msg=f'User "{username}" has left workspace "{workspace_default_name}" successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" has not joined workspace "{workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" has not joined workspace "{workspace_default_name}".',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{username}" not found.',
             )
 
 @router.put("/alias/")
-def change_workspace_alias(request: Request, change_alias_model: ChangeWorkspaceAliasModel) -> JSONResponse:
+async def change_workspace_alias(request: Request, change_alias_model: ChangeWorkspaceAliasModel) -> JSONResponse:
     try:
         auth_check(request.headers.get("Authorization"), "username", change_alias_model.get_auth_user())
         
-        with DatabaseConnection() as session:
+        async with AsyncDatabaseConnection() as session:
             query_wrapper = QueryWrapper(session)
-            query_wrapper.check_user_exists_and_get(change_alias_model.username)
-            query_wrapper.check_workspace_exists_and_get(change_alias_model.workspace_default_name)
-            workspace_account_record = query_wrapper.check_user_in_workspace_and_get(change_alias_model.username, change_alias_model.workspace_default_name)
+            workspace_account_record = (await query_wrapper.check_workspace_access_and_get(
+                change_alias_model.username,
+                change_alias_model.workspace_default_name,
+            )).membership
           
             workspace_account_record_orig_alias = workspace_account_record.locale_alias
             workspace_account_record.locale_alias = change_alias_model.new_workspace_alias
-            session.commit()
+            await session.commit()
         
-        return JSONResponse(
+        return EnvelopeResponse(
             status_code=status.HTTP_202_ACCEPTED,
-            content={
-                "error": None,
-                "error_msg": None,
-                "data": None,
-                "msg": f'User "{change_alias_model.username}" has changed the workspace "{change_alias_model.workspace_default_name}" alias from "{workspace_account_record_orig_alias}" to "{change_alias_model.new_workspace_alias}" successfully.',
-            },
+            msg=f'User "{change_alias_model.username}" has changed the workspace "{change_alias_model.workspace_default_name}" alias from "{workspace_account_record_orig_alias}" to "{change_alias_model.new_workspace_alias}" successfully.',
         )
     except NotFoundError as e:
         if "Workspace" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'Workspace "{change_alias_model.workspace_default_name}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'Workspace "{change_alias_model.workspace_default_name}" not found.',
             )
         elif "User" in str(e) and "has not joined" in str(e):
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{change_alias_model.username}" not found in workspace "{change_alias_model.workspace_default_name}".',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{change_alias_model.username}" not found in workspace "{change_alias_model.workspace_default_name}".',
             )
         else:
-            return JSONResponse(
+            return EnvelopeResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": NotFoundError.__name__,
-                    "error_msg": f'User "{change_alias_model.username}" not found.',
-                    "data": None,
-                    "msg": None,
-                },
+                error=NotFoundError.__name__,
+                error_msg=f'User "{change_alias_model.username}" not found.',
             )
@@ -1,10 +1,14 @@
+import asyncio
 from typing import Generator, List, Tuple
 import pytest
 from pytest import FixtureRequest
 from fastapi.testclient import TestClient
+from config.password_hash_config import PASSWORD_HASH_CONFIG
 from util.helper.string import StringHash, StringHashFactory
 from ...main import app
 from data_models import Base, Engine
+from data_models.membership_cache import membership_cache
+from util.helper.response import response_body_cache
 from ..mock_data import (
     TestUserInfo,
     permuted_test_user_infos,
@@ -22,12 +26,14 @@ from util.helper.string import random_string
 def hasher() -> StringHash:
     """Return a StringHash object"""
     
-    return StringHashFactory().get_hasher("blake2b")
+    return StringHashFactory().get_hasher(PASSWORD_HASH_CONFIG.algorithm)
 
 @pytest.fixture
 def db_teardown_and_setup() -> Generator[None, None, None]:
     Base.metadata.drop_all(bind = Engine)
     Base.metadata.create_all(bind = Engine)
+    asyncio.run(membership_cache.clear())
+    response_body_cache.clear()
     yield
     Base.metadata.drop_all(bind = Engine)
 
@@ -0,0 +1,117 @@
+import time
+from typing import Tuple
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from routes.workspace import workspace as workspace_routes
+from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
+
+def create_workspace_deletion_job(client: TestClient, user: TestUserInfo, access_token: str, test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> int:
+    """Create a workspace with more todos than a delete chunk, leave it as its owner and return the id of the deletion job"""
+
+    client.post(
+        "/api/workspace/",
+        json = {
+            "username": user.username,
+            "workspace_default_name": test_workspace_info.workspace_default_name,
+        },
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    create_todolist_response = client.post(
+        "/api/workspace/todolist/",
+        json = {
+            "username": user.username,
+            "workspace_default_name": test_workspace_info.workspace_default_name,
+            "todolist_name": test_todolist_info.todolist_name,
+        },
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    client.post(
+        "/api/workspace/todolist/todo/bulk/",
+        json = {
+            "username": user.username,
+            "workspace_default_name": test_workspace_info.workspace_default_name,
+            "todos": [{"todolist_id": int(create_todolist_response.json()["data"]), "todo_name": f"todo {i}"} for i in range(3)],
+        },
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    response = client.delete(
+        "/api/workspace/?username={}&workspace_default_name={}".format(user.username, test_workspace_info.workspace_default_name),
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+    return int(response.json()["data"])
+
+class TestGetJob:
+    """Test the get job endpoint."""
+
+    def test_get_job(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a user can follow a job they enqueued until it succeeds."""
+
+        monkeypatch.setattr(workspace_routes, "WORKSPACE_DELETE_CHUNK_SIZE", 1)
+        user, access_token = login_user
+        job_id = create_workspace_deletion_job(client, user, access_token, test_workspace_info, test_todolist_info)
+
+        for _ in range(50):
+            response = client.get(
+                "/api/jobs/{}/?username={}".format(job_id, user.username),
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            if response.json()["data"]["status"] == "succeeded":
+                break
+            time.sleep(0.1)
+
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["error"] is None
+        assert response_json["error_msg"] is None
+        assert response_json["msg"] == f'Get job of id "{job_id}" successfully.'
+        job = response_json["data"]
+        assert job["job_id"] == job_id
+        assert job["kind"] == "delete_workspace"
+        assert job["status"] == "succeeded"
+        assert job["attempts"] == 1
+        assert job["result"] == {"deleted_todos": 3}
+        assert job["error"] is None
+
+class TestGetJobTokenError:
+    """Test the get job endpoint with token error."""
+
+    def test_get_job_no_access_token_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a job cannot be read without access token."""
+
+        monkeypatch.setattr(workspace_routes, "WORKSPACE_DELETE_CHUNK_SIZE", 1)
+        user, access_token = login_user
+        job_id = create_workspace_deletion_job(client, user, access_token, test_workspace_info, test_todolist_info)
+
+        response = client.get("/api/jobs/{}/?username={}".format(job_id, user.username))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response_json = response.json()
+        assert response_json["data"] is None
+        assert response_json["error"] == "UnauthorizedError"
+
+class TestGetJobInputError:
+    """Test the get job endpoint with invalid input."""
+
+    def test_get_job_of_other_user_raises(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a user cannot read the job of another user."""
+
+        monkeypatch.setattr(workspace_routes, "WORKSPACE_DELETE_CHUNK_SIZE", 1)
+        user1, access_token1 = login_users[0]
+        user2, access_token2 = login_users[1]
+        job_id = create_workspace_deletion_job(client, user1, access_token1, test_workspace_info, test_todolist_info)
+
+        for job_id_to_get in (job_id, job_id + 1):
+            response = client.get(
+                "/api/jobs/{}/?username={}".format(job_id_to_get, user2.username),
+                headers={"Authorization": f"Bearer {access_token2}"}
+            )
+
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            response_json = response.json()
+            assert response_json["data"] is None
+            assert response_json["error"] == "NotFoundError"
+            assert response_json["error_msg"] == f'Job of id "{job_id_to_get}" not found.'
@@ -0,0 +1,91 @@
+import asyncio
+from typing import Any, Dict
+from sqlalchemy import select, update # type: ignore
+from data_models import AsyncDatabaseConnection, AsyncEngine
+from data_models.jobs import JobRunner
+from data_models.models import Job
+
+class TestJobLease:
+    """Test that a job stops running once its lease is lost."""
+
+    def test_job_aborted_when_claimed_by_another_runner(self, db_teardown_and_setup: None) -> None:
+        """Test that a job claimed again by another runner is cancelled and left to that runner."""
+
+        async def run() -> Dict[str, Any]:
+            runner = JobRunner(worker_count = 1, poll_interval = 0.05, max_attempts = 3, retry_delay = 0, lease = 0.3)
+            started, cancelled = asyncio.Event(), asyncio.Event()
+
+            @runner.register("sleep")
+            async def sleep(payload: Dict[str, Any]) -> None:
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            try:
+                async with AsyncDatabaseConnection() as session:
+                    job_id = await runner.enqueue(session, "sleep", {}, "testing")
+                    await session.commit()
+                await runner.start()
+                await asyncio.wait_for(started.wait(), 5)
+
+                # another runner claims the job after its lease lapsed
+                async with AsyncDatabaseConnection() as session:
+                    await session.execute(update(Job).where(Job.job_id == job_id).values(attempts = Job.attempts + 1))
+                    await session.commit()
+
+                await asyncio.wait_for(cancelled.wait(), 5)
+                await asyncio.sleep(0.1)
+                async with AsyncDatabaseConnection() as session:
+                    job = (await session.execute(select(Job.status, Job.attempts).filter(Job.job_id == job_id))).one()
+                return {"status": job.status, "attempts": job.attempts}
+            finally:
+                await runner.stop()
+                await AsyncEngine.dispose()
+
+        job = asyncio.run(run())
+
+        assert job["status"] == "running"
+        assert job["attempts"] == 2
+
+    def test_job_handed_back_after_handler_stopped(self, db_teardown_and_setup: None) -> None:
+        """Test that a stopped runner hands a job back only once its handler has finished tearing down."""
+
+        async def run() -> Dict[str, Any]:
+            runner = JobRunner(worker_count = 1, poll_interval = 0.05, max_attempts = 3, retry_delay = 0, lease = 30)
+            started = asyncio.Event()
+            torn_down_while: Dict[str, Any] = {}
+
+            @runner.register("sleep")
+            async def sleep(payload: Dict[str, Any]) -> None:
+                started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(0.2)
+                    async with AsyncDatabaseConnection() as session:
+                        torn_down_while["status"] = (await session.execute(select(Job.status).filter(Job.job_id == job_id))).scalar()
+                    raise
+
+            try:
+                async with AsyncDatabaseConnection() as session:
+                    job_id = await runner.enqueue(session, "sleep", {}, "testing")
+                    await session.commit()
+                await runner.start()
+                await asyncio.wait_for(started.wait(), 5)
+                await runner.stop()
+
+                async with AsyncDatabaseConnection() as session:
+                    job = (await session.execute(select(Job.status, Job.attempts).filter(Job.job_id == job_id))).one()
+                return {"torn_down_while": torn_down_while.get("status"), "status": job.status, "attempts": job.attempts}
+            finally:
+                await runner.stop()
+                await AsyncEngine.dispose()
+
+        job = asyncio.run(run())
+
+        assert job["torn_down_while"] == "running"
+        assert job["status"] == "pending"
+        assert job["attempts"] == 0
\ No newline at end of file
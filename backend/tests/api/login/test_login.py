@@ -1,5 +1,8 @@
 from fastapi import status
 from fastapi.testclient import TestClient
+from util.helper.string import Blake2bHash, StringHash
+from data_models import DatabaseConnection
+from data_models.models import Account
 class TestLogin:
     """Test the login endpoint"""
 
@@ -165,3 +168,36 @@ class TestLogin:
         response_json = response.json()
         assert response_json["error"] == "InvalidCredentialsError"
         assert response_json["error_msg"] == "Invalid credentials."
+
+    def test_login_rehashes_legacy_password(self, client: TestClient, hasher: StringHash) -> None:
+        """Test that logging in with a password stored by the legacy blake2b hasher rehashes it."""
+
+        legacy_hasher = Blake2bHash()
+        salt = legacy_hasher.create_salt()
+        with DatabaseConnection() as db:
+            db.add(Account(
+                username = "testing",
+                email = "abc@hello.com",
+                password_hash = legacy_hasher.hash(string = "qwqjdkjwlqrqo", salt = salt),
+                password_salt = salt,
+            ))
+            db.commit()
+
+        password_hashes = []
+        for _ in range(2):
+            response = client.post(
+                "/api/login/",
+                json = {
+                    "input_field": "testing",
+                    "password": "qwqjdkjwlqrqo",
+                }
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+            with DatabaseConnection() as db:
+                user: Account = db.query(Account).filter(Account.username == "testing").one()
+                assert not hasher.needs_rehash(user.password_hash)
+                assert hasher.verify(string = "qwqjdkjwlqrqo", salt = user.password_salt, hash = user.password_hash)
+                password_hashes.append(user.password_hash)
+
+        assert password_hashes[0] == password_hashes[1]
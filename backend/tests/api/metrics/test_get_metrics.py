@@ -0,0 +1,47 @@
+from typing import Dict, Tuple
+from fastapi import status
+from fastapi.testclient import TestClient
+from ...mock_data import TestUserInfo
+
+def parse_samples(exposition: str) -> Dict[str, float]:
+    """Map every sample line of a text exposition, name and labels, to its value"""
+
+    samples: Dict[str, float] = {}
+    for line in exposition.splitlines():
+        if line and not line.startswith("#"):
+            sample, value = line.rsplit(" ", 1)
+            samples[sample] = float(value)
+    return samples
+
+class TestGetMetrics:
+    """Test the Prometheus metrics endpoint."""
+
+    def test_get_metrics(self, client: TestClient, login_user: Tuple[TestUserInfo, str]) -> None:
+        """Test that requests, statements, hashing and tokens are exposed by route template and operation."""
+
+        response = client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        samples = parse_samples(response.text)
+        assert samples['http_requests_total{method="POST",route="/api/login/",status="201"}'] >= 1
+        assert samples['http_request_duration_seconds_count{method="POST",route="/api/login/",status="201"}'] >= 1
+        assert samples['http_request_duration_seconds_bucket{method="POST",route="/api/login/",status="201",le="+Inf"}'] >= 1
+        assert samples["http_requests_in_flight"] == 1
+        assert samples['db_statement_duration_seconds_count{route="/api/login/"}'] >= 1
+        assert samples['password_hash_duration_seconds_count{operation="hash"}'] >= 1
+        assert samples['password_hash_duration_seconds_count{operation="verify"}'] >= 1
+        assert samples['jwt_duration_seconds_count{operation="encode"}'] >= 1
+        assert "db_pool_checkout_wait_seconds_count" in samples
+        assert "db_pool_checkout_timeouts_total" in samples
+
+    def test_get_metrics_unmatched_route(self, client: TestClient) -> None:
+        """Test that requests no route matched share one label instead of their paths."""
+
+        client.get("/api/does-not-exist/")
+        response = client.get("/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        samples = parse_samples(response.text)
+        assert samples['http_requests_total{method="GET",route="unmatched",status="404"}'] >= 1
+        assert not any("does-not-exist" in sample for sample in samples)
\ No newline at end of file
@@ -0,0 +1,103 @@
+from typing import Tuple
+from fastapi import status
+from fastapi.testclient import TestClient
+from ..mock_data import TestUserInfo, TestWorkspaceInfo
+
+class TestHealthCheck:
+    """Test the healthcheck endpoint."""
+
+    def test_healthcheck(self, client: TestClient) -> None:
+        """Test the healthcheck endpoint."""
+        
+        response = client.get("/api/healthcheck/")
+
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["error"] is None
+        assert response_json["error_msg"] is None
+        assert response_json["data"] is None
+        assert response_json["msg"] == "OK"
+
+    def test_healthcheck_pool(self, client: TestClient) -> None:
+        """Test the connection pool statistics endpoint."""
+
+        client.get("/api/healthcheck/")
+        response = client.get("/api/healthcheck/pool/")
+
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["error"] is None
+        assert response_json["error_msg"] is None
+        assert response_json["msg"] == "OK"
+        pool_statistics = response_json["data"]
+        assert pool_statistics["checked_out"] >= 0
+        assert pool_statistics["overflow"] >= 0
+        assert "+Inf" in pool_statistics["checkout_wait_seconds"]["buckets"]
+
+    def test_healthcheck_token_cache(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that repeated requests with the same access token hit the token cache."""
+
+        user, access_token = login_user
+        before = client.get("/api/healthcheck/token-cache/").json()["data"]
+
+        for _ in range(3):
+            client.get(
+                "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user.username, test_workspace_info.workspace_default_name),
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+        response = client.get("/api/healthcheck/token-cache/")
+
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["error"] is None
+        assert response_json["msg"] == "OK"
+        after = response_json["data"]
+        assert after["hits"] - before["hits"] >= 2
+        assert after["size"] >= 1
+
+    def test_healthcheck_membership_cache(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that repeated requests to the same workspace hit the membership cache."""
+
+        user, access_token = login_user
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        before = client.get("/api/healthcheck/membership-cache/").json()["data"]
+
+        for _ in range(3):
+            client.get(
+                "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user.username, test_workspace_info.workspace_default_name),
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+        response = client.get("/api/healthcheck/membership-cache/")
+
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["error"] is None
+        assert response_json["msg"] == "OK"
+        after = response_json["data"]
+        assert after["hits"] - before["hits"] >= 2
+        assert after["backend"] == "InMemoryMembershipCache"
+
+    def test_healthcheck_requests(self, client: TestClient) -> None:
+        """Test that requests are counted by route template and status, unmatched paths under one label."""
+
+        client.get("/api/healthcheck/")
+        client.get("/api/healthcheck/")
+        client.get("/api/user/workspace/?username=testing")
+        client.get("/api/does-not-exist/")
+        response = client.get("/api/healthcheck/requests/")
+
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["msg"] == "OK"
+        counts = {(entry["method"], entry["route"], entry["status"]): entry for entry in response_json["data"]}
+        assert counts[("GET", "/api/healthcheck/", 200)]["count"] >= 2
+        assert counts[("GET", "/api/healthcheck/", 200)]["duration_seconds"]["count"] >= 2
+        assert counts[("GET", "/api/user/workspace/", 401)]["count"] >= 1
+        assert counts[("GET", "unmatched", 404)]["count"] >= 1
\ No newline at end of file
@@ -0,0 +1,57 @@
+from typing import Callable, List
+import pytest
+from fastapi.testclient import TestClient
+from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
+
+@pytest.fixture
+def create_workspace_todolist(client: TestClient, test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> Callable[[TestUserInfo, str], int]:
+    """Return a function creating the workspace with its todo list for a user and returning the todo list id"""
+
+    def create(user: TestUserInfo, access_token: str) -> int:
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        create_todolist_response = client.post(
+            "/api/workspace/todolist/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_name": test_todolist_info.todolist_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        return int(create_todolist_response.json()["data"])
+
+    return create
+
+@pytest.fixture
+def create_todos(client: TestClient, test_workspace_info: TestWorkspaceInfo) -> Callable[[TestUserInfo, str, int], List[int]]:
+    """Return a function creating six todos in a todo list, every other one done, and returning their ids"""
+
+    def create(user: TestUserInfo, access_token: str, todolist_id: int) -> List[int]:
+        response = client.post(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todos": [
+                    {
+                        "todolist_id": todolist_id,
+                        "todo_name": f"todo {i}",
+                        "todo_due_date": f"2021-01-{i + 1:02d}",
+                        "todo_status": "done" if i % 2 else "created",
+                    }
+                    for i in range(6)
+                ],
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        return [result["todo_id"] for result in response.json()["data"]]
+
+    return create
\ No newline at end of file
@@ -0,0 +1,126 @@
+from typing import Callable, List, Tuple
+from fastapi import status
+from fastapi.testclient import TestClient
+from data_models import DatabaseConnection
+from data_models.models import Todo
+from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
+
+class TestBulkChangeTodos:
+    """Test the bulk change todos endpoint."""
+
+    def test_bulk_change_todos_by_ids(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int], create_todos: Callable[[TestUserInfo, str, int], List[int]]) -> None:
+        """Test that only the todos of the given ids are changed."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+        todo_ids = create_todos(user, access_token, todolist_id)
+
+        response = client.put(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_id": todolist_id,
+                "todo_ids": todo_ids[:2],
+                "todo_priority": "high",
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        response_json = response.json()
+        assert response_json["error"] is None
+        assert response_json["data"] == 2
+        assert response_json["msg"] == f'2 todos have been modified in todo list "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
+
+        with DatabaseConnection() as db:
+            high_priority_ids = [todo.todo_id for todo in db.query(Todo).filter(Todo.priority == "high").all()]
+            assert sorted(high_priority_ids) == sorted(todo_ids[:2])
+
+    def test_bulk_change_todos_by_filters(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int], create_todos: Callable[[TestUserInfo, str, int], List[int]]) -> None:
+        """Test that the todos matching the filters are changed, and that empty filters select the whole todo list."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+        create_todos(user, access_token, todolist_id)
+
+        for filters, status_value, expected_count in (
+            ({"status": ["[eq]created"], "due_date": ["[lt]2021-01-05"]}, "started", 2),
+            ({}, "done", 6),
+        ):
+            response = client.put(
+                "/api/workspace/todolist/todo/bulk/",
+                json = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "filters": filters,
+                    "todo_status": status_value,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+            assert response.json()["data"] == expected_count
+
+            with DatabaseConnection() as db:
+                assert db.query(Todo).filter(Todo.status == status_value).count() == expected_count
+
+class TestBulkChangeTodosInputError:
+    """Test the bulk change todos endpoint with invalid input."""
+
+    def test_bulk_change_todos_invalid_input_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int], create_todos: Callable[[TestUserInfo, str, int], List[int]]) -> None:
+        """Test that requests without a selection, without changes or with invalid filters are rejected."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+        create_todos(user, access_token, todolist_id)
+
+        for body, error in (
+            ({"todo_status": "done"}, "ValidationError"),
+            ({"filters": {}}, "ValidationError"),
+            ({"filters": {"todo_id": ["[eq]1"]}, "todo_status": "done"}, "ValidationError"),
+            ({"filters": {"status": ["done"]}, "todo_status": "done"}, "ValidationError"),
+            ({"filters": {}, "todo_name": "x" * 256}, "ValidationError"),
+            ({"filters": {"due_date": ["[eq]not a date"]}, "todo_status": "done"}, "InvalidFilterError"),
+        ):
+            response = client.put(
+                "/api/workspace/todolist/todo/bulk/",
+                json = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    **body,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+            assert response.json()["error"] == error
+
+        with DatabaseConnection() as db:
+            assert db.query(Todo).filter(Todo.status == "done").count() == 3
+
+    def test_bulk_change_todos_other_todolist_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int], create_todos: Callable[[TestUserInfo, str, int], List[int]]) -> None:
+        """Test that todos cannot be changed through a todo list that is not in the workspace."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+        todo_ids = create_todos(user, access_token, todolist_id)
+
+        response = client.put(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_id": todolist_id + 1,
+                "todo_ids": todo_ids,
+                "todo_status": "done",
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response_json = response.json()
+        assert response_json["error"] == "NotFoundError"
+        assert response_json["error_msg"] == f'Todo list of id "{todolist_id + 1}" is not found in workspace "{test_workspace_info.workspace_default_name}".'
@@ -0,0 +1,140 @@
+import datetime
+from typing import Callable, Tuple
+from fastapi import status
+from fastapi.testclient import TestClient
+from data_models import DatabaseConnection
+from data_models.models import Todo
+from routes.todo.schema import BULK_CREATE_TODO_LIMIT
+from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
+
+class TestBulkCreateTodos:
+    """Test the bulk create todos endpoint."""
+
+    def test_bulk_create_todos(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int]) -> None:
+        """Test that every todo of a bulk request is created and reported in request order."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+
+        response = client.post(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todos": [
+                    {
+                        "todolist_id": todolist_id,
+                        "todo_name": f"todo {i}",
+                        "todo_due_date": f"2021-01-{i + 1:02d}",
+                        "todo_priority": "high" if i % 2 else None,
+                    }
+                    for i in range(10)
+                ],
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_json = response.json()
+        assert response_json["error"] is None
+        assert response_json["error_msg"] is None
+        assert response_json["msg"] == f'10 of 10 todos created in workspace "{test_workspace_info.workspace_default_name}".'
+        results = response_json["data"]
+        assert [result["index"] for result in results] == list(range(10))
+        assert all(result["error_msg"] is None for result in results)
+
+        with DatabaseConnection() as db:
+            for i, result in enumerate(results):
+                todo: Todo = db.query(Todo).filter(Todo.todo_id == result["todo_id"]).one()
+                assert todo.name == f"todo {i}"
+                assert todo.todolist_id == todolist_id
+                assert todo.due_date == datetime.datetime(2021, 1, i + 1)
+                assert todo.priority == ("high" if i % 2 else None)
+
+    def test_bulk_create_todos_reports_invalid_items(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int]) -> None:
+        """Test that invalid items are reported without preventing the valid ones from being created."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+
+        response = client.post(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todos": [
+                    {"todolist_id": todolist_id, "todo_name": "first"},
+                    {"todolist_id": todolist_id + 1, "todo_name": "unknown todo list"},
+                    {"todolist_id": todolist_id, "todo_name": "x" * 256},
+                    {"todolist_id": todolist_id, "todo_name": "last"},
+                ],
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_json = response.json()
+        assert response_json["msg"] == f'2 of 4 todos created in workspace "{test_workspace_info.workspace_default_name}".'
+        results = response_json["data"]
+        assert results[1] == {
+            "index": 1,
+            "todo_id": None,
+            "error_msg": f'Todo list of id "{todolist_id + 1}" is not found in workspace "{test_workspace_info.workspace_default_name}".',
+        }
+        assert results[2] == {
+            "index": 2,
+            "todo_id": None,
+            "error_msg": 'Field "todo_name" is longer than 255 characters.',
+        }
+
+        with DatabaseConnection() as db:
+            assert db.query(Todo).filter(Todo.todo_id == results[0]["todo_id"]).one().name == "first"
+            assert db.query(Todo).filter(Todo.todo_id == results[3]["todo_id"]).one().name == "last"
+            assert db.query(Todo).count() == 2
+
+class TestBulkCreateTodosInputError:
+    """Test the bulk create todos endpoint with invalid input."""
+
+    def test_bulk_create_todos_over_limit_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int]) -> None:
+        """Test that a bulk request over the batch limit is rejected as a whole."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+
+        response = client.post(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todos": [{"todolist_id": todolist_id, "todo_name": "testing"}] * (BULK_CREATE_TODO_LIMIT + 1),
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["error"] == "ValidationError"
+
+        with DatabaseConnection() as db:
+            assert db.query(Todo).count() == 0
+
+    def test_bulk_create_todos_user_not_joined_raises(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int]) -> None:
+        """Test that a user cannot bulk create todos in a workspace they have not joined."""
+
+        user1, access_token1 = login_users[0]
+        user2, access_token2 = login_users[1]
+        todolist_id = create_workspace_todolist(user1, access_token1)
+
+        response = client.post(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user2.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todos": [{"todolist_id": todolist_id, "todo_name": "testing"}],
+            },
+            headers={"Authorization": f"Bearer {access_token2}"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response_json = response.json()
+        assert response_json["error"] == "NotFoundError"
+        assert response_json["error_msg"] == f'User "{user2.username}" has not joined workspace "{test_workspace_info.workspace_default_name}".'
@@ -0,0 +1,94 @@
+from typing import Callable, List, Tuple
+from fastapi import status
+from fastapi.testclient import TestClient
+from data_models import DatabaseConnection
+from data_models.models import Todo
+from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
+
+class TestBulkDeleteTodos:
+    """Test the bulk delete todos endpoint."""
+
+    def test_bulk_delete_todos(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int], create_todos: Callable[[TestUserInfo, str, int], List[int]]) -> None:
+        """Test that the todos selected by ids and filters are deleted and counted."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+        todo_ids = create_todos(user, access_token, todolist_id)
+
+        for body, expected_count, remaining in (
+            ({"todo_ids": todo_ids[:3], "filters": {"status": ["[eq]done"]}}, 1, 5),
+            ({"filters": {"status": ["[eq]done"]}}, 2, 3),
+            ({"filters": {}}, 3, 0),
+        ):
+            response = client.delete(
+                "/api/workspace/todolist/todo/bulk/",
+                json = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    **body,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+            response_json = response.json()
+            assert response_json["error"] is None
+            assert response_json["data"] == expected_count
+            assert response_json["msg"] == f'{expected_count} todos have been deleted in todo list "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
+
+            with DatabaseConnection() as db:
+                assert db.query(Todo).count() == remaining
+
+class TestBulkDeleteTodosInputError:
+    """Test the bulk delete todos endpoint with invalid input."""
+
+    def test_bulk_delete_todos_no_selection_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int], create_todos: Callable[[TestUserInfo, str, int], List[int]]) -> None:
+        """Test that a bulk delete without ids or filters is rejected."""
+
+        user, access_token = login_user
+        todolist_id = create_workspace_todolist(user, access_token)
+        create_todos(user, access_token, todolist_id)
+
+        response = client.delete(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_id": todolist_id,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["error"] == "ValidationError"
+
+        with DatabaseConnection() as db:
+            assert db.query(Todo).count() == 6
+
+    def test_bulk_delete_todos_user_not_joined_raises(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, create_workspace_todolist: Callable[[TestUserInfo, str], int], create_todos: Callable[[TestUserInfo, str, int], List[int]]) -> None:
+        """Test that a user cannot bulk delete todos of a workspace they have not joined."""
+
+        user1, access_token1 = login_users[0]
+        user2, access_token2 = login_users[1]
+        todolist_id = create_workspace_todolist(user1, access_token1)
+        create_todos(user1, access_token1, todolist_id)
+
+        response = client.delete(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user2.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_id": todolist_id,
+                "filters": {},
+            },
+            headers={"Authorization": f"Bearer {access_token2}"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response_json = response.json()
+        assert response_json["error"] == "NotFoundError"
+        assert response_json["error_msg"] == f'User "{user2.username}" has not joined workspace "{test_workspace_info.workspace_default_name}".'
+
+        with DatabaseConnection() as db:
+            assert db.query(Todo).count() == 6
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import List, Tuple, Union
 from fastapi import status
 from fastapi.testclient import TestClient
 from data_models import DatabaseConnection
@@ -7,6 +7,8 @@ import pytest
 import jwt # type: ignore
 from config.auth_tokens_config import AUTH_TOKENS_CONFIG
 import time
+import json
+import base64
 from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
 
 def create_token(username: str, exp_time: int) -> str:
@@ -98,20 +100,20 @@ class TestGetTodos:
             if todo["todo_id"] == int(todolist_todo1_respnose.json()["data"]):
                 assert todo["todo_name"] == "testing"
                 assert todo["todo_description"] == "testing"
-                assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                 assert todo["todo_priority"] == "high"
                 assert todo["todo_status"] == "created"
             elif todo["todo_id"] == int(todolist_todo2_respnose.json()["data"]):
                 assert todo["todo_name"] == "new_testing"
                 assert todo["todo_description"] == "new_testing"
-                assert todo["todo_due_date"] == "2021-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-02T00:00:00"
                 assert todo["todo_priority"] == "low"
                 assert todo["todo_status"] == "pending"
             else:
                 assert todo["todo_id"] == int(todolist_todo3_respnose.json()["data"])
                 assert todo["todo_name"] == "old_testing"
                 assert todo["todo_description"] == "old_testing"
-                assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2023-01-02T00:00:00"
                 assert todo["todo_priority"] is None
                 assert todo["todo_status"] == "finished"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -223,20 +225,20 @@ class TestGetTodos:
             if todo["todo_id"] == int(todolist_todo1_respnose.json()["data"]):
                 assert todo["todo_name"] == "testing"
                 assert todo["todo_description"] == "testing"
-                assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                 assert todo["todo_priority"] == "high"
                 assert todo["todo_status"] == "created"
             elif todo["todo_id"] == int(todolist_todo2_respnose.json()["data"]):
                 assert todo["todo_name"] == "new_testing"
                 assert todo["todo_description"] == "new_testing"
-                assert todo["todo_due_date"] == "2021-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-02T00:00:00"
                 assert todo["todo_priority"] == "low"
                 assert todo["todo_status"] == "pending"
             else:
                 assert todo["todo_id"] == int(todolist_todo3_respnose.json()["data"])
                 assert todo["todo_name"] == "old_testing"
                 assert todo["todo_description"] == "old_testing"
-                assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2023-01-02T00:00:00"
                 assert todo["todo_priority"] is None
                 assert todo["todo_status"] == "finished"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -359,7 +361,7 @@ class TestGetTodosFilter:
         todo = response_json["data"][0]
         assert todo["todo_name"] == "testing"
         assert todo["todo_description"] == "testing"
-        assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+        assert todo["todo_due_date"] == "2021-01-01T00:00:00"
         assert todo["todo_priority"] == "high"
         assert todo["todo_status"] == "created"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -378,14 +380,14 @@ class TestGetTodosFilter:
             if todo["todo_id"] == int(todolist_todo1_respnose.json()["data"]):
                 assert todo["todo_name"] == "testing"
                 assert todo["todo_description"] == "testing"
-                assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                 assert todo["todo_priority"] == "high"
                 assert todo["todo_status"] == "created"
             else:
                 assert todo["todo_id"] == int(todolist_todo3_respnose.json()["data"])
                 assert todo["todo_name"] == "old_testing"
                 assert todo["todo_description"] == "old_testing"
-                assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2023-01-02T00:00:00"
                 assert todo["todo_priority"] is None
                 assert todo["todo_status"] == "finished"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -404,7 +406,7 @@ class TestGetTodosFilter:
 
         assert todo["todo_name"] == "old_testing"
         assert todo["todo_description"] == "old_testing"
-        assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+        assert todo["todo_due_date"] == "2023-01-02T00:00:00"
         assert todo["todo_priority"] is None
         assert todo["todo_status"] == "finished"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -490,20 +492,20 @@ class TestGetTodosFilter:
             if todo["todo_id"] == int(todolist_todo1_respnose.json()["data"]):
                 assert todo["todo_name"] == "testing"
                 assert todo["todo_description"] == "testing"
-                assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                 assert todo["todo_priority"] == "high"
                 assert todo["todo_status"] == "created"
             elif todo["todo_id"] == int(todolist_todo2_respnose.json()["data"]):
                 assert todo["todo_name"] == "new_testing"
                 assert todo["todo_description"] == "new_testing"
-                assert todo["todo_due_date"] == "2021-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-02T00:00:00"
                 assert todo["todo_priority"] == "low"
                 assert todo["todo_status"] == "pending"
             else:
                 assert todo["todo_id"] == int(todolist_todo3_respnose.json()["data"])
                 assert todo["todo_name"] == "old_testing"
                 assert todo["todo_description"] == "old_testing"
-                assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2023-01-02T00:00:00"
                 assert todo["todo_priority"] is None
                 assert todo["todo_status"] == "finished"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -522,14 +524,14 @@ class TestGetTodosFilter:
             if todo["todo_id"] == int(todolist_todo1_respnose.json()["data"]):
                 assert todo["todo_name"] == "testing"
                 assert todo["todo_description"] == "testing"
-                assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                 assert todo["todo_priority"] == "high"
                 assert todo["todo_status"] == "created"
             else:
                 assert todo["todo_id"] == int(todolist_todo2_respnose.json()["data"])
                 assert todo["todo_name"] == "new_testing"
                 assert todo["todo_description"] == "new_testing"
-                assert todo["todo_due_date"] == "2021-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-02T00:00:00"
                 assert todo["todo_priority"] == "low"
                 assert todo["todo_status"] == "pending"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -548,14 +550,14 @@ class TestGetTodosFilter:
             if todo["todo_id"] == int(todolist_todo1_respnose.json()["data"]):
                 assert todo["todo_name"] == "testing"
                 assert todo["todo_description"] == "testing"
-                assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                 assert todo["todo_priority"] == "high"
                 assert todo["todo_status"] == "created"
             else:
                 assert todo["todo_id"] == int(todolist_todo3_respnose.json()["data"])
                 assert todo["todo_name"] == "old_testing"
                 assert todo["todo_description"] == "old_testing"
-                assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+                assert todo["todo_due_date"] == "2023-01-02T00:00:00"
                 assert todo["todo_priority"] is None
                 assert todo["todo_status"] == "finished"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -573,7 +575,7 @@ class TestGetTodosFilter:
         todo = response_json["data"][0]
         assert todo["todo_name"] == "testing"
         assert todo["todo_description"] == "testing"
-        assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+        assert todo["todo_due_date"] == "2021-01-01T00:00:00"
         assert todo["todo_priority"] == "high"
         assert todo["todo_status"] == "created"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -660,18 +662,18 @@ class TestGetTodosSort:
         first_todo = response_json["data"][0]
         assert first_todo["todo_name"] == "new_testing"
         assert first_todo["todo_description"] == "new_testing"
-        assert first_todo["todo_due_date"] == "2021-01-02 00:00:00"
+        assert first_todo["todo_due_date"] == "2021-01-02T00:00:00"
         assert first_todo["todo_priority"] == "low"
         second_todo = response_json["data"][1]
         assert second_todo["todo_name"] == "old_testing"
         assert second_todo["todo_description"] == "old_testing"
-        assert second_todo["todo_due_date"] == "2023-01-02 00:00:00"
+        assert second_todo["todo_due_date"] == "2023-01-02T00:00:00"
         assert second_todo["todo_priority"] is None
         assert second_todo["todo_status"] == "finished"
         third_todo = response_json["data"][2]
         assert third_todo["todo_name"] == "testing"
         assert third_todo["todo_description"] == "testing"
-        assert third_todo["todo_due_date"] == "2021-01-01 00:00:00"
+        assert third_todo["todo_due_date"] == "2021-01-01T00:00:00"
         assert third_todo["todo_priority"] == "high"
         assert third_todo["todo_status"] == "created"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -689,19 +691,19 @@ class TestGetTodosSort:
         first_todo = response_json["data"][0]
         assert first_todo["todo_name"] == "new_testing"
         assert first_todo["todo_description"] == "new_testing"
-        assert first_todo["todo_due_date"] == "2021-01-02 00:00:00"
+        assert first_todo["todo_due_date"] == "2021-01-02T00:00:00"
         assert first_todo["todo_priority"] == "low"
         assert first_todo["todo_status"] == "pending"
         second_todo = response_json["data"][1]
         assert second_todo["todo_name"] == "old_testing"
         assert second_todo["todo_description"] == "old_testing"
-        assert second_todo["todo_due_date"] == "2023-01-02 00:00:00"
+        assert second_todo["todo_due_date"] == "2023-01-02T00:00:00"
         assert second_todo["todo_priority"] is None
         assert second_todo["todo_status"] == "finished"
         third_todo = response_json["data"][2]
         assert third_todo["todo_name"] == "testing"
         assert third_todo["todo_description"] == "testing"
-        assert third_todo["todo_due_date"] == "2021-01-01 00:00:00"
+        assert third_todo["todo_due_date"] == "2021-01-01T00:00:00"
         assert third_todo["todo_priority"] == "high"
         assert third_todo["todo_status"] == "created"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -719,19 +721,19 @@ class TestGetTodosSort:
         first_todo = response_json["data"][0]
         assert first_todo["todo_name"] == "testing"
         assert first_todo["todo_description"] == "testing"
-        assert first_todo["todo_due_date"] == "2021-01-01 00:00:00"
+        assert first_todo["todo_due_date"] == "2021-01-01T00:00:00"
         assert first_todo["todo_priority"] == "high"
         assert first_todo["todo_status"] == "created"
         second_todo = response_json["data"][1]
         assert second_todo["todo_name"] == "new_testing"
         assert second_todo["todo_description"] == "new_testing"
-        assert second_todo["todo_due_date"] == "2021-01-02 00:00:00"
+        assert second_todo["todo_due_date"] == "2021-01-02T00:00:00"
         assert second_todo["todo_priority"] == "low"
         assert second_todo["todo_status"] == "pending"
         third_todo = response_json["data"][2]
         assert third_todo["todo_name"] == "old_testing"
         assert third_todo["todo_description"] == "old_testing"
-        assert third_todo["todo_due_date"] == "2023-01-02 00:00:00"
+        assert third_todo["todo_due_date"] == "2023-01-02T00:00:00"
         assert third_todo["todo_priority"] is None
         assert third_todo["todo_status"] == "finished"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -816,13 +818,13 @@ class TestGetTodosSort:
         first_todo = response_json["data"][0]
         assert first_todo["todo_name"] == "testing"
         assert first_todo["todo_description"] == "testing"
-        assert first_todo["todo_due_date"] == "2021-01-01 00:00:00"
+        assert first_todo["todo_due_date"] == "2021-01-01T00:00:00"
         assert first_todo["todo_priority"] == "high"
         assert first_todo["todo_status"] == "created"
         second_todo = response_json["data"][1]
         assert second_todo["todo_name"] == "new_testing"
         assert second_todo["todo_description"] == "new_testing"
-        assert second_todo["todo_due_date"] == "2021-01-02 00:00:00"
+        assert second_todo["todo_due_date"] == "2021-01-02T00:00:00"
         assert second_todo["todo_priority"] == "low"
         assert second_todo["todo_status"] == "pending"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
@@ -840,11 +842,501 @@ class TestGetTodosSort:
         first_todo = response_json["data"][0]
         assert first_todo["todo_name"] == "new_testing"
         assert first_todo["todo_description"] == "new_testing"
-        assert first_todo["todo_due_date"] == "2021-01-02 00:00:00"
+        assert first_todo["todo_due_date"] == "2021-01-02T00:00:00"
         assert first_todo["todo_priority"] == "low"
         assert first_todo["todo_status"] == "pending"
         assert response_json["msg"] == f'Get all todos in todolist "{test_todolist_info.todolist_name}" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
 
+class TestGetTodosTypedFilter:
+    """Test that filter values are coerced to the type of the filtered field."""
+
+    def create_todos(self, client: TestClient, user: TestUserInfo, access_token: str, workspace_default_name: str, todolist_name: str) -> int:
+        """Create a todo list with todos and return its id."""
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        create_todolist_response = client.post(
+            "/api/workspace/todolist/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+                "todolist_name": todolist_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        todolist_id = int(create_todolist_response.json()["data"])
+
+        for todo_name, todo_due_date, todo_priority in [("a", "2021-01-01T09:30:00", "high"), ("b", "2021-01-01T23:00:00", None), ("c", "2021-01-02", "low"), ("d", None, None)]:
+            client.post(
+                "/api/workspace/todolist/todo/",
+                json = {
+                    "username": user.username,
+                    "workspace_default_name": workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "todo_name": todo_name,
+                    "todo_due_date": todo_due_date,
+                    "todo_priority": todo_priority,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+        return todolist_id
+
+    def get_todo_names(self, client: TestClient, user: TestUserInfo, access_token: str, workspace_default_name: str, todolist_id: int, **filters: Union[str, List[str]]) -> List[str]:
+        """Get the sorted names of the todos matching the filters."""
+
+        response = client.get(
+            "/api/workspace/todolist/todos/",
+            params = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+                "todolist_id": todolist_id,
+                **filters,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return sorted(todo["todo_name"] for todo in response.json()["data"])
+
+    def test_filter_due_date(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that a date matches the whole day and a datetime matches the exact time."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        for due_date_filter, todo_names in [
+            ("[eq]2021-01-01", ["a", "b"]),
+            ("[ne]2021-01-01", ["c"]),
+            ("[gt]2021-01-01", ["c"]),
+            ("[le]2021-01-01", ["a", "b"]),
+            ("[lt]2021-01-02", ["a", "b"]),
+            ("[ge]2021-01-02", ["c"]),
+            ("[gt]2021-01-01T10:00:00", ["b", "c"]),
+            ("[eq]2021-01-01 09:30:00", ["a"]),
+            ("[eq]null", ["d"]),
+            ("[ne]NULL", ["a", "b", "c"]),
+        ]:
+            assert self.get_todo_names(client, user, access_token, test_workspace_info.workspace_default_name, todolist_id, due_date=due_date_filter) == todo_names
+
+    def test_null_due_date_serialized_as_null(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that a todo without a due date returns null and dated todos keep the datetime format."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        response = client.get(
+            "/api/workspace/todolist/todos/",
+            params = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_id": todolist_id,
+                "sort_by": "name",
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        todos = response.json()["data"]
+        assert [todo["todo_due_date"] for todo in todos] == ["2021-01-01T09:30:00", "2021-01-01T23:00:00", "2021-01-02T00:00:00", None]
+
+    def test_filter_priority_not_null(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that [ne]null selects the todos with a value."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        assert self.get_todo_names(client, user, access_token, test_workspace_info.workspace_default_name, todolist_id, priority="[ne]null") == ["a", "c"]
+
+    def test_filter_in_nin(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that [in] and [nin] match against lists of values, null and whole days included."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        for filters, todo_names in [
+            ({"priority": "[in]high,low"}, ["a", "c"]),
+            ({"priority": "[in]high,null"}, ["a", "b", "d"]),
+            ({"priority": "[nin]high"}, ["c"]),
+            ({"priority": "[nin]null"}, ["a", "c"]),
+            ({"name": "[in]a,b,z"}, ["a", "b"]),
+            ({"name": "[in]a\\,b"}, []),
+            ({"due_date": "[in]2021-01-02,2021-01-01T09:30:00"}, ["a", "c"]),
+            ({"due_date": "[nin]2021-01-01"}, ["c"]),
+        ]:
+            assert self.get_todo_names(client, user, access_token, test_workspace_info.workspace_default_name, todolist_id, **filters) == todo_names
+
+    def test_filter_any_of(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that a todo has to match one filter of every group and all the other filters."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        high_or_late = json.dumps({"priority": ["[eq]high"], "due_date": ["[ge]2021-01-02"]})
+        for filters, todo_names in [
+            ({"any_of": high_or_late}, ["a", "c"]),
+            ({"any_of": high_or_late, "name": "[ne]a"}, ["c"]),
+            ({"any_of": [high_or_late, json.dumps({"name": ["[in]a,b"]})]}, ["a"]),
+            ({"any_of": json.dumps({})}, ["a", "b", "c", "d"]),
+        ]:
+            assert self.get_todo_names(client, user, access_token, test_workspace_info.workspace_default_name, todolist_id, **filters) == todo_names
+
+        for any_of, error_msg in [
+            ("[eq]high", 'Invalid filter group "[eq]high".'),
+            (json.dumps({"priority": ["high"]}), 'Invalid filter group "{\"priority\": [\"high\"]}".'),
+            (json.dumps({"owner": ["[eq]a"]}), 'Field "owner" cannot be filtered.'),
+        ]:
+            response = client.get(
+                "/api/workspace/todolist/todos/",
+                params = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "any_of": any_of,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+            assert response.json()["error"] == "InvalidFilterError"
+            assert response.json()["error_msg"] == error_msg
+
+    def test_filter_invalid_value_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that a value which cannot be coerced to the field type raises."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        for filters, error_msg in [
+            ({"due_date": "[eq]yesterday"}, 'Invalid datetime "yesterday" for field "due_date".'),
+            ({"priority": "[gt]null"}, 'Operator "gt" cannot compare field "priority" with null.'),
+            ({"name": "[eq]" + "a" * 256}, 'Value of field "name" is longer than 255 characters.'),
+        ]:
+            response = client.get(
+                "/api/workspace/todolist/todos/",
+                params = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    **filters,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+            response_json = response.json()
+            assert response_json["error"] == "InvalidFilterError"
+            assert response_json["error_msg"] == error_msg
+            assert response_json["data"] is None
+            assert response_json["msg"] is None
+
+class TestGetTodosMatchFilter:
+    """Test the substring and prefix filters of text fields."""
+
+    def test_filter_like_ilike_prefix(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that like and prefix match case sensitively, ilike does not and wildcards in values match literally."""
+        user, access_token = login_user
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        client.post(
+            "/api/workspace/",
+            json = {"username": user.username, "workspace_default_name": test_workspace_info.workspace_default_name},
+            headers=headers,
+        )
+        todolist_id = int(client.post(
+            "/api/workspace/todolist/",
+            json = {"username": user.username, "workspace_default_name": test_workspace_info.workspace_default_name, "todolist_name": test_todolist_info.todolist_name},
+            headers=headers,
+        ).json()["data"])
+        for todo_name in ["Buy Milk", "buy bread", "Sell 100% of stock", "milk_shake"]:
+            client.post(
+                "/api/workspace/todolist/todo/",
+                json = {"username": user.username, "workspace_default_name": test_workspace_info.workspace_default_name, "todolist_id": todolist_id, "todo_name": todo_name},
+                headers=headers,
+            )
+
+        for name_filters, todo_names in [
+            (["[like]Milk"], ["Buy Milk"]),
+            (["[ilike]MILK"], ["Buy Milk", "milk_shake"]),
+            (["[prefix]buy"], ["buy bread"]),
+            (["[like]%"], ["Sell 100% of stock"]),
+            (["[like]_"], ["milk_shake"]),
+            (["[ilike]buy", "[ne]buy bread"], ["Buy Milk"]),
+            (["[like]null"], []),
+        ]:
+            response = client.get(
+                "/api/workspace/todolist/todos/",
+                params = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "name": name_filters,
+                },
+                headers=headers,
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert sorted(todo["todo_name"] for todo in response.json()["data"]) == todo_names
+
+        response = client.get(
+            "/api/workspace/todolist/todos/",
+            params = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_id": todolist_id,
+                "due_date": "[like]2021",
+            },
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["error_msg"] == 'Operator "like" cannot match field "due_date".'
+
+class TestGetTodosPagination:
+    """Test the get todos endpoint with keyset pagination."""
+
+    def create_todos(self, client: TestClient, user: TestUserInfo, access_token: str, workspace_default_name: str, todolist_name: str) -> int:
+        """Create a todo list with todos and return its id."""
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        create_todolist_response = client.post(
+            "/api/workspace/todolist/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+                "todolist_name": todolist_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        todolist_id = int(create_todolist_response.json()["data"])
+
+        for todo_name, todo_due_date in [("c", "2021-01-03"), ("a", None), ("e", "2021-01-01"), ("b", "2021-01-03"), ("d", None)]:
+            client.post(
+                "/api/workspace/todolist/todo/",
+                json = {
+                    "username": user.username,
+                    "workspace_default_name": workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "todo_name": todo_name,
+                    "todo_due_date": todo_due_date,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+        return todolist_id
+
+    def test_paginate_todos_sort_by_name(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that following the cursors returns every todo exactly once in sorted order."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        todo_names = []
+        cursor = None
+        for _ in range(3):
+            response = client.get(
+                "/api/workspace/todolist/todos/",
+                params = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "sort_by": "name",
+                    "limit": 2,
+                    **({"cursor": cursor} if cursor is not None else {}),
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            response_json = response.json()
+            assert response_json["error"] is None
+            assert response_json["error_msg"] is None
+            assert len(response_json["data"]) <= 2
+            todo_names.extend(todo["todo_name"] for todo in response_json["data"])
+            cursor = response_json["next_cursor"]
+
+        assert todo_names == ["a", "b", "c", "d", "e"]
+        assert cursor is None
+
+    def test_paginate_todos_sort_by_nullable_field_desc(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that pages of a nullable sort field match the unpaginated order."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        todo_names = []
+        cursor = None
+        while True:
+            response = client.get(
+                "/api/workspace/todolist/todos/",
+                params = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "sort_by": "due_date",
+                    "order_by": "desc",
+                    "limit": 1,
+                    **({"cursor": cursor} if cursor is not None else {}),
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            response_json = response.json()
+            todo_names.extend(todo["todo_name"] for todo in response_json["data"])
+            cursor = response_json["next_cursor"]
+            if cursor is None:
+                break
+
+        assert todo_names == ["d", "a", "b", "c", "e"]
+
+    def test_paginate_todos_invalid_cursor_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that a malformed cursor is rejected."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        response = client.get(
+            "/api/workspace/todolist/todos/?username={}&workspace_default_name={}&todolist_id={}&limit={}&cursor={}".format(user.username, test_workspace_info.workspace_default_name, todolist_id, 2, "not-a-cursor"),
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response_json = response.json()
+        assert response_json["error"] == "InvalidCursorError"
+        assert response_json["error_msg"] == "Invalid cursor."
+        assert response_json["data"] is None
+        assert response_json["msg"] is None
+
+    def test_paginate_todos_cursor_of_other_sorting_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that a cursor cannot be reused with a different sorting."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+
+        response = client.get(
+            "/api/workspace/todolist/todos/?username={}&workspace_default_name={}&todolist_id={}&limit={}&sort_by={}".format(user.username, test_workspace_info.workspace_default_name, todolist_id, 2, "name"),
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        cursor = response.json()["next_cursor"]
+
+        response = client.get(
+            "/api/workspace/todolist/todos/?username={}&workspace_default_name={}&todolist_id={}&limit={}&sort_by={}&cursor={}".format(user.username, test_workspace_info.workspace_default_name, todolist_id, 2, "status", cursor),
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response_json = response.json()
+        assert response_json["error"] == "InvalidCursorError"
+        assert response_json["error_msg"] == "Cursor does not match the requested sorting."
+        assert response_json["data"] is None
+        assert response_json["msg"] is None
+
+    @pytest.mark.parametrize("value", [5, {"a": 1}])
+    def test_paginate_todos_cursor_of_other_value_type_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, value: Union[int, dict]) -> None:
+        """Test that a cursor whose value does not have the type of the sort column is rejected."""
+        user, access_token = login_user
+        todolist_id = self.create_todos(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+        cursor = base64.urlsafe_b64encode(json.dumps({"sort_by": "name", "order_by": "asc", "value": value, "id": 1}).encode()).decode()
+
+        response = client.get(
+            "/api/workspace/todolist/todos/?username={}&workspace_default_name={}&todolist_id={}&limit={}&sort_by={}&cursor={}".format(user.username, test_workspace_info.workspace_default_name, todolist_id, 2, "name", cursor),
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response_json = response.json()
+        assert response_json["error"] == "InvalidCursorError"
+        assert response_json["error_msg"] == "Invalid cursor."
+        assert response_json["data"] is None
+        assert response_json["msg"] is None
+
+class TestGetTodosConditional:
+    """Test the ETag of the get todos endpoint."""
+
+    def create_todolist(self, client: TestClient, user: TestUserInfo, access_token: str, workspace_default_name: str, todolist_name: str) -> int:
+        """Create a todo list with a todo and return its id."""
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        create_todolist_response = client.post(
+            "/api/workspace/todolist/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+                "todolist_name": todolist_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        todolist_id = int(create_todolist_response.json()["data"])
+
+        client.post(
+            "/api/workspace/todolist/todo/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+                "todolist_id": todolist_id,
+                "todo_name": "first",
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        return todolist_id
+
+    def test_get_todos_not_modified(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that an unchanged todo list answers 304 to its ETag, from the body cache otherwise, and that every write changes the ETag."""
+
+        user, access_token = login_user
+        todolist_id = self.create_todolist(client, user, access_token, test_workspace_info.workspace_default_name, test_todolist_info.todolist_name)
+        url = "/api/workspace/todolist/todos/?username={}&workspace_default_name={}&todolist_id={}".format(user.username, test_workspace_info.workspace_default_name, todolist_id)
+
+        response = client.get(url, headers={"Authorization": f"Bearer {access_token}"})
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        response = client.get(url, headers={"Authorization": f"Bearer {access_token}", "If-None-Match": etag})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        before = client.get("/api/healthcheck/response-cache/").json()["data"]
+        cached_response = client.get(url, headers={"Authorization": f"Bearer {access_token}"})
+        after = client.get("/api/healthcheck/response-cache/").json()["data"]
+        assert cached_response.status_code == status.HTTP_200_OK
+        assert cached_response.headers["ETag"] == etag
+        assert after["hits"] - before["hits"] == 1
+        assert 0 < after["bytes"] <= after["max_bytes"]
+
+        for method, path, body in (
+            ("post", "/api/workspace/todolist/todo/", {"todolist_id": todolist_id, "todo_name": "second"}),
+            ("put", "/api/workspace/todolist/todo/bulk/", {"todolist_id": todolist_id, "filters": {}, "todo_status": "done"}),
+            ("put", "/api/workspace/todolist/", {"todolist_id": todolist_id, "new_todolist_name": "renamed"}),
+        ):
+            client.request(
+                method,
+                path,
+                json = {"username": user.username, "workspace_default_name": test_workspace_info.workspace_default_name, **body},
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+            response = client.get(url, headers={"Authorization": f"Bearer {access_token}", "If-None-Match": etag})
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["ETag"] != etag
+            assert response.json() != cached_response.json()
+            etag = response.headers["ETag"]
+
+        response_json = response.json()
+        assert [todo["todo_name"] for todo in response_json["data"]] == ["first", "second"]
+        assert all(todo["todo_status"] == "done" for todo in response_json["data"])
+        assert response_json["msg"] == f'Get all todos in todolist "renamed" in workspace "{test_workspace_info.workspace_default_name}" successfully.'
+
 class TestGetTodosFilterSortingWrongFormatError:
     """Test the get todos with filter and sorting but wrong format"""
 
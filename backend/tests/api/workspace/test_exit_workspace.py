@@ -1,11 +1,13 @@
 import time
 from typing import Tuple
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 import jwt # type: ignore
 from config.auth_tokens_config import AUTH_TOKENS_CONFIG
 from data_models import DatabaseConnection
-from data_models.models import Account, TodoList, Todo
+from data_models.models import Account, TodoList, Todo, WorkSpace, WorkSpaceAccountLink
+from routes.workspace import workspace as workspace_routes
 from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
 
 def create_token(username: str, exp_time: int) -> str:
@@ -110,6 +112,97 @@ class TestUserLeaveWorkspace():
             query_user2 = db.query(Account).filter(Account.username == user2.username).one()
             assert query_user2.workspaces == []
 
+    def test_user_leave_workspace_revokes_cached_access(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that a user who has left a workspace loses access immediately although the membership was cached."""
+
+        user1, access_token1 = login_users[0]
+        user2, access_token2 = login_users[1]
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        client.put(
+            "/api/workspace/invite/",
+            json = {
+                "owner_username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "invitee_username": user2.username,
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        todos_url = "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user2.username, test_workspace_info.workspace_default_name)
+        response = client.get(todos_url, headers={"Authorization": f"Bearer {access_token2}"})
+        assert response.status_code == status.HTTP_200_OK
+
+        client.delete(
+            "/api/workspace/?username={}&workspace_default_name={}".format(user2.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {access_token2}"}
+        )
+
+        response = client.get(todos_url, headers={"Authorization": f"Bearer {access_token2}"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response_json = response.json()
+        assert response_json["error"] == "NotFoundError"
+        assert response_json["error_msg"] == f'User "{user2.username}" has not joined workspace "{test_workspace_info.workspace_default_name}".'
+
+    def test_user_left_in_another_process_cannot_write(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that writes check the membership in the database while a stale membership is still cached."""
+
+        user1, access_token1 = login_users[0]
+        user2, access_token2 = login_users[1]
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        client.put(
+            "/api/workspace/invite/",
+            json = {
+                "owner_username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "invitee_username": user2.username,
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        response = client.get(
+            "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user2.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {access_token2}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        # the leave is handled by another process, the membership stays in the cache of this one
+        with DatabaseConnection() as session:
+            user_id = session.query(Account.user_id).filter(Account.username == user2.username).scalar()
+            session.query(WorkSpaceAccountLink).filter(WorkSpaceAccountLink.user_id == user_id).delete()
+            session.commit()
+
+        response = client.post(
+            "/api/workspace/todolist/",
+            json = {
+                "username": user2.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_name": test_todolist_info.todolist_name,
+            },
+            headers={"Authorization": f"Bearer {access_token2}"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response_json = response.json()
+        assert response_json["error"] == "NotFoundError"
+        assert response_json["error_msg"] == f'User "{user2.username}" has not joined workspace "{test_workspace_info.workspace_default_name}".'
+
 
 class TestUsersleaveWorkspaceTokenError:
     """Test user leave workspace with token error"""
@@ -331,4 +424,85 @@ class TestOwnerLeaveWorkspaceDeleteTodos:
             todolist: TodoList = db.query(TodoList).filter(TodoList.todolist_id==int(create_todolist_response.json()["data"])).one_or_none()
             todo: Todo = db.query(Todo).filter(Todo.todo_id==int(created_todo_response.json()["data"])).one_or_none()
             assert todolist is None
-            assert todo is None
\ No newline at end of file
+            assert todo is None
+
+    def test_owner_leave_large_workspace_deletes_in_chunks(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a workspace with more todos than a delete chunk is torn down in chunks after its members lose access."""
+
+        monkeypatch.setattr(workspace_routes, "WORKSPACE_DELETE_CHUNK_SIZE", 2)
+        user1, access_token1 = login_users[0]
+        user2, access_token2 = login_users[1]
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        client.put(
+            "/api/workspace/invite/",
+            json = {
+                "owner_username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "invitee_username": user2.username,
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        create_todolist_response = client.post(
+            "/api/workspace/todolist/",
+            json = {
+                "username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_name": test_todolist_info.todolist_name,
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        client.post(
+            "/api/workspace/todolist/todo/bulk/",
+            json = {
+                "username": user1.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todos": [{"todolist_id": int(create_todolist_response.json()["data"]), "todo_name": f"todo {i}"} for i in range(5)],
+            },
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        response = client.delete(
+            "/api/workspace/?username={}&workspace_default_name={}".format(user1.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {access_token1}"}
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        response_json = response.json()
+        assert response_json["msg"] == f'User "{user1.username}" has left workspace "{test_workspace_info.workspace_default_name}" successfully.'
+        job_id = response_json["data"]
+        assert isinstance(job_id, int)
+
+        response = client.get(
+            "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user2.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {access_token2}"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        for _ in range(50):
+            job = client.get(
+                "/api/jobs/{}/?username={}".format(job_id, user1.username),
+                headers={"Authorization": f"Bearer {access_token1}"}
+            ).json()["data"]
+            if job["status"] == "succeeded":
+                break
+            time.sleep(0.1)
+        assert job["kind"] == "delete_workspace"
+        assert job["status"] == "succeeded"
+        assert job["result"] == {"deleted_todos": 5}
+
+        with DatabaseConnection() as db:
+            assert db.query(Todo).count() == 0
+            assert db.query(TodoList).count() == 0
+            assert db.query(WorkSpaceAccountLink).count() == 0
+            assert db.query(WorkSpace).count() == 0
\ No newline at end of file
@@ -1,5 +1,6 @@
+import json
 import time
-from typing import Tuple
+from typing import List, Tuple
 from fastapi import status
 from fastapi.testclient import TestClient
 import jwt # type: ignore
@@ -211,20 +212,20 @@ class TestGetAllTodoListsTodos:
                     if todo["todo_id"] == int(todolist1_todo1_respnose.json()["data"]):
                         assert todo["todo_name"] == "testing"
                         assert todo["todo_description"] == "testing"
-                        assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                        assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                         assert todo["todo_priority"] == "high"
                         assert todo["todo_status"] == "created"
                     elif todo["todo_id"] == int(todolist1_todo2_respnose.json()["data"]):
                         assert todo["todo_name"] == "new_testing"
                         assert todo["todo_description"] == "new_testing"
-                        assert todo["todo_due_date"] == "2021-01-02 00:00:00"
+                        assert todo["todo_due_date"] == "2021-01-02T00:00:00"
                         assert todo["todo_priority"] == "low"
                         assert todo["todo_status"] == "pending"
                     else:
                         assert todo["todo_id"] == int(todolist1_todo3_respnose.json()["data"])
                         assert todo["todo_name"] == "old_testing"
                         assert todo["todo_description"] == "old_testing"
-                        assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+                        assert todo["todo_due_date"] == "2023-01-02T00:00:00"
                         assert todo["todo_priority"] is None
                         assert todo["todo_status"] == "finished"
             else:
@@ -235,7 +236,7 @@ class TestGetAllTodoListsTodos:
                     assert todo["todo_id"] == int(todolist2_todo1_respnose.json()["data"])
                     assert todo["todo_name"] == "testing_dev"
                     assert todo["todo_description"] == "development"
-                    assert todo["todo_due_date"] == "2022-01-02 00:00:00"
+                    assert todo["todo_due_date"] == "2022-01-02T00:00:00"
                     assert todo["todo_priority"] == "medium"
                     assert todo["todo_status"] == "started"
             
@@ -370,19 +371,19 @@ class TestGetAllTodoListsTodos:
                     if todo["todo_id"] == int(todolist1_todo1_respnose.json()["data"]):
                         assert todo["todo_name"] == "testing"
                         assert todo["todo_description"] == "testing"
-                        assert todo["todo_due_date"] == "2021-01-01 00:00:00"
+                        assert todo["todo_due_date"] == "2021-01-01T00:00:00"
                         assert todo["todo_priority"] == "high"
                         assert todo["todo_status"] == "created"
                     elif todo["todo_id"] == int(todolist1_todo2_respnose.json()["data"]):
                         assert todo["todo_name"] == "new_testing"
                         assert todo["todo_description"] == "new_testing"
-                        assert todo["todo_due_date"] == "2021-01-02 00:00:00"
+                        assert todo["todo_due_date"] == "2021-01-02T00:00:00"
                         assert todo["todo_priority"] == "low"
                         assert todo["todo_status"] == "pending"
                     else:
                         assert todo["todo_name"] == "old_testing"
                         assert todo["todo_description"] == "old_testing"
-                        assert todo["todo_due_date"] == "2023-01-02 00:00:00"
+                        assert todo["todo_due_date"] == "2023-01-02T00:00:00"
                         assert todo["todo_priority"] is None
                         assert todo["todo_status"] == "finished"
             else:
@@ -392,11 +393,216 @@ class TestGetAllTodoListsTodos:
                     assert todo["todo_id"] == int(todolist2_todo1_respnose.json()["data"])
                     assert todo["todo_name"] == "testing_dev"
                     assert todo["todo_description"] == "development"
-                    assert todo["todo_due_date"] == "2022-01-02 00:00:00"
+                    assert todo["todo_due_date"] == "2022-01-02T00:00:00"
                     assert todo["todo_priority"] == "medium"
                     assert todo["todo_status"] == "started"
 
         assert response_json["msg"] == f'Get all todolists and corresponding todos in workspace "{test_workspace_info.workspace_default_name}" successfully.'
+class TestGetTodoListsTodosPaginationStream:
+    """Test the paginated and streamed variants of get all todolists and todos."""
+
+    def create_todolists(self, client: TestClient, user: TestUserInfo, access_token: str, workspace_default_name: str) -> List[int]:
+        """Create three todo lists holding three, one and no todos and return their ids."""
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        todolist_ids = []
+        for todolist_name, todo_names in [("first", ["a", "b", "c"]), ("second", ["d"]), ("third", [])]:
+            create_todolist_response = client.post(
+                "/api/workspace/todolist/",
+                json = {
+                    "username": user.username,
+                    "workspace_default_name": workspace_default_name,
+                    "todolist_name": todolist_name,
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            todolist_id = int(create_todolist_response.json()["data"])
+            todolist_ids.append(todolist_id)
+            for todo_name in todo_names:
+                client.post(
+                    "/api/workspace/todolist/todo/",
+                    json = {
+                        "username": user.username,
+                        "workspace_default_name": workspace_default_name,
+                        "todolist_id": todolist_id,
+                        "todo_name": todo_name,
+                        "todo_due_date": "2021-01-01",
+                    },
+                    headers={"Authorization": f"Bearer {access_token}"}
+                )
+        return todolist_ids
+
+    def test_paginate_todolists_with_todo_limit(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that the todolists are paged by id and each todolist keeps at most todo_limit todos."""
+
+        user, access_token = login_user
+        todolist_ids = self.create_todolists(client, user, access_token, test_workspace_info.workspace_default_name)
+
+        pages = []
+        cursor = None
+        while True:
+            response = client.get(
+                "/api/workspace/todolists/todos/",
+                params = {
+                    "username": user.username,
+                    "workspace_default_name": test_workspace_info.workspace_default_name,
+                    "limit": 2,
+                    "todo_limit": 2,
+                    **({"cursor": cursor} if cursor is not None else {}),
+                },
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.json()["data"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        assert [[todolist["todolist_id"] for todolist in page] for page in pages] == [todolist_ids[:2], todolist_ids[2:]]
+        todolists = [todolist for page in pages for todolist in page]
+        assert [[todo["todo_name"] for todo in todolist["todos"]] for todolist in todolists] == [["a", "b"], ["d"], []]
+        assert todolists[0]["todos"][0]["todo_due_date"] == "2021-01-01T00:00:00"
+
+    def test_paginate_todolists_invalid_cursor_raises(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that a malformed cursor raises."""
+
+        user, access_token = login_user
+        self.create_todolists(client, user, access_token, test_workspace_info.workspace_default_name)
+
+        response = client.get(
+            "/api/workspace/todolists/todos/",
+            params = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "cursor": "not-a-cursor",
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        response_json = response.json()
+        assert response_json["error"] == "InvalidCursorError"
+        assert response_json["error_msg"] == "Invalid cursor."
+
+    def test_stream_todolists_todos(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that the todolists are streamed one per line with their todos."""
+
+        user, access_token = login_user
+        todolist_ids = self.create_todolists(client, user, access_token, test_workspace_info.workspace_default_name)
+
+        response = client.get(
+            "/api/workspace/todolists/todos/stream/",
+            params = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todo_limit": 2,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        todolists = [json.loads(line) for line in response.text.splitlines()]
+        assert [todolist["todolist_id"] for todolist in todolists] == todolist_ids
+        assert [todolist["todolist_name"] for todolist in todolists] == ["first", "second", "third"]
+        assert [[todo["todo_name"] for todo in todolist["todos"]] for todolist in todolists] == [["a", "b"], ["d"], []]
+        assert todolists[0]["todos"][0]["todo_due_date"] == "2021-01-01T00:00:00"
+
+    def test_stream_todolists_todos_not_joined_raises(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that a user not in the workspace cannot stream it."""
+
+        (user1, access_token1), (user2, access_token2) = login_users
+        self.create_todolists(client, user1, access_token1, test_workspace_info.workspace_default_name)
+
+        response = client.get(
+            "/api/workspace/todolists/todos/stream/",
+            params = {
+                "username": user2.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token2}"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        response_json = response.json()
+        assert response_json["error"] == "NotFoundError"
+        assert response_json["error_msg"] == f'User "{user2.username}" has not joined workspace "{test_workspace_info.workspace_default_name}".'
+
+class TestGetTodoListsTodosConditional:
+    """Test the ETag of the get all todolists and todos endpoint."""
+
+    def test_get_todolists_todos_not_modified(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that an unchanged workspace answers 304 to its ETag and that writes to its todo lists and todos change the ETag."""
+
+        user, access_token = login_user
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        url = "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user.username, test_workspace_info.workspace_default_name)
+
+        response = client.get(url, headers={"Authorization": f"Bearer {access_token}"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == []
+        etag = response.headers["ETag"]
+
+        response = client.get(url, headers={"Authorization": f"Bearer {access_token}", "If-None-Match": f'"stale", W/{etag}'})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        create_todolist_response = client.post(
+            "/api/workspace/todolist/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_name": test_todolist_info.todolist_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        todolist_id = int(create_todolist_response.json()["data"])
+
+        response = client.get(url, headers={"Authorization": f"Bearer {access_token}", "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        etag = response.headers["ETag"]
+
+        create_todo_response = client.post(
+            "/api/workspace/todolist/todo/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+                "todolist_id": todolist_id,
+                "todo_name": "testing",
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        response = client.get(url, headers={"Authorization": f"Bearer {access_token}", "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert [todo["todo_name"] for todo in response.json()["data"][0]["todos"]] == ["testing"]
+        etag = response.headers["ETag"]
+
+        client.delete(
+            "/api/workspace/todolist/todo/?username={}&workspace_default_name={}&todolist_id={}&todo_id={}".format(user.username, test_workspace_info.workspace_default_name, todolist_id, int(create_todo_response.json()["data"])),
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        response = client.get(url, headers={"Authorization": f"Bearer {access_token}", "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"][0]["todos"] == []
+
 class TestGetTodoListsTodosTokenError:
     """Test getting todo lists and todos with token error."""
 
@@ -471,6 +677,42 @@ class TestGetTodoListsTodosTokenError:
         )
 
 
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response_json = response.json()
+        assert response_json["error"] == "TokenExpiredError"
+        assert response_json["error_msg"] == "Token has expired."
+        assert response_json["data"] is None
+        assert response_json["msg"] is None
+
+    def test_cached_access_token_expires(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that an access token accepted before it expired is rejected once it has expired."""
+
+        user, access_token = login_user
+
+        short_lived_access_token = create_token(user.username, 1)
+
+        client.post(
+            "/api/workspace/",
+            json = {
+                "username": user.username,
+                "workspace_default_name": test_workspace_info.workspace_default_name,
+            },
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        response = client.get(
+            "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {short_lived_access_token}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        time.sleep(2)
+
+        response = client.get(
+            "/api/workspace/todolists/todos/?username={}&workspace_default_name={}".format(user.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {short_lived_access_token}"}
+        )
+
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         response_json = response.json()
         assert response_json["error"] == "TokenExpiredError"
@@ -0,0 +1,105 @@
+from typing import Dict, List, Tuple
+from fastapi import status
+from fastapi.testclient import TestClient
+from ...mock_data import TestUserInfo, TestWorkspaceInfo, TestTodoListInfo
+
+class TestGetTodoListsTodosChanges:
+    """Test the todo change feed of a workspace."""
+
+    def test_get_changes_since_cursor(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo, test_todolist_info: TestTodoListInfo) -> None:
+        """Test that a sync only returns the todos modified and deleted since its cursor."""
+
+        user, access_token = login_user
+        headers = {"Authorization": f"Bearer {access_token}"}
+        workspace_default_name = test_workspace_info.workspace_default_name
+
+        client.post("/api/workspace/", json = {"username": user.username, "workspace_default_name": workspace_default_name}, headers=headers)
+        todolist_id = int(client.post(
+            "/api/workspace/todolist/",
+            json = {"username": user.username, "workspace_default_name": workspace_default_name, "todolist_name": test_todolist_info.todolist_name},
+            headers=headers,
+        ).json()["data"])
+        todo_ids: List[int] = [
+            int(client.post(
+                "/api/workspace/todolist/todo/",
+                json = {"username": user.username, "workspace_default_name": workspace_default_name, "todolist_id": todolist_id, "todo_name": todo_name},
+                headers=headers,
+            ).json()["data"])
+            for todo_name in ("first", "second", "third")
+        ]
+
+        def sync(since: str = None, limit: int = 100) -> Dict:
+            url = "/api/workspace/todolists/todos/changes/?username={}&workspace_default_name={}&limit={}".format(user.username, workspace_default_name, limit)
+            response = client.get(url if since is None else f"{url}&since={since}", headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["msg"] == f'Get the changed todos in workspace "{workspace_default_name}" successfully.'
+            return response.json()
+
+        first_page = sync(limit = 2)
+        assert [todo["todo_id"] for todo in first_page["data"]["todos"]] == todo_ids[:2]
+        assert first_page["data"]["deleted_todos"] == []
+        assert first_page["has_more"]
+
+        second_page = sync(first_page["next_cursor"], limit = 2)
+        assert [todo["todo_id"] for todo in second_page["data"]["todos"]] == todo_ids[2:]
+        assert not second_page["has_more"]
+
+        unchanged = sync(second_page["next_cursor"])
+        assert unchanged["data"] == {"todos": [], "deleted_todos": []}
+        assert not unchanged["has_more"]
+        cursor = unchanged["next_cursor"]
+
+        client.put(
+            "/api/workspace/todolist/todo/",
+            json = {"username": user.username, "workspace_default_name": workspace_default_name, "todolist_id": todolist_id, "todo_id": todo_ids[0], "todo_name": "renamed"},
+            headers=headers,
+        )
+        client.delete(
+            "/api/workspace/todolist/todo/?username={}&workspace_default_name={}&todolist_id={}&todo_id={}".format(user.username, workspace_default_name, todolist_id, todo_ids[1]),
+            headers=headers,
+        )
+
+        changes = sync(cursor)
+        assert [(todo["todo_id"], todo["todo_name"]) for todo in changes["data"]["todos"]] == [(todo_ids[0], "renamed")]
+        assert [(todo["todo_id"], todo["todolist_id"]) for todo in changes["data"]["deleted_todos"]] == [(todo_ids[1], todolist_id)]
+        cursor = changes["next_cursor"]
+
+        client.delete(
+            "/api/workspace/todolist/?username={}&workspace_default_name={}&todolist_id={}".format(user.username, workspace_default_name, todolist_id),
+            headers=headers,
+        )
+
+        changes = sync(cursor)
+        assert changes["data"]["todos"] == []
+        assert sorted(todo["todo_id"] for todo in changes["data"]["deleted_todos"]) == [todo_ids[0], todo_ids[2]]
+
+        initial_sync = sync()
+        assert initial_sync["data"] == {"todos": [], "deleted_todos": []}
+        assert sync(initial_sync["next_cursor"])["data"] == {"todos": [], "deleted_todos": []}
+
+    def test_get_changes_invalid_cursor(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that a malformed cursor is rejected."""
+
+        user, access_token = login_user
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        client.post("/api/workspace/", json = {"username": user.username, "workspace_default_name": test_workspace_info.workspace_default_name}, headers=headers)
+
+        response = client.get(
+            "/api/workspace/todolists/todos/changes/?username={}&workspace_default_name={}&since=invalid".format(user.username, test_workspace_info.workspace_default_name),
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["error"] == "InvalidCursorError"
+
+    def test_get_changes_workspace_not_found(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that the changes of a missing workspace are not found."""
+
+        user, access_token = login_user
+
+        response = client.get(
+            "/api/workspace/todolists/todos/changes/?username={}&workspace_default_name={}".format(user.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["error_msg"] == f'Workspace "{test_workspace_info.workspace_default_name}" not found.'
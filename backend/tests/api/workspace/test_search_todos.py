@@ -0,0 +1,81 @@
+from typing import List, Tuple
+from fastapi import status
+from fastapi.testclient import TestClient
+from ...mock_data import TestUserInfo, TestWorkspaceInfo
+
+class TestSearchTodos:
+    """Test the todo search of a workspace."""
+
+    def test_search_todos_ranked_across_todolists(self, client: TestClient, login_user: Tuple[TestUserInfo, str], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that the search finds the todos of every todolist, ranks name matches first and pages through them."""
+
+        user, access_token = login_user
+        headers = {"Authorization": f"Bearer {access_token}"}
+        workspace_default_name = test_workspace_info.workspace_default_name
+
+        client.post("/api/workspace/", json = {"username": user.username, "workspace_default_name": workspace_default_name}, headers=headers)
+        todolist_ids: List[int] = [
+            int(client.post(
+                "/api/workspace/todolist/",
+                json = {"username": user.username, "workspace_default_name": workspace_default_name, "todolist_name": todolist_name},
+                headers=headers,
+            ).json()["data"])
+            for todolist_name in ("home", "errands")
+        ]
+        todo_ids: List[int] = [
+            int(client.post(
+                "/api/workspace/todolist/todo/",
+                json = {
+                    "username": user.username,
+                    "workspace_default_name": workspace_default_name,
+                    "todolist_id": todolist_id,
+                    "todo_name": todo_name,
+                    "todo_description": todo_description,
+                },
+                headers=headers,
+            ).json()["data"])
+            for todolist_id, todo_name, todo_description in (
+                (todolist_ids[0], "Walk the dog", "Buy milk on the way back"),
+                (todolist_ids[1], "Buy milk", None),
+                (todolist_ids[1], "Call the bank", None),
+            )
+        ]
+
+        url = "/api/workspace/todos/search/?username={}&workspace_default_name={}".format(user.username, workspace_default_name)
+
+        response = client.get(f"{url}&query=milk", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert [(todo["todo_id"], todo["todolist_id"]) for todo in response_json["data"]] == [(todo_ids[1], todolist_ids[1]), (todo_ids[0], todolist_ids[0])]
+        assert response_json["next_cursor"] is None
+        assert response_json["msg"] == f'Search todos in workspace "{workspace_default_name}" successfully.'
+
+        first_page = client.get(f"{url}&query=milk&limit=1", headers=headers).json()
+        assert [todo["todo_id"] for todo in first_page["data"]] == [todo_ids[1]]
+        second_page = client.get(f"{url}&query=milk&limit=1&cursor={first_page['next_cursor']}", headers=headers).json()
+        assert [todo["todo_id"] for todo in second_page["data"]] == [todo_ids[0]]
+        assert second_page["next_cursor"] is None
+
+        response = client.get(f'{url}&query="the bank" or dogs -milk', headers=headers)
+        assert [todo["todo_id"] for todo in response.json()["data"]] == [todo_ids[2]]
+
+        response = client.get(f"{url}&query=groceries", headers=headers)
+        assert response.json()["data"] == []
+
+    def test_search_todos_workspace_not_joined(self, client: TestClient, login_users: Tuple[Tuple[TestUserInfo, str], Tuple[TestUserInfo, str]], test_workspace_info: TestWorkspaceInfo) -> None:
+        """Test that a user cannot search the todos of a workspace they have not joined."""
+
+        (first_user, first_access_token), (second_user, second_access_token) = login_users
+
+        client.post(
+            "/api/workspace/",
+            json = {"username": first_user.username, "workspace_default_name": test_workspace_info.workspace_default_name},
+            headers={"Authorization": f"Bearer {first_access_token}"},
+        )
+
+        response = client.get(
+            "/api/workspace/todos/search/?username={}&workspace_default_name={}&query=milk".format(second_user.username, test_workspace_info.workspace_default_name),
+            headers={"Authorization": f"Bearer {second_access_token}"},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["error_msg"] == f'User "{second_user.username}" has not joined workspace "{test_workspace_info.workspace_default_name}".'
@@ -0,0 +1,4 @@
+import os
+
+# the tests hash a password for every user they log in, the production cost of scrypt would dominate their run time
+os.environ.setdefault("PASSWORD_HASH_SCRYPT_N", str(2 ** 4))
\ No newline at end of file
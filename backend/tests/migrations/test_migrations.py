@@ -0,0 +1,131 @@
+import importlib
+from typing import Dict, Generator, Optional, Set, Tuple
+import pytest
+from sqlalchemy import inspect, text # type: ignore
+from data_models import Base, Engine
+from data_models.migrations import Migrator
+from data_models.migrations.migrator import VERSION_TABLE
+from util.exceptions import MigrationError
+
+Schema = Dict[str, Tuple[Set[str], Set[Tuple[str, Tuple[str, ...], bool]], Set[Tuple[Tuple[str, ...], str, Optional[str]]]]]
+
+def reflect_schema() -> Schema:
+    """Return the columns, indexes and foreign keys of every table except the version table"""
+
+    inspector = inspect(Engine)
+    return {
+        table: (
+            {column["name"] for column in inspector.get_columns(table)},
+            {(index["name"], tuple(index["column_names"]), bool(index["unique"])) for index in inspector.get_indexes(table)},
+            {
+                (tuple(foreign_key["constrained_columns"]), foreign_key["referred_table"], foreign_key["options"].get("ondelete"))
+                for foreign_key in inspector.get_foreign_keys(table)
+            },
+        )
+        for table in inspector.get_table_names()
+        if table != VERSION_TABLE
+    }
+
+def drop_schema() -> None:
+    Base.metadata.drop_all(bind = Engine)
+    with Engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {VERSION_TABLE}"))
+
+@pytest.fixture
+def empty_database() -> Generator[None, None, None]:
+    drop_schema()
+    yield
+    drop_schema()
+
+@pytest.fixture
+def pg_trgm() -> None:
+    """Skip the tests which upgrade to head where the trigram indexes cannot be created"""
+
+    with Engine.connect() as connection:
+        if connection.execute(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")).first() is None:
+            pytest.skip("the pg_trgm extension is not available")
+
+@pytest.fixture
+def models_schema(empty_database) -> Schema:
+    """Return the schema the models create"""
+
+    Base.metadata.create_all(bind = Engine)
+    schema = reflect_schema()
+    Base.metadata.drop_all(bind = Engine)
+    return schema
+
+class TestMigrations:
+    """Test the schema migrations."""
+
+    @pytest.mark.parametrize("online", [False, True])
+    def test_upgrade_head_matches_models(self, pg_trgm: None, models_schema: Schema, online: bool) -> None:
+        """Test that upgrading an empty database to head creates the schema of the models."""
+
+        migrator = Migrator()
+
+        assert migrator.upgrade(online = online) == [revision.revision for revision in migrator.revisions]
+        assert migrator.current() == migrator.head
+        assert reflect_schema() == models_schema
+
+    def test_downgrade_base_removes_schema(self, pg_trgm: None, empty_database) -> None:
+        """Test that downgrading every revision leaves no tables behind."""
+
+        migrator = Migrator()
+        migrator.upgrade()
+
+        assert migrator.downgrade("base") == [revision.revision for revision in reversed(migrator.revisions)]
+        assert migrator.current() is None
+        assert reflect_schema() == {}
+
+    def test_stamped_database_upgrades_to_models(self, pg_trgm: None, models_schema: Schema) -> None:
+        """Test that a database created before migrations can be stamped at the first revision and upgraded."""
+
+        migrator = Migrator()
+        migrator.upgrade("0001")
+        with Engine.begin() as connection:
+            connection.execute(text(f"DELETE FROM {VERSION_TABLE}"))
+
+        migrator.stamp("0001")
+        assert migrator.upgrade() == [revision.revision for revision in migrator.revisions[1:]]
+        assert reflect_schema() == models_schema
+
+    @pytest.mark.parametrize("online", [False, True])
+    def test_search_vector_filled_for_existing_and_new_todos(self, empty_database, online: bool) -> None:
+        """Test that the search vector is backfilled for the existing todos and kept up to date for the written ones."""
+
+        migrator = Migrator()
+        migrator.upgrade("0006")
+        with Engine.begin() as connection:
+            workspace_id = connection.execute(text("INSERT INTO workspace (workspace_default_name) VALUES ('search') RETURNING workspace_id")).scalar()
+            connection.execute(
+                text("INSERT INTO todo (workspace_id, name, description, last_modified) VALUES (:workspace_id, 'existing', 'todo', now())"),
+                {"workspace_id": workspace_id},
+            )
+
+        migrator.upgrade("0007", online = online)
+        search = text("SELECT name FROM todo WHERE search_vector @@ to_tsquery('english', :query) ORDER BY name")
+        with Engine.begin() as connection:
+            connection.execute(
+                text("INSERT INTO todo (workspace_id, name, last_modified) VALUES (:workspace_id, 'inserted', now())"),
+                {"workspace_id": workspace_id},
+            )
+            backfilled_or_inserted = connection.execute(search, {"query": "todo | inserted"}).scalars().all()
+            connection.execute(text("UPDATE todo SET description = 'renamed' WHERE name = 'existing'"))
+            updated = connection.execute(search, {"query": "renamed"}).scalars().all()
+
+        assert backfilled_or_inserted == ["existing", "inserted"]
+        assert updated == ["existing"]
+
+    @pytest.mark.parametrize("online", [False, True])
+    def test_trigram_indexes_not_recorded_without_pg_trgm(
+        self, empty_database, monkeypatch: pytest.MonkeyPatch, online: bool
+    ) -> None:
+        """Test that the trigram revision fails and is not recorded as applied where pg_trgm is not available."""
+
+        trigram_revision = importlib.import_module("data_models.migrations.versions.0008_todo_trigram_indexes")
+        monkeypatch.setattr(trigram_revision, "pg_trgm_available", lambda context: False)
+        migrator = Migrator()
+
+        with pytest.raises(MigrationError, match = "pg_trgm"):
+            migrator.upgrade(online = online)
+        assert migrator.current() == "0007"
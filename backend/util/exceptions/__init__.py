@@ -2,6 +2,7 @@ from .database_exceptions import (
     DatabaseError,
     DuplicateError,
     InvalidCredentialsError,
+    MigrationError,
 )
 
 from .api_exceptions import (
@@ -10,4 +11,6 @@ from .api_exceptions import (
     UnauthorizedError,
     InvalidTokenError,
     NotFoundError,
+    InvalidCursorError,
+    InvalidFilterError,
 )
\ No newline at end of file
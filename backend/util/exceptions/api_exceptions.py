@@ -7,4 +7,8 @@ class TokenExpiredError(Exception):
 class InvalidTokenError(Exception):
     """Raised when a token is invalid."""
 class UnauthorizedError(Exception):
-    """Raised when a user is unauthorized to perform an action."""
\ No newline at end of file
+    """Raised when a user is unauthorized to perform an action."""
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor is malformed or does not match the request."""
+class InvalidFilterError(Exception):
+    """Raised when a filter value cannot be coerced to the type of the filtered field."""
\ No newline at end of file
@@ -5,4 +5,7 @@ class InvalidCredentialsError(DatabaseError):
     """Raised when the credentials are invalid."""
 
 class DuplicateError(DatabaseError):
-    """Raised when a duplicate entry is found."""
\ No newline at end of file
+    """Raised when a duplicate entry is found."""
+
+class MigrationError(DatabaseError):
+    """Raised when the schema migrations cannot be resolved or applied."""
\ No newline at end of file
@@ -1,3 +1,3 @@
 from .jwt import JWTHandler
 from .refresh_token import RefreshTokenHandler
-from .oauth_handler import auth_check
\ No newline at end of file
+from .oauth_handler import auth_check, token_cache
\ No newline at end of file
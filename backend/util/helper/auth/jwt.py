@@ -1,11 +1,19 @@
+import time
 import jwt # type: ignore
 from jwt.exceptions import ExpiredSignatureError, PyJWTError # type: ignore
-from typing import Dict
+from typing import Dict, Final
 from datetime import datetime, timedelta
 from util.types import Serializable
+from util.metrics import HistogramFamily, metrics_registry
 from util.exceptions import InvalidTokenError, TokenExpiredError
 from config.auth_tokens_config import AUTH_TOKENS_CONFIG
 
+JWT_DURATION_BUCKETS: Final = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+
+jwt_duration_seconds: Final = HistogramFamily(("operation",), JWT_DURATION_BUCKETS)
+
+metrics_registry.register("jwt_duration_seconds", "Time spent encoding and decoding access tokens.", jwt_duration_seconds)
+
 class JWTHandler:
     """A class that handles JWT operations."""
 
@@ -25,11 +33,15 @@ class JWTHandler:
     def create_token(self, **kwargs: Serializable) -> str:
         """Create an json web token."""
 
-        return jwt.encode(
-            self.__update_payload(kwargs), 
-            self.__SECRET_KEY, 
-            algorithm=self.__ALGORITHM
-        )
+        start = time.perf_counter()
+        try:
+            return jwt.encode(
+                self.__update_payload(kwargs), 
+                self.__SECRET_KEY, 
+                algorithm=self.__ALGORITHM
+            )
+        finally:
+            jwt_duration_seconds.labels("encode").observe(time.perf_counter() - start)
     
     def get_expiry_time(self, token: str) -> datetime:
         """Get the expiry time of the token."""
@@ -43,6 +55,7 @@ class JWTHandler:
 
     def get_payload(self, token: str) -> Dict[str, Serializable]:
         """Decode the token into a payload."""
+        start = time.perf_counter()
         try:
             return jwt.decode(
                 token, 
@@ -52,4 +65,6 @@ class JWTHandler:
         except ExpiredSignatureError:
             raise TokenExpiredError("Token has expired.")
         except PyJWTError:
-            raise InvalidTokenError("Invalid token.")
\ No newline at end of file
+            raise InvalidTokenError("Invalid token.")
+        finally:
+            jwt_duration_seconds.labels("decode").observe(time.perf_counter() - start)
\ No newline at end of file
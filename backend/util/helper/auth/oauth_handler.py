@@ -1,4 +1,6 @@
 from .jwt import JWTHandler
+from .token_cache import VerifiedTokenCache
+from config.auth_tokens_config import AUTH_TOKENS_CONFIG
 from ...exceptions import (
     UnauthorizedError,
     InvalidTokenError
@@ -7,6 +9,8 @@ from typing import Optional
 
 jwt_handler = JWTHandler()
 
+token_cache = VerifiedTokenCache(AUTH_TOKENS_CONFIG.token_cache_size, AUTH_TOKENS_CONFIG.token_cache_ttl)
+
 def auth_check(auth_header: Optional[str], auth_field: str, auth_value: str) -> None:
     """Check the authentication"""
 
@@ -14,7 +18,10 @@ def auth_check(auth_header: Optional[str], auth_field: str, auth_value: str) ->
         raise UnauthorizedError("Unauthorized action.")
 
     token = auth_header.replace("Bearer ", "")
-    payload = jwt_handler.get_payload(token)
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt_handler.get_payload(token)
+        token_cache.put(token, payload)
     
     if auth_field not in payload:
         raise InvalidTokenError("Invalid token.")
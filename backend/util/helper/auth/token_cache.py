@@ -0,0 +1,77 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from util.metrics import Counter
+from util.types import Serializable
+
+class VerifiedTokenCache:
+    """A bounded LRU cache of verified token payloads keyed by the digest of the token.
+
+    An entry lives for at most ttl seconds and never past the exp claim of its
+    token, so an expired token always goes back through verification.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__entries: OrderedDict[bytes, Tuple[float, Dict[str, Serializable]]] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = Counter()
+        self.__misses = Counter()
+
+    def __key(self, token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size = 32).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Serializable]]:
+        """Get the cached payload of a token"""
+
+        key = self.__key(token)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] > time.time():
+                self.__entries.move_to_end(key)
+            elif entry is not None:
+                del self.__entries[key]
+                entry = None
+
+        if entry is None:
+            self.__misses.inc()
+            return None
+        self.__hits.inc()
+        return dict(entry[1])
+
+    def put(self, token: str, payload: Dict[str, Serializable]) -> None:
+        """Cache the payload of a verified token"""
+
+        if self.__max_size <= 0:
+            return
+
+        expires_at = time.time() + self.__ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+
+        key = self.__key(token)
+        with self.__lock:
+            self.__entries[key] = (expires_at, dict(payload))
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last = False)
+
+    def clear(self) -> None:
+        """Drop every cached payload"""
+
+        with self.__lock:
+            self.__entries.clear()
+
+    def statistics(self) -> Dict[str, Serializable]:
+        """Get the size and the hit and miss counts of the cache"""
+
+        return {
+            "size": len(self.__entries),
+            "max_size": self.__max_size,
+            "hits": self.__hits.value,
+            "misses": self.__misses.value,
+        }
@@ -0,0 +1,6 @@
+from typing import Final
+from config.cache_config import CACHE_CONFIG
+from .orjson_response import EnvelopeResponse, ORJSONResponse, dumps
+from .http_cache import ResponseBodyCache, cacheable, etag_matches, not_modified, version_etag
+
+response_body_cache: Final = ResponseBodyCache(CACHE_CONFIG.response_cache_max_bytes, CACHE_CONFIG.response_cache_max_body_size)
\ No newline at end of file
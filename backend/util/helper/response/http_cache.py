@@ -0,0 +1,98 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Final, Hashable, Optional
+from fastapi import Response, status
+from util.metrics import Counter
+from util.types import Serializable
+
+CACHE_CONTROL: Final = "private, no-cache"
+
+def version_etag(kind: str, entity_id: int, version: int) -> str:
+    """Build the strong ETag of a listing from the id and version of the entity it lists"""
+
+    return f'"{kind}-{entity_id}-{version}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, comparing weakly as RFC 9110 asks for"""
+
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+def not_modified(etag: str) -> Response:
+    """Answer a conditional request whose representation has not changed"""
+
+    return Response(status_code = status.HTTP_304_NOT_MODIFIED, headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+def cacheable(response: Response, etag: str) -> Response:
+    """Add the ETag and the revalidation policy to a response"""
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+class ResponseBodyCache:
+    """An LRU cache of rendered response bodies bounded by their total size in bytes.
+
+    The keys hold the version of what the body lists, so entries are never
+    invalidated, a write bumps the version and the stale bodies age out.
+    """
+
+    def __init__(self, max_bytes: int, max_body_size: int) -> None:
+        self.__max_bytes = max_bytes
+        self.__max_body_size = min(max_body_size, max_bytes)
+        self.__entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self.__bytes = 0
+        self.__lock = threading.Lock()
+        self.__hits = Counter()
+        self.__misses = Counter()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Get a cached body"""
+
+        with self.__lock:
+            body = self.__entries.get(key)
+            if body is not None:
+                self.__entries.move_to_end(key)
+
+        if body is None:
+            self.__misses.inc()
+        else:
+            self.__hits.inc()
+        return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        """Cache a body unless it is larger than the max body size, evicting the least recently used bodies"""
+
+        if len(body) > self.__max_body_size:
+            return
+
+        with self.__lock:
+            replaced = self.__entries.pop(key, None)
+            if replaced is not None:
+                self.__bytes -= len(replaced)
+            self.__entries[key] = body
+            self.__bytes += len(body)
+            while self.__bytes > self.__max_bytes:
+                _, evicted = self.__entries.popitem(last = False)
+                self.__bytes -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached body"""
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def statistics(self) -> Dict[str, Serializable]:
+        """Get the size and the hit and miss counts of the cache"""
+
+        return {
+            "size": len(self.__entries),
+            "bytes": self.__bytes,
+            "max_bytes": self.__max_bytes,
+            "hits": self.__hits.value,
+            "misses": self.__misses.value,
+        }
\ No newline at end of file
@@ -0,0 +1,37 @@
+import orjson
+from typing import Any, Optional
+from fastapi.responses import JSONResponse
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson, datetimes in its native RFC 3339 format"""
+
+    return orjson.dumps(content)
+
+class ORJSONResponse(JSONResponse):
+    """A JSON response rendered by orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+class EnvelopeResponse(ORJSONResponse):
+    """A response wrapped in the error, error_msg, data and msg envelope shared by every endpoint."""
+
+    def __init__(
+        self,
+        status_code: int,
+        data: Any = None,
+        msg: Optional[str] = None,
+        error: Optional[str] = None,
+        error_msg: Optional[str] = None,
+        **fields: Any,
+    ) -> None:
+        super().__init__(
+            status_code = status_code,
+            content = {
+                "error": error,
+                "error_msg": error_msg,
+                "data": data,
+                "msg": msg,
+                **fields,
+            },
+        )
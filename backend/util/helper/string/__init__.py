@@ -1,3 +1,11 @@
+from typing import Final
+from config.password_hash_config import PASSWORD_HASH_CONFIG
 from .email import is_email_format
-from .hash import StringHash, StringHashFactory
-from .random import random_string
\ No newline at end of file
+from .hash import StringHash, StringHashFactory, Blake2bHash, ScryptHash
+from .hash_pool import HashWorkerPool
+from .random import random_string
+
+password_hasher: Final = HashWorkerPool(
+    StringHashFactory().get_hasher(PASSWORD_HASH_CONFIG.algorithm),
+    PASSWORD_HASH_CONFIG.workers,
+)
\ No newline at end of file
@@ -1,5 +1,10 @@
+import hashlib
+import hmac
+import secrets
 from hashlib import blake2b
 from abc import ABC, abstractmethod
+from typing import Final, Optional
+from config.password_hash_config import PASSWORD_HASH_CONFIG
 from .random import random_string
 
 class StringHash(ABC):
@@ -16,6 +21,11 @@ class StringHash(ABC):
     def verify(self, *, string: str, salt: str, hash: str) -> bool:
         """Verify a hash against a string"""
 
+    def needs_rehash(self, hash: str) -> bool:
+        """Check if a hash was made by another algorithm or with outdated parameters"""
+
+        return False
+
 class StringHashFactory:
 
     def get_hasher(self, hasher: str) -> StringHash:
@@ -23,6 +33,13 @@ class StringHashFactory:
         match hasher:
             case "blake2b":
                 return Blake2bHash()
+            case "scrypt":
+                return ScryptHash(
+                    n = PASSWORD_HASH_CONFIG.scrypt_n,
+                    r = PASSWORD_HASH_CONFIG.scrypt_r,
+                    p = PASSWORD_HASH_CONFIG.scrypt_p,
+                    legacy_hasher = Blake2bHash(),
+                )
             case _:
                 raise ValueError(f"Hasher {hasher} is not supported")
 
@@ -46,4 +63,61 @@ class Blake2bHash(StringHash):
         """Verify a hash against a string"""
         
         return self.hash(string=string, salt=salt) == hash
-    
\ No newline at end of file
+
+class ScryptHash(StringHash):
+    """Scrypt hash class.
+
+    Hashes are stored as ``scrypt$n$r$p$digest``, so hashes made with older
+    parameters still verify after the parameters are raised and can be told
+    apart to be rehashed. Hashes of the legacy hasher, if given, verify too.
+    """
+
+    PREFIX: Final = "scrypt"
+    DIGEST_SIZE: Final = 32
+
+    def __init__(self, *, n: int, r: int, p: int, legacy_hasher: Optional[StringHash] = None) -> None:
+        self.__n = n
+        self.__r = r
+        self.__p = p
+        self.__legacy_hasher = legacy_hasher
+
+    @classmethod
+    def __digest(cls, string: str, salt: str, n: int, r: int, p: int) -> str:
+        # scrypt needs 128 * r * (n + p) bytes, more than the default limit of 32 MiB for large n
+        return hashlib.scrypt(
+            string.encode(),
+            salt = salt.encode(),
+            n = n,
+            r = r,
+            p = p,
+            maxmem = 128 * r * (n + p) + 2 ** 20,
+            dklen = cls.DIGEST_SIZE,
+        ).hex()
+
+    def hash(self, *, string: str, salt: str) -> str:
+        """Hash sensitive string with scrypt algorithm"""
+
+        digest = self.__digest(string, salt, self.__n, self.__r, self.__p)
+        return f"{self.PREFIX}${self.__n}${self.__r}${self.__p}${digest}"
+
+    def create_salt(self) -> str:
+        """Create a salt for hashing"""
+
+        return secrets.token_hex(16)
+
+    def verify(self, *, string: str, salt: str, hash: str) -> bool:
+        """Verify a hash against a string with the parameters stored in the hash"""
+
+        parts = hash.split("$")
+        if parts[0] != self.PREFIX:
+            return self.__legacy_hasher is not None and self.__legacy_hasher.verify(string=string, salt=salt, hash=hash)
+        try:
+            _, n, r, p, digest = parts
+            return hmac.compare_digest(self.__digest(string, salt, int(n), int(r), int(p)), digest)
+        except ValueError:
+            return False
+
+    def needs_rehash(self, hash: str) -> bool:
+        """Check if a hash was made by the legacy hasher or with other parameters"""
+
+        return not hash.startswith(f"{self.PREFIX}${self.__n}${self.__r}${self.__p}$")
\ No newline at end of file
@@ -0,0 +1,64 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Final, TypeVar
+from util.metrics import HistogramFamily, metrics_registry
+from .hash import StringHash
+
+Result = TypeVar("Result")
+
+HASH_DURATION_BUCKETS: Final = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+hash_duration_seconds: Final = HistogramFamily(("operation",), HASH_DURATION_BUCKETS)
+
+metrics_registry.register(
+    "password_hash_duration_seconds",
+    "Time the hash workers spend hashing and verifying passwords, without the wait for a worker.",
+    hash_duration_seconds,
+)
+
+def _timed(operation: str, fn: Callable[[], Result]) -> Callable[[], Result]:
+    def run() -> Result:
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            hash_duration_seconds.labels(operation).observe(time.perf_counter() - start)
+    return run
+
+class HashWorkerPool:
+    """Runs a slow StringHash on its own bounded thread pool instead of the event loop.
+
+    hashlib releases the GIL while it hashes, so the workers hash in parallel
+    while the event loop keeps serving other requests. A burst of logins
+    queues up behind the workers instead of occupying the loop or the
+    default executor.
+    """
+
+    def __init__(self, hasher: StringHash, max_workers: int) -> None:
+        self.__hasher = hasher
+        self.__executor = ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = "hash-worker")
+
+    async def hash(self, *, string: str, salt: str) -> str:
+        """Hash sensitive string on a worker"""
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, _timed("hash", lambda: self.__hasher.hash(string=string, salt=salt))
+        )
+
+    async def verify(self, *, string: str, salt: str, hash: str) -> bool:
+        """Verify a hash against a string on a worker"""
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.__executor, _timed("verify", lambda: self.__hasher.verify(string=string, salt=salt, hash=hash))
+        )
+
+    def create_salt(self) -> str:
+        """Create a salt for hashing"""
+
+        return self.__hasher.create_salt()
+
+    def needs_rehash(self, hash: str) -> bool:
+        """Check if a hash was made by another algorithm or with outdated parameters"""
+
+        return self.__hasher.needs_rehash(hash)
\ No newline at end of file
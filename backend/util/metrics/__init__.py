@@ -0,0 +1,6 @@
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import Histogram
+from .family import CounterFamily, HistogramFamily, MetricFamily
+from .registry import EXPOSITION_CONTENT_TYPE, MetricsRegistry, metrics_registry
+from .route import BACKGROUND_ROUTE, current_route, route_resolver
\ No newline at end of file
@@ -0,0 +1,18 @@
+import threading
+
+class Counter:
+    """A monotonically increasing counter."""
+
+    def __init__(self) -> None:
+        self.__value = 0
+        self.__lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """Increase the counter"""
+
+        with self.__lock:
+            self.__value += amount
+
+    @property
+    def value(self) -> int:
+        return self.__value
@@ -0,0 +1,50 @@
+import threading
+from typing import Callable, Dict, Generic, List, Sequence, Tuple, TypeVar
+from .counter import Counter
+from .histogram import Histogram
+
+Metric = TypeVar("Metric", Counter, Histogram)
+
+class MetricFamily(Generic[Metric]):
+    """Metrics of one kind, one per combination of label values."""
+
+    def __init__(self, label_names: Sequence[str], create_metric: Callable[[], Metric]) -> None:
+        self.__label_names: Tuple[str, ...] = tuple(label_names)
+        self.__create_metric: Callable[[], Metric] = create_metric
+        self.__metrics: Dict[Tuple[str, ...], Metric] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def label_names(self) -> Tuple[str, ...]:
+        return self.__label_names
+
+    def labels(self, *label_values: str) -> Metric:
+        """Get the metric of the label values, creating it on first use"""
+
+        metric = self.__metrics.get(label_values)
+        if metric is None:
+            if len(label_values) != len(self.__label_names):
+                raise ValueError(f"Expected the values of labels {self.__label_names}")
+            with self.__lock:
+                metric = self.__metrics.get(label_values)
+                if metric is None:
+                    metric = self.__metrics[label_values] = self.__create_metric()
+        return metric
+
+    def collect(self) -> List[Tuple[Tuple[str, ...], Metric]]:
+        """Get the label values and metric of every combination seen so far"""
+
+        with self.__lock:
+            return sorted(self.__metrics.items(), key = lambda item: item[0])
+
+class CounterFamily(MetricFamily[Counter]):
+    """Counters labelled by the label values."""
+
+    def __init__(self, label_names: Sequence[str]) -> None:
+        super().__init__(label_names, Counter)
+
+class HistogramFamily(MetricFamily[Histogram]):
+    """Histograms with the same buckets labelled by the label values."""
+
+    def __init__(self, label_names: Sequence[str], buckets: Sequence[float]) -> None:
+        super().__init__(label_names, lambda: Histogram(buckets))
\ No newline at end of file
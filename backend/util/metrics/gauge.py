@@ -0,0 +1,24 @@
+import threading
+
+class Gauge:
+    """A value that goes up and down."""
+
+    def __init__(self) -> None:
+        self.__value = 0
+        self.__lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """Increase the gauge"""
+
+        with self.__lock:
+            self.__value += amount
+
+    def dec(self, amount: int = 1) -> None:
+        """Decrease the gauge"""
+
+        with self.__lock:
+            self.__value -= amount
+
+    @property
+    def value(self) -> int:
+        return self.__value
\ No newline at end of file
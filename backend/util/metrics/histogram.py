@@ -0,0 +1,53 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+from util.types import Serializable
+
+class Histogram:
+    """A histogram with fixed bucket upper bounds, reported cumulatively."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.__buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.__counts: List[int] = [0] * (len(self.__buckets) + 1)
+        self.__sum = 0.0
+        self.__count = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        return self.__buckets
+
+    def observe(self, value: float) -> None:
+        """Record a single observation"""
+
+        index = bisect_left(self.__buckets, value)
+        with self.__lock:
+            self.__counts[index] += 1
+            self.__sum += value
+            self.__count += 1
+
+    def cumulative(self) -> Tuple[List[Tuple[str, int]], float, int]:
+        """Get the cumulative count of every bucket by its upper bound, the sum and the count"""
+
+        with self.__lock:
+            counts = list(self.__counts)
+            total = self.__sum
+            count = self.__count
+
+        buckets: List[Tuple[str, int]] = []
+        cumulative = 0
+        for upper_bound, bucket_count in zip(self.__buckets, counts):
+            cumulative += bucket_count
+            buckets.append((str(upper_bound), cumulative))
+        buckets.append(("+Inf", count))
+        return buckets, total, count
+
+    def snapshot(self) -> Dict[str, Serializable]:
+        """Get the cumulative bucket counts, sum and count"""
+
+        buckets, total, count = self.cumulative()
+        return {
+            "buckets": dict(buckets),
+            "sum": total,
+            "count": count,
+        }
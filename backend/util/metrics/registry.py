@@ -0,0 +1,93 @@
+import threading
+from typing import Dict, Final, List, Sequence, Tuple, Union
+from .counter import Counter
+from .family import MetricFamily
+from .gauge import Gauge
+from .histogram import Histogram
+
+Metric = Union[Counter, Gauge, Histogram, MetricFamily]
+
+# version 0.0.4 of the Prometheus text exposition format, the response adds the charset
+EXPOSITION_CONTENT_TYPE: Final = "text/plain; version=0.0.4"
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)) + "}"
+
+def _format_value(value: Union[int, float]) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+def _metric_type(metric: Union[Counter, Gauge, Histogram]) -> str:
+    if isinstance(metric, Histogram):
+        return "histogram"
+    return "counter" if isinstance(metric, Counter) else "gauge"
+
+class MetricsRegistry:
+    """The metrics to expose, rendered in the Prometheus text exposition format.
+
+    Metrics register themselves under their exposed name where they are
+    defined, a scrape reads their current values without resetting them.
+    """
+
+    def __init__(self) -> None:
+        self.__metrics: Dict[str, Tuple[str, Metric]] = {}
+        self.__lock = threading.Lock()
+
+    def register(self, name: str, documentation: str, metric: Metric) -> None:
+        """Expose a metric or metric family under a name"""
+
+        with self.__lock:
+            if name in self.__metrics:
+                raise ValueError(f'Metric "{name}" is already registered.')
+            self.__metrics[name] = (documentation, metric)
+
+    @staticmethod
+    def __render_samples(
+        name: str,
+        label_names: Sequence[str],
+        label_values: Sequence[str],
+        metric: Union[Counter, Gauge, Histogram],
+    ) -> List[str]:
+        if not isinstance(metric, Histogram):
+            return [f"{name}{_format_labels(label_names, label_values)} {_format_value(metric.value)}"]
+
+        buckets, total, count = metric.cumulative()
+        bucket_label_names = (*label_names, "le")
+        lines = [
+            f"{name}_bucket{_format_labels(bucket_label_names, (*label_values, upper_bound))} {bucket_count}"
+            for upper_bound, bucket_count in buckets
+        ]
+        lines.append(f"{name}_sum{_format_labels(label_names, label_values)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(label_names, label_values)} {count}")
+        return lines
+
+    def render(self) -> str:
+        """Render the current value of every registered metric"""
+
+        with self.__lock:
+            metrics = sorted(self.__metrics.items())
+
+        lines: List[str] = []
+        for name, (documentation, metric) in metrics:
+            if isinstance(metric, MetricFamily):
+                series = metric.collect()
+                if not series:
+                    continue
+                metric_type = _metric_type(series[0][1])
+                label_names = metric.label_names
+            else:
+                series = [((), metric)]
+                metric_type = _metric_type(metric)
+                label_names = ()
+
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for label_values, labelled_metric in series:
+                lines.extend(self.__render_samples(name, label_names, label_values, labelled_metric))
+        return "\n".join(lines) + "\n"
+
+metrics_registry: Final = MetricsRegistry()
\ No newline at end of file
@@ -0,0 +1,17 @@
+from contextvars import ContextVar
+from typing import Callable, Final, Optional
+
+# statements outside of a request, the job runner's for one, are labelled with this route
+BACKGROUND_ROUTE: Final = "background"
+
+route_resolver: ContextVar[Optional[Callable[[], str]]] = ContextVar("route_resolver", default = None)
+
+def current_route() -> str:
+    """Get the route template of the request being handled in the current context.
+
+    The template is only known once the router has matched the request, so
+    the middleware sets a resolver for the request instead of the template.
+    """
+
+    resolve = route_resolver.get()
+    return BACKGROUND_ROUTE if resolve is None else resolve()
\ No newline at end of file
@@ -0,0 +1,2 @@
+from .error_middleware import ErrorEnvelopeMiddleware
+from .metrics_middleware import RequestMetricsMiddleware, request_duration_seconds, requests_in_flight, requests_total
\ No newline at end of file
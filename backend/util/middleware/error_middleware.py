@@ -0,0 +1,41 @@
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from util.exceptions import InternalServerError
+from util.helper.response import EnvelopeResponse
+
+class ErrorEnvelopeMiddleware:
+    """Answer unhandled exceptions with the internal server error envelope.
+
+    A plain ASGI middleware, it passes the messages of the app through
+    untouched, so responses, streaming ones included, are not buffered or
+    run in another task. An exception raised after the response has started
+    cannot be answered any more and is raised again.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.__app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_and_track(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.__app(scope, receive, send_and_track)
+        except Exception as e:
+            if response_started:
+                raise
+            response = EnvelopeResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                error=InternalServerError.__name__,
+                error_msg=str(e),
+            )
+            await response(scope, receive, send)
\ No newline at end of file
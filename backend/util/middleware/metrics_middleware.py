@@ -0,0 +1,74 @@
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Final, Sequence
+from starlette.routing import BaseRoute, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from util.metrics import CounterFamily, Gauge, HistogramFamily, metrics_registry, route_resolver
+
+REQUEST_DURATION_BUCKETS: Final = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# requests no route matched share a label, their paths would make the labels unbounded
+UNMATCHED_ROUTE: Final = "unmatched"
+
+request_duration_seconds: Final = HistogramFamily(("method", "route", "status"), REQUEST_DURATION_BUCKETS)
+requests_total: Final = CounterFamily(("method", "route", "status"))
+requests_in_flight: Final = Gauge()
+
+metrics_registry.register(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests by method, route template and status.",
+    request_duration_seconds,
+)
+metrics_registry.register("http_requests_total", "HTTP requests by method, route template and status.", requests_total)
+metrics_registry.register("http_requests_in_flight", "HTTP requests being handled.", requests_in_flight)
+
+class RequestMetricsMiddleware:
+    """Record the latency and status of every request by method and route template.
+
+    The template is found through the endpoint the router stores in the scope,
+    so the labels stay bounded by the routes and not by the request paths.
+    The route is also resolvable through ``current_route`` while the request
+    is handled, for the metrics recorded further down.
+    """
+
+    def __init__(self, app: ASGIApp, routes: Sequence[BaseRoute]) -> None:
+        self.__app = app
+        self.__routes = routes
+        self.__route_templates: Dict[Callable[..., Any], str] = {}
+
+    def __route_template(self, scope: Scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+
+        if endpoint not in self.__route_templates:
+            self.__route_templates[endpoint] = next(
+                (route.path for route in self.__routes if isinstance(route, Route) and route.endpoint is endpoint),
+                UNMATCHED_ROUTE,
+            )
+        return self.__route_templates[endpoint]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.__app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        requests_in_flight.inc()
+        resolver_token = route_resolver.set(partial(self.__route_template, scope))
+
+        async def send_and_record_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.__app(scope, receive, send_and_record_status)
+        finally:
+            route_resolver.reset(resolver_token)
+            requests_in_flight.dec()
+            labels = (scope["method"], self.__route_template(scope), str(status_code))
+            request_duration_seconds.labels(*labels).observe(time.perf_counter() - start)
+            requests_total.labels(*labels).inc()
\ No newline at end of file